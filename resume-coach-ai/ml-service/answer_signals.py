@@ -0,0 +1,125 @@
+"""
+Answer Structure Signals
+Finds the example, result, STAR and technical-term phrases evaluate_answer scores,
+with one phrase matcher over all signal lexicons.
+
+Every phrase of every lexicon is indexed at import time by its first word, so the
+answer is lowercased and tokenized once and each distinct word is looked up once,
+instead of one lowercase and one substring search of the whole answer per phrase.
+Phrases only match
+whole words: "did" no longer matches inside "candidate", "api" no longer matches
+inside "rapid". The last word of a phrase also matches its plain inflections
+("result" -> "results", "resulted"; "design" -> "designed", "designing"), which
+keeps the hits the old substring checks got from prefixes. Only whole tokens are
+compared, so the words of a phrase may be separated by whitespace or punctuation.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Signal class -> phrases. A phrase may be shared by several classes.
+SIGNAL_LEXICONS: Dict[str, Tuple[str, ...]] = {
+    "example": (
+        'example', 'instance', 'time when', 'project', 'situation',
+        'experience', 'worked on', 'developed', 'implemented'
+    ),
+    "result": (
+        'result', 'outcome', 'achieved', 'improved', 'increased',
+        'reduced', 'successful', 'delivered', 'completed'
+    ),
+    "technical": (
+        'algorithm', 'database', 'api', 'framework',
+        'architecture', 'design', 'code', 'testing',
+        'deployment', 'optimization', 'performance'
+    ),
+    # STAR method elements (the "result" element is the result class above)
+    "situation": ('situation', 'time when', 'faced', 'encountered'),
+    "task": ('task', 'goal', 'objective', 'needed to'),
+    "action": ('action', 'did', 'approach', 'implemented', 'decided'),
+}
+
+# Suffixes the last word of a phrase may carry and still match
+INFLECTIONS = ("", "s", "es", "d", "ed", "ing")
+
+# Words of an answer; phrases are compared token by token, so they only match whole words
+_TOKEN = re.compile(r"\w+")
+
+# ASCII characters outside \w, mapped to spaces: for ASCII text, translate + split gives
+# the same tokens as _TOKEN.findall without running the regex engine over every character
+_ASCII_NON_WORD = str.maketrans({
+    chr(code): " " for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased tokens of text, the same as re.findall(r"\\w+", text.lower())"""
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD).split()
+    return _TOKEN.findall(text)
+
+
+class PhraseMatcher:
+    """
+    Phrase lexicons indexed by first token. The answer is tokenized once and its
+    distinct tokens are looked up in the index: a one-word phrase matches on the
+    lookup itself, a multi-word phrase is confirmed at the positions of its first
+    token (only when all of its tokens occur somewhere in the answer). Each phrase
+    form maps back to its (class, phrase) pairs.
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self.classes = tuple(lexicons)
+        # first token -> {remaining tokens of the phrase form: owners}, () for one-word forms
+        self.index: Dict[str, Dict[Tuple[str, ...], List[Tuple[str, str]]]] = {}
+
+        for signal, phrases in lexicons.items():
+            for phrase in phrases:
+                words = phrase.lower().split()
+                for suffix in INFLECTIONS:
+                    form = words[:-1] + [words[-1] + suffix]
+                    owners = self.index.setdefault(form[0], {}).setdefault(tuple(form[1:]), [])
+                    if (signal, phrase) not in owners:
+                        owners.append((signal, phrase))
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Signal class -> set of matched phrases (by their lexicon form)"""
+        hits: Dict[str, Set[str]] = {signal: set() for signal in self.classes}
+        tokens = tokenize(text)
+        present = set(tokens)
+
+        for token in present & self.index.keys():
+            rests = self.index[token]
+            for signal, phrase in rests.get((), ()):
+                hits[signal].add(phrase)
+
+            # Multi-word forms whose tokens all occur; stop at the first position confirming each
+            pending = {
+                rest: owners for rest, owners in rests.items()
+                if rest and present.issuperset(rest)
+            }
+            position = -1
+            while pending:
+                try:
+                    position = tokens.index(token, position + 1)
+                except ValueError:
+                    break
+                for rest in list(pending):
+                    if tuple(tokens[position + 1:position + 1 + len(rest)]) == rest:
+                        for signal, phrase in pending.pop(rest):
+                            hits[signal].add(phrase)
+
+        return hits
+
+
+MATCHER = PhraseMatcher(SIGNAL_LEXICONS)
+
+
+def answer_signals(answer: str) -> Dict[str, Set[str]]:
+    """
+    Phrases of each signal class found in an answer.
+
+    Returns the set of matched phrases per class in SIGNAL_LEXICONS: bool() says
+    whether the class is present, len() how many distinct phrases were used.
+    """
+    return MATCHER.match(answer)
@@ -4,23 +4,43 @@ Exposes ML model predictions via REST API
 """
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
-import torch
+from fastapi.responses import JSONResponse, StreamingResponse
 from models import (
     PredictRequest, PredictResponse, HealthResponse, 
+    BatchPredictRequest, BatchPredictResponse, RankedPredictResponse,
     JobParseRequest, JobParseResponse, 
+    BatchJobParseRequest, BatchJobParseResponse,
+    JobSearchRequest, JobSearchResponse, StoredJobResponse,
     ATSOptimizeRequest, ATSOptimizeResponse,
+    BatchATSOptimizeRequest, BatchATSOptimizeResponse, RankedATSOptimizeResponse,
+    ATSSessionResponse, ATSSessionUpdateRequest,
     GenerateQuestionsRequest, GenerateQuestionsResponse,
     EvaluateAnswerRequest, EvaluateAnswerResponse,
-    InterviewScoreRequest, InterviewScoreResponse
+    BatchEvaluateAnswersRequest, BatchEvaluateAnswersResponse,
+    InterviewScoreRequest, InterviewScoreResponse,
+    InterviewSessionResponse, InterviewSessionAnswerResponse
 )
+import asyncio
 import logging
-from typing import List
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import re
 import job_parser
+import ingest_jobs
 import ats_optimizer
+from ats_sessions import ATSSessionStore, SessionNotFoundError
 import interview_evaluator
+from interview_sessions import (
+    InterviewSessionStore, InterviewSessionNotFoundError, InterviewSessionFullError,
+    restore_snapshot, save_snapshot, score_events
+)
+from batching import MicroBatcher
+from cache import ResponseCache, ModelWatcher, make_key
+from singleflight import SingleFlight
+from executors import EngineRegistry, EngineBusyError
+from metrics import registry
+import scorer as scorer_backends
+from skill_bitsets import common_skills_many
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,36 +65,77 @@ app.add_middleware(
 )
 
 # Global variables for model
-model = None
-tokenizer = None
-device = None
+scorer = None
+predict_batcher = None
+model_watcher = None
+
+# Blocking inference/NLP work runs in per-engine pools (see executors.py)
+engines = EngineRegistry.from_env()
+
+# Micro-batching for /predict-match: concurrent requests are collected for up to
+# PREDICT_BATCH_MAX_WAIT_MS (or until PREDICT_BATCH_MAX_SIZE are queued) and scored together
+PREDICT_BATCH_MAX_SIZE = int(os.getenv("PREDICT_BATCH_MAX_SIZE", "16"))
+PREDICT_BATCH_MAX_WAIT_MS = float(os.getenv("PREDICT_BATCH_MAX_WAIT_MS", "5"))
+
+# /predict-match/batch scores jobs in padded chunks of this size
+BATCH_SCORE_CHUNK_SIZE = int(os.getenv("BATCH_SCORE_CHUNK_SIZE", "32"))
+
+# /parse-job/batch never starts more spaCy processes than this
+PARSE_BATCH_MAX_PROCESSES = int(os.getenv("PARSE_BATCH_MAX_PROCESSES", str(os.cpu_count() or 1)))
+
+# Content-addressed response cache for /predict-match, /optimize-ats and /parse-job
+# (RESPONSE_CACHE_MAX_MB=0 disables it). The model directory is re-fingerprinted at
+# most every MODEL_CHECK_INTERVAL_S seconds and the cache is dropped when it changes.
+RESPONSE_CACHE_MAX_MB = float(os.getenv("RESPONSE_CACHE_MAX_MB", "64"))
+RESPONSE_CACHE_TTL_S = float(os.getenv("RESPONSE_CACHE_TTL_S", "3600"))
+MODEL_CHECK_INTERVAL_S = float(os.getenv("MODEL_CHECK_INTERVAL_S", "30"))
+
+response_cache = ResponseCache(
+    max_bytes=int(RESPONSE_CACHE_MAX_MB * 1024 * 1024),
+    ttl_s=RESPONSE_CACHE_TTL_S
+)
+
+# Identical concurrent requests share one in-flight computation
+single_flight = SingleFlight()
+
+# Incremental /optimize-ats/sessions state (held in this process, see ats_sessions.py)
+ats_sessions = ATSSessionStore()
 
-# Technical skills database
-TECHNICAL_SKILLS = [
-    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust',
-    'swift', 'kotlin', 'scala', 'r', 'php', 'sql', 'nosql', 'mongodb', 'postgresql',
-    'mysql', 'redis', 'react', 'angular', 'vue', 'node.js', 'express', 'django',
-    'flask', 'fastapi', 'spring', 'tensorflow', 'pytorch', 'keras', 'scikit-learn',
-    'pandas', 'numpy', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins',
-    'git', 'linux', 'html', 'css', 'rest', 'graphql', 'microservices', 'agile'
-]
+# Jobs parsed offline by ingest_jobs.py, range-indexed for /jobs/search ("" disables).
+# The store is reloaded when it is rewritten (checked every MODEL_CHECK_INTERVAL_S).
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", ingest_jobs.DEFAULT_OUTPUT)
+job_store = None
+
+# Server-side /interview/sessions state (see interview_sessions.py). Open score
+# streams get a keep-alive comment after INTERVIEW_STREAM_KEEPALIVE_S of silence.
+interview_sessions = InterviewSessionStore()
+INTERVIEW_STREAM_KEEPALIVE_S = float(os.getenv("INTERVIEW_STREAM_KEEPALIVE_S", "15"))
 
 
 @app.on_event("startup")
 async def load_model():
     """Load the trained model on startup"""
-    global model, tokenizer, device
+    global scorer, predict_batcher, model_watcher
     
     try:
-        logger.info("Loading trained model...")
-        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        logger.info(f"Using device: {device}")
+        logger.info(f"Loading trained model (backend: {scorer_backends.SCORER_BACKEND})...")
+        
+        scorer = scorer_backends.load_scorer()
         
-        model = DistilBertForSequenceClassification.from_pretrained('./models/resume_scorer')
-        tokenizer = DistilBertTokenizer.from_pretrained('./models/resume_scorer')
+        predict_batcher = MicroBatcher(
+            scorer.score_texts,
+            max_batch_size=PREDICT_BATCH_MAX_SIZE,
+            max_wait_ms=PREDICT_BATCH_MAX_WAIT_MS,
+            executor=engines["model"].executor,
+            name="predict"
+        )
+        predict_batcher.start()
         
-        model.to(device)
-        model.eval()
+        model_watcher = ModelWatcher(scorer_backends.MODEL_PATH, MODEL_CHECK_INTERVAL_S)
+        logger.info(f"Model fingerprint: {model_watcher.fingerprint}")
+        
+        # Corpus TF-IDF model for /optimize-ats (in-process engines share this copy)
+        ats_optimizer.load_tfidf_model()
         
         logger.info("✅ Model loaded successfully!")
         
@@ -83,23 +144,50 @@ async def load_model():
         raise
 
 
+@app.on_event("startup")
+async def load_job_store():
+    """Index the ingested job store (JOB_STORE_PATH) if there is one"""
+    global job_store
+    
+    if not JOB_STORE_PATH or not os.path.exists(JOB_STORE_PATH):
+        return
+    try:
+        job_store = ingest_jobs.StoredJobs(JOB_STORE_PATH, MODEL_CHECK_INTERVAL_S)
+        logger.info(f"Indexed {len(job_store)} stored jobs from {JOB_STORE_PATH}")
+    except Exception as e:
+        logger.warning(f"Could not load job store {JOB_STORE_PATH}: {str(e)}")
+
+
+@app.on_event("startup")
+async def restore_interview_sessions():
+    """Reload interview sessions saved at the last shutdown (INTERVIEW_SESSION_SNAPSHOT_PATH)"""
+    restore_snapshot(interview_sessions)
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down API...")
+    save_snapshot(interview_sessions)
+    if predict_batcher is not None:
+        await predict_batcher.stop()
+    engines.shutdown()
 
 
 def extract_keywords(resume: str, job: str) -> List[str]:
-    """Extract common technical keywords from resume and job description"""
-    resume_lower = resume.lower()
-    job_lower = job.lower()
-    
-    matched_keywords = []
-    for skill in TECHNICAL_SKILLS:
-        if skill in resume_lower and skill in job_lower:
-            matched_keywords.append(skill)
-    
-    return matched_keywords[:10]  # Return top 10
+    """
+    Extract skills mentioned in both resume and job description (word-bounded,
+    aliases resolved), in order of first mention in the job, lowercased
+    """
+    return extract_keywords_many(resume, [job])[0]
+
+
+def extract_keywords_many(resume: str, jobs: List[str]) -> List[List[str]]:
+    """extract_keywords for one resume against many jobs, as one skill-bitset AND over the jobs"""
+    return [
+        [skill.lower() for skill in shared][:10]  # Return top 10
+        for shared in common_skills_many(resume, jobs)
+    ]
 
 
 def get_recommendation(score: float) -> str:
@@ -126,6 +214,91 @@ def calculate_confidence(score: float) -> float:
     return round(confidence, 2)
 
 
+def model_version() -> str:
+    """Cache version for model outputs: backend plus fingerprint of the model files"""
+    if scorer is None or model_watcher is None:
+        return "unloaded"
+    return f"{scorer.backend}:{model_watcher.fingerprint}"
+
+
+async def cached_response(
+    endpoint: str,
+    version: str,
+    payload: Dict[str, Any],
+    compute: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Return the cached result for this endpoint/version/body, or compute and store it.
+    Concurrent misses for the same key are coalesced into one computation.
+    Only successful results are cached.
+    """
+    if model_watcher is not None and model_watcher.changed():
+        removed = response_cache.invalidate()
+        logger.info(f"Model changed on disk, dropped {removed} cached responses")
+    
+    key = make_key(endpoint, version, payload)
+    result = response_cache.get(key)
+    if result is not None:
+        return result
+    
+    async def compute_and_store():
+        result = await compute()
+        response_cache.set(key, result)
+        return result
+    
+    return await single_flight.do(key, compute_and_store, label=endpoint.replace("-", "_"))
+
+
+def numeric_bounds(min_salary: Optional[int], max_experience_years: Optional[int]) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+    """
+    Salary/experience filters as JobIndex bounds. A job passes min_salary when its
+    range reaches it (salary_max >= min_salary) and max_experience_years when its
+    minimum requirement is within it.
+    """
+    bounds = {}
+    if min_salary is not None:
+        bounds["salary_max"] = (min_salary, None)
+    if max_experience_years is not None:
+        bounds["experience_min"] = (None, max_experience_years)
+    return bounds
+
+
+def filter_jobs(request: BatchPredictRequest) -> List[int]:
+    """
+    Positions of the request's jobs that pass its salary/experience filters
+    (see numeric_bounds). Each job is parsed once and checked once: the jobs
+    only live for this request, so a sorted JobIndex over them would cost more
+    than the scan (stored jobs are indexed, see /jobs/search).
+    """
+    bounds = numeric_bounds(request.min_salary, request.max_experience_years)
+    if not bounds:
+        return list(range(len(request.job_descriptions)))
+    
+    kept = []
+    for idx, job in enumerate(request.job_descriptions):
+        fields = job_parser.extract_numeric_fields(job)
+        for field, (low, high) in bounds.items():
+            value = fields[field]
+            if value is None:
+                if not request.include_unspecified:
+                    break
+            elif (low is not None and value < low) or (high is not None and value > high):
+                break
+        else:
+            kept.append(idx)
+    return kept
+
+
+def build_prediction(resume_text: str, job_description: str, score: float, keywords: Optional[List[str]] = None) -> dict:
+    """Assemble the PredictResponse fields for a scored resume/job pair (keywords if already extracted)"""
+    return {
+        "match_score": round(score, 2),
+        "confidence": calculate_confidence(score),
+        "keywords_matched": keywords if keywords is not None else extract_keywords(resume_text, job_description),
+        "recommendation": get_recommendation(score)
+    }
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint"""
@@ -141,12 +314,27 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     return HealthResponse(
-        status="healthy" if model is not None else "unhealthy",
-        model_loaded=model is not None,
-        version="1.0.0"
+        status="healthy" if scorer is not None else "unhealthy",
+        model_loaded=scorer is not None,
+        version="1.0.0",
+        backend=scorer.backend if scorer is not None else None
     )
 
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """In-process metrics (batch sizes, queue wait times) for tuning"""
+    return registry.snapshot()
+
+
+@app.post("/cache/invalidate", tags=["Health"])
+async def invalidate_cache():
+    """Drop every cached response (e.g. after replacing the model)"""
+    removed = response_cache.invalidate()
+    logger.info(f"Response cache invalidated: {removed} entries removed")
+    return {"removed": removed, **response_cache.stats()}
+
+
 @app.post("/predict-match", response_model=PredictResponse, tags=["Prediction"])
 async def predict_match(request: PredictRequest):
     """
@@ -158,58 +346,107 @@ async def predict_match(request: PredictRequest):
     Returns:
         PredictResponse with match_score, confidence, keywords, and recommendation
     """
-    if model is None or tokenizer is None:
+    if scorer is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Model not loaded. Please check server logs."
         )
     
-    try:
+    async def compute():
         # Combine resume and job description
-        text = f"Resume: {request.resume_text} [SEP] Job: {request.job_description}"
+        text = scorer_backends.combine_texts(request.resume_text, request.job_description)
         
-        # Tokenize input
-        inputs = tokenizer(
-            text,
-            return_tensors='pt',
-            truncation=True,
-            max_length=512,
-            padding=True
+        # Get prediction (batched with concurrent requests)
+        async with engines["model"].admit():
+            score = await predict_batcher.submit(text)
+        
+        return build_prediction(request.resume_text, request.job_description, score)
+    
+    try:
+        prediction = await cached_response("predict-match", model_version(), request.model_dump(), compute)
+        
+        logger.info(
+            f"Prediction: {prediction['match_score']:.2f}, Confidence: {prediction['confidence']}, "
+            f"Keywords: {len(prediction['keywords_matched'])}"
         )
         
-        # Move to device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        return PredictResponse(**prediction)
         
-        # Get prediction
-        with torch.no_grad():
-            outputs = model(**inputs)
-            # Model outputs logits in range 0-1, scale to 0-100
-            score = outputs.logits.item() * 100
-            score = max(0, min(100, score))  # Clamp to 0-100
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error during prediction: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prediction failed: {str(e)}"
+        )
+
+
+@app.post("/predict-match/batch", response_model=BatchPredictResponse, tags=["Prediction"])
+async def predict_match_batch(request: BatchPredictRequest):
+    """
+    Score one resume against many job descriptions
+    
+    Args:
+        request: BatchPredictRequest with resume_text, job_descriptions and optional top_k
         
-        # Extract common keywords
-        keywords = extract_keywords(request.resume_text, request.job_description)
+    Returns:
+        BatchPredictResponse with predictions ranked by match score
+    """
+    if scorer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model not loaded. Please check server logs."
+        )
+    
+    try:
+        # Salary/experience filters run on the cheap field scan, before any model work
+        selected = await engines.run("nlp", filter_jobs, request)
+        jobs_filtered = len(request.job_descriptions) - len(selected)
+        if not selected:
+            logger.info(f"Batch prediction: all {jobs_filtered} jobs filtered out")
+            return BatchPredictResponse(results=[], total_jobs=0, jobs_filtered=jobs_filtered)
         
-        # Calculate confidence
-        confidence = calculate_confidence(score)
+        scored = await engines.run(
+            "model", scorer.score_resume_against_jobs,
+            request.resume_text, [request.job_descriptions[idx] for idx in selected], BATCH_SCORE_CHUNK_SIZE
+        )
+        scores = dict(zip(selected, scored))
         
-        # Get recommendation
-        recommendation = get_recommendation(score)
+        ranking = sorted(selected, key=lambda i: scores[i], reverse=True)
+        if request.top_k is not None:
+            ranking = ranking[:request.top_k]
         
-        logger.info(f"Prediction: {score:.2f}, Confidence: {confidence}, Keywords: {len(keywords)}")
+        keywords = extract_keywords_many(request.resume_text, [request.job_descriptions[idx] for idx in ranking])
+        results = [
+            RankedPredictResponse(
+                **build_prediction(request.resume_text, request.job_descriptions[idx], scores[idx], job_keywords),
+                job_index=idx,
+                rank=rank
+            )
+            for rank, (idx, job_keywords) in enumerate(zip(ranking, keywords), 1)
+        ]
         
-        return PredictResponse(
-            match_score=round(score, 2),
-            confidence=confidence,
-            keywords_matched=keywords,
-            recommendation=recommendation
+        logger.info(
+            f"Batch prediction: {len(scores)} jobs scored, {jobs_filtered} filtered, "
+            f"best={scores[ranking[0]]:.2f}, returned={len(results)}"
         )
         
+        return BatchPredictResponse(results=results, total_jobs=len(scores), jobs_filtered=jobs_filtered)
+        
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
-        logger.error(f"Error during prediction: {str(e)}")
+        logger.error(f"Error during batch prediction: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Prediction failed: {str(e)}"
+            detail=f"Batch prediction failed: {str(e)}"
         )
 
 
@@ -226,21 +463,34 @@ async def parse_job_description(request: JobParseRequest):
     """
     try:
         # Parse job description using NLP
-        result = job_parser.parse_job_description(request.job_description)
+        result = await cached_response(
+            "parse-job", app.version, request.model_dump(),
+            lambda: engines.run("nlp", job_parser.parse_job_description, request.job_description, request.mode)
+        )
         
         logger.info(f"Job parsing successful: {len(result['skills'])} skills found")
         
         return JobParseResponse(
             skills=result['skills'],
             experience_years=result['experience_years'],
+            experience_min=result['experience_min'],
+            experience_max=result['experience_max'],
             qualifications=result['qualifications'],
             salary=result['salary'],
+            salary_min=result['salary_min'],
+            salary_max=result['salary_max'],
             location=result['location'],
             entities=result['entities'],
             job_title=result['job_title'],
-            company=result['company']
+            company=result['company'],
+            field_sources=result['field_sources']
         )
         
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error parsing job description: {str(e)}")
         raise HTTPException(
@@ -249,6 +499,104 @@ async def parse_job_description(request: JobParseRequest):
         )
 
 
+@app.post("/parse-job/batch", response_model=BatchJobParseResponse, tags=["Job Parser"])
+async def parse_job_descriptions_batch(request: BatchJobParseRequest):
+    """
+    Parse many job descriptions in one call via spaCy nlp.pipe
+    
+    Args:
+        request: BatchJobParseRequest with job_descriptions, batch_size and n_process
+        
+    Returns:
+        BatchJobParseResponse with one parsed job per description, in request order
+    """
+    try:
+        # Jobs already parsed by /parse-job (or an earlier batch) come from the cache
+        keys = [
+            make_key(
+                "parse-job", app.version,
+                JobParseRequest.model_construct(job_description=text, mode=request.mode).model_dump()
+            )
+            for text in request.job_descriptions
+        ]
+        results = [response_cache.get(key) for key in keys]
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        
+        if missing:
+            parsed = await engines.run(
+                "nlp", job_parser.parse_job_descriptions,
+                [request.job_descriptions[idx] for idx in missing],
+                request.batch_size,
+                min(request.n_process, PARSE_BATCH_MAX_PROCESSES),
+                request.mode
+            )
+            for idx, result in zip(missing, parsed):
+                results[idx] = result
+                response_cache.set(keys[idx], result)
+        
+        logger.info(
+            f"Batch job parsing: {len(results)} jobs, {len(missing)} parsed, "
+            f"{len(results) - len(missing)} from cache"
+        )
+        
+        return BatchJobParseResponse(
+            results=[JobParseResponse(**result) for result in results],
+            total_jobs=len(results)
+        )
+        
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error during batch job parsing: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch job parsing failed: {str(e)}"
+        )
+
+
+@app.post("/jobs/search", response_model=JobSearchResponse, tags=["Job Parser"])
+async def search_stored_jobs(request: JobSearchRequest):
+    """
+    Filter the jobs parsed by ingest_jobs.py on salary and experience
+    
+    Args:
+        request: JobSearchRequest with the salary/experience filters and a limit
+        
+    Returns:
+        JobSearchResponse with the matching stored jobs, found through the
+        store's range index before any scoring
+    """
+    if job_store is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No job store loaded. Run ingest_jobs.py and set JOB_STORE_PATH."
+        )
+    
+    try:
+        matches = job_store.query(
+            include_missing=request.include_unspecified,
+            **numeric_bounds(request.min_salary, request.max_experience_years)
+        )
+        jobs = [
+            StoredJobResponse(job_id=identifier, **record)
+            for identifier, record in matches[:request.limit]
+        ]
+        
+        logger.info(f"Job search: {len(matches)} of {len(job_store)} stored jobs matched")
+        
+        return JobSearchResponse(jobs=jobs, total_matches=len(matches), stored_jobs=len(job_store))
+        
+    except Exception as e:
+        logger.error(f"Error searching stored jobs: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Job search failed: {str(e)}"
+        )
+
+
 @app.post("/optimize-ats", response_model=ATSOptimizeResponse, tags=["ATS Optimization"])
 async def optimize_ats(request: ATSOptimizeRequest):
     """
@@ -262,9 +610,13 @@ async def optimize_ats(request: ATSOptimizeRequest):
     """
     try:
         # Run ATS optimization analysis
-        result = ats_optimizer.optimize_ats(
-            request.resume_text,
-            request.job_description
+        result = await cached_response(
+            "optimize-ats", f"{app.version}:{ats_optimizer.tfidf_model_version()}", request.model_dump(),
+            lambda: engines.run(
+                "ats", ats_optimizer.optimize_ats,
+                request.resume_text,
+                request.job_description
+            )
         )
         
         logger.info(
@@ -284,6 +636,11 @@ async def optimize_ats(request: ATSOptimizeRequest):
             job_keyword_count=result['job_keyword_count']
         )
         
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error during ATS optimization: {str(e)}")
         raise HTTPException(
@@ -292,6 +649,140 @@ async def optimize_ats(request: ATSOptimizeRequest):
         )
 
 
+@app.post("/optimize-ats/batch", response_model=BatchATSOptimizeResponse, tags=["ATS Optimization"])
+async def optimize_ats_batch(request: BatchATSOptimizeRequest):
+    """
+    ATS analysis of one resume against many job descriptions
+    
+    Args:
+        request: BatchATSOptimizeRequest with resume_text, job_descriptions and optional top_k
+        
+    Returns:
+        BatchATSOptimizeResponse with analyses ranked by ATS score
+    """
+    try:
+        results = await engines.run(
+            "ats", ats_optimizer.optimize_ats_batch,
+            request.resume_text, request.job_descriptions, request.top_k
+        )
+        
+        logger.info(
+            f"Batch ATS optimization: {len(request.job_descriptions)} jobs analyzed, "
+            f"best={results[0]['ats_score']}, returned={len(results)}"
+        )
+        
+        return BatchATSOptimizeResponse(
+            results=[RankedATSOptimizeResponse(**result) for result in results],
+            total_jobs=len(request.job_descriptions)
+        )
+        
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error during batch ATS optimization: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch ATS optimization failed: {str(e)}"
+        )
+
+
+async def run_session(fn: Callable, *args) -> Any:
+    """
+    Run session work on the "ats" engine's threads. Sessions live in this
+    process, so a process-pool "ats" engine only limits admission.
+    """
+    engine = engines["ats"]
+    if engine.kind == "thread":
+        return await engine.run(fn, *args)
+    async with engine.admit():
+        return await asyncio.to_thread(fn, *args)
+
+
+@app.post("/optimize-ats/sessions", response_model=ATSSessionResponse, tags=["ATS Optimization"])
+async def create_ats_session(request: ATSOptimizeRequest):
+    """
+    Start an incremental ATS session: full analysis of the resume, plus a session
+    id for re-scoring later edits of it
+    
+    Args:
+        request: ATSOptimizeRequest with resume_text and job_description
+        
+    Returns:
+        ATSSessionResponse with the ATS analysis and session_id
+    """
+    try:
+        session_id, result = await run_session(
+            ats_sessions.create, request.resume_text, request.job_description
+        )
+        
+        logger.info(f"ATS session {session_id} started: Score={result['ats_score']}")
+        
+        return ATSSessionResponse(session_id=session_id, **result)
+        
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error starting ATS session: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"ATS session failed: {str(e)}"
+        )
+
+
+@app.put("/optimize-ats/sessions/{session_id}", response_model=ATSSessionResponse, tags=["ATS Optimization"])
+async def update_ats_session(session_id: str, request: ATSSessionUpdateRequest):
+    """
+    Re-score an edited resume. Only the changed part of the text is re-analyzed.
+    
+    Args:
+        session_id: Id returned by POST /optimize-ats/sessions
+        request: ATSSessionUpdateRequest with the full edited resume_text
+        
+    Returns:
+        ATSSessionResponse for the edited resume
+    """
+    try:
+        result = await run_session(ats_sessions.update, session_id, request.resume_text)
+        
+        logger.info(f"ATS session {session_id} updated: Score={result['ats_score']}")
+        
+        return ATSSessionResponse(session_id=session_id, **result)
+        
+    except SessionNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ATS session '{session_id}' not found or expired"
+        )
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error updating ATS session: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"ATS session update failed: {str(e)}"
+        )
+
+
+@app.delete("/optimize-ats/sessions/{session_id}", tags=["ATS Optimization"])
+async def delete_ats_session(session_id: str):
+    """End an ATS session"""
+    if not ats_sessions.delete(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ATS session '{session_id}' not found or expired"
+        )
+    return {"deleted": session_id}
+
+
 @app.post("/interview/generate-questions", response_model=GenerateQuestionsResponse, tags=["Interview Simulation"])
 async def generate_interview_questions(request: GenerateQuestionsRequest):
     """
@@ -310,7 +801,8 @@ async def generate_interview_questions(request: GenerateQuestionsRequest):
         questions = interview_evaluator.generate_interview_questions(
             job_description=request.job_description,
             job_role=request.job_role,
-            num_questions=request.num_questions
+            num_questions=request.num_questions,
+            seed=request.seed
         )
         
         logger.info(f"Successfully generated {len(questions)} interview questions")
@@ -343,7 +835,8 @@ async def evaluate_interview_answer(request: EvaluateAnswerRequest):
         logger.info(f"Evaluating answer for question: {request.question[:50]}...")
         
         # Evaluate answer using interview evaluator
-        evaluation = interview_evaluator.evaluate_answer(
+        evaluation = await engines.run(
+            "interview", interview_evaluator.evaluate_answer,
             question=request.question,
             answer=request.answer,
             category=request.category,
@@ -354,6 +847,11 @@ async def evaluate_interview_answer(request: EvaluateAnswerRequest):
         
         return EvaluateAnswerResponse(**evaluation)
         
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error evaluating interview answer: {str(e)}")
         raise HTTPException(
@@ -362,6 +860,168 @@ async def evaluate_interview_answer(request: EvaluateAnswerRequest):
         )
 
 
+@app.post("/interview/evaluate-answers", response_model=BatchEvaluateAnswersResponse, tags=["Interview Simulation"])
+async def evaluate_interview_answers(request: BatchEvaluateAnswersRequest):
+    """
+    Evaluate every answer of a mock interview and score the whole interview
+    
+    Args:
+        request: BatchEvaluateAnswersRequest with the interview's question/answer pairs
+        
+    Returns:
+        BatchEvaluateAnswersResponse with per-answer evaluations and the overall interview score
+    """
+    try:
+        logger.info(f"Evaluating {len(request.answers)} interview answers")
+        
+        # Sentiment for all answers runs as one batched model call
+        result = await engines.run(
+            "interview", interview_evaluator.evaluate_answers,
+            [item.model_dump() for item in request.answers]
+        )
+        
+        logger.info(
+            f"Interview evaluated: {result['interview_score']['overall_score']}/100, "
+            f"Grade={result['interview_score']['grade']}, Questions={len(result['evaluations'])}"
+        )
+        
+        return BatchEvaluateAnswersResponse(
+            evaluations=[EvaluateAnswerResponse(**evaluation) for evaluation in result['evaluations']],
+            interview_score=InterviewScoreResponse(**result['interview_score'])
+        )
+        
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error evaluating interview answers: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch answer evaluation failed: {str(e)}"
+        )
+
+
+def interview_session_not_found(session_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Interview session '{session_id}' not found or expired"
+    )
+
+
+@app.post("/interview/sessions", response_model=InterviewSessionResponse, tags=["Interview Simulation"])
+async def create_interview_session():
+    """
+    Start a server-side interview session. Answers are appended to it one at a
+    time and the interview score is kept up to date as they arrive.
+    
+    Returns:
+        InterviewSessionResponse with the session_id and an empty interview score
+    """
+    session = interview_sessions.create()
+    logger.info(f"Interview session {session.session_id} started")
+    return InterviewSessionResponse(
+        session_id=session.session_id,
+        interview_score=InterviewScoreResponse(**session.score())
+    )
+
+
+@app.post("/interview/sessions/{session_id}/answers", response_model=InterviewSessionAnswerResponse, tags=["Interview Simulation"])
+async def add_interview_session_answer(session_id: str, request: EvaluateAnswerRequest):
+    """
+    Evaluate an answer and append it to an interview session
+    
+    Args:
+        session_id: Id returned by POST /interview/sessions
+        request: EvaluateAnswerRequest with question, answer, category and difficulty
+        
+    Returns:
+        InterviewSessionAnswerResponse with the answer's evaluation and the updated interview score
+    """
+    try:
+        # Fail fast (and refresh the TTL) before spending time on the evaluation
+        interview_sessions.get(session_id)
+        
+        evaluation = await engines.run(
+            "interview", interview_evaluator.evaluate_answer,
+            request.question, request.answer, request.category, request.difficulty
+        )
+        interview_score = interview_sessions.add(session_id, evaluation, request.category)
+        
+        logger.info(
+            f"Interview session {session_id}: answer scored {evaluation['score']}/10, "
+            f"overall={interview_score['overall_score']}/100, Questions={interview_score['total_questions']}"
+        )
+        
+        return InterviewSessionAnswerResponse(
+            session_id=session_id,
+            evaluation=EvaluateAnswerResponse(**evaluation),
+            interview_score=InterviewScoreResponse(**interview_score)
+        )
+        
+    except InterviewSessionNotFoundError:
+        raise interview_session_not_found(session_id)
+    except InterviewSessionFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except EngineBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error adding interview session answer: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Answer evaluation failed: {str(e)}"
+        )
+
+
+@app.get("/interview/sessions/{session_id}", response_model=InterviewSessionResponse, tags=["Interview Simulation"])
+async def get_interview_session(session_id: str):
+    """Evaluated answers and running interview score of a session"""
+    try:
+        session = interview_sessions.get(session_id)
+    except InterviewSessionNotFoundError:
+        raise interview_session_not_found(session_id)
+    
+    return InterviewSessionResponse(
+        session_id=session_id,
+        evaluations=session.evaluations,
+        interview_score=InterviewScoreResponse(**session.score())
+    )
+
+
+@app.get("/interview/sessions/{session_id}/stream", tags=["Interview Simulation"])
+async def stream_interview_session(session_id: str):
+    """
+    Server-sent events with the running interview score: one "score" event now,
+    one after every appended answer, and an "end" event when the session is
+    deleted or expires
+    """
+    try:
+        session = interview_sessions.get(session_id)
+    except InterviewSessionNotFoundError:
+        raise interview_session_not_found(session_id)
+    
+    return StreamingResponse(
+        score_events(interview_sessions, session, INTERVIEW_STREAM_KEEPALIVE_S),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.delete("/interview/sessions/{session_id}", tags=["Interview Simulation"])
+async def delete_interview_session(session_id: str):
+    """End an interview session (open score streams receive an "end" event)"""
+    if not interview_sessions.delete(session_id):
+        raise interview_session_not_found(session_id)
+    return {"deleted": session_id}
+
+
 @app.post("/interview/calculate-score", response_model=InterviewScoreResponse, tags=["Interview Simulation"])
 async def calculate_interview_score(request: InterviewScoreRequest):
     """
@@ -5,25 +5,51 @@ Analyzes resume-job match for ATS compatibility and provides optimization sugges
 
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+import joblib
+import logging
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+import os
 import re
-from typing import Dict, List, Set, Any
-from collections import Counter
-import string
+import threading
+from typing import Dict, List, Set, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from functools import lru_cache
+import numpy as np
+import scipy.sparse as sp
 
-# Download required NLTK data (run once)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+from cache import ModelWatcher
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab', quiet=True)
+logger = logging.getLogger(__name__)
+
+# Corpus TF-IDF model written by fit_tfidf.py. When it exists, requests only call
+# transform(); without it every request fits a vectorizer on its own two documents.
+ATS_TFIDF_PATH = os.getenv("ATS_TFIDF_PATH", "./models/ats_tfidf.joblib")
+
+# The file is re-fingerprinted at most every MODEL_CHECK_INTERVAL_S seconds (0 = never)
+# and reloaded when fit_tfidf.py rewrites it; every process (including "ats" process-pool
+# workers) checks on its own
+ATS_TFIDF_CHECK_INTERVAL_S = float(os.getenv("MODEL_CHECK_INTERVAL_S", "30"))
+
+_tfidf_model = None
+_tfidf_model_loaded = False
+_tfidf_model_lock = threading.Lock()
+# Watches the loaded file (None when the vectorizer was set in code)
+_tfidf_watcher: Optional[ModelWatcher] = None
+# Identifies the vectorizer in use, so cached ATS responses never outlive it
+_tfidf_model_version = "per-request"
+_tfidf_model_sets = 0
+
+# Vocabulary cap of the vectorizer fitted per resume/job pair when there is no corpus model
+PAIR_MAX_FEATURES = 500
+
+# optimize_ats_batch keeps corpus-model vectors and keywords of recently seen jobs
+ATS_JOB_CACHE_SIZE = int(os.getenv("ATS_JOB_CACHE_SIZE", "4096"))
+
+_job_vectors: "OrderedDict[str, sp.csr_matrix]" = OrderedDict()
+_job_vectors_lock = threading.Lock()
 
+# Download required NLTK data (run once)
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
@@ -32,6 +58,37 @@ except LookupError:
 # Get English stopwords
 STOP_WORDS = set(stopwords.words('english'))
 
+# Keyword tokenizer: the alphabetic tokens NLTK word_tokenize (punkt + Treebank)
+# produced for preprocessed text, found by one compiled regex. A word must stand
+# between Treebank split points: whitespace, most punctuation, ',' or ':' not
+# followed by a digit, '--' and '..'. A clitic (n't, 's, 'll, ...) or trailing
+# quote and a sentence-final '.' are allowed after it and dropped; anything else
+# attached (hyphens, digits, '/', '.' inside a word) makes a token that is not
+# alphabetic, which the old filter discarded.
+_SPLIT_CHARS = r"\s;@#$%&?!*()\[\]{}<>\"`«»“”‘’„\u2012-\u2015"
+_TOKEN_RE = re.compile(
+    rf"(?:(?<![^{_SPLIT_CHARS},:])|(?<=--)|(?<=\.\.)|(?<=(?<!\w)'))"
+    r"([^\W\d_]+?)"
+    r"(?:n't|'(?:s|m|d|ll|re|ve)|')?\.?"
+    rf"(?=[{_SPLIT_CHARS}]|[,:](?!\d)|--|\.\.|$)"
+)
+
+# Words the Treebank tokenizer splits in two (CONTRACTIONS2)
+_SPLIT_WORDS = {
+    "cannot": ("can", "not"),
+    "gimme": ("gim", "me"),
+    "gonna": ("gon", "na"),
+    "gotta": ("got", "ta"),
+    "lemme": ("lem", "me"),
+    "wanna": ("wan", "na"),
+}
+
+# Words whose presence in the resume and job drives the section suggestions
+SECTION_TERMS = ('experience', 'education', 'degree', 'bachelor', 'master', 'skills', 'certification', 'certified')
+
+# Token streams of recently seen documents (keyword extraction and vectorizers share them)
+ATS_TOKEN_CACHE_SIZE = int(os.getenv("ATS_TOKEN_CACHE_SIZE", "4096"))
+
 
 def preprocess_text(text: str) -> str:
     """
@@ -55,25 +112,44 @@ def preprocess_text(text: str) -> str:
     return text.strip()
 
 
+def scan_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Keyword tokens of preprocessed text: alphabetic words longer than two
+    characters that are not stopwords, in document order.
+    """
+    tokens = []
+    for word in _TOKEN_RE.findall(text):
+        for token in _SPLIT_WORDS.get(word, (word,)):
+            if len(token) > 2 and token not in STOP_WORDS:
+                tokens.append(token)
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=ATS_TOKEN_CACHE_SIZE)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """
+    scan_tokens, cached per document, so a document is tokenized once for
+    keyword extraction and vectorization.
+    """
+    return scan_tokens(text)
+
+
+def analyze(text: str) -> List[str]:
+    """
+    TF-IDF analyzer over preprocessed text: the keyword tokens plus their bigrams.
+    Module-level so fitted vectorizers pickle with a reference to it.
+    """
+    tokens = tokenize(text)
+    return list(tokens) + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+
 def extract_keywords(text: str, top_n: int = 50) -> List[str]:
     """
-    Extract important keywords from text using TF-IDF.
+    Extract important keywords from text.
     Filters out stopwords and short words.
     """
-    # Preprocess
-    text = preprocess_text(text)
-    
-    # Tokenize
-    tokens = word_tokenize(text)
-    
-    # Filter: remove stopwords, punctuation, short words
-    filtered_tokens = [
-        token for token in tokens
-        if token not in STOP_WORDS
-        and token not in string.punctuation
-        and len(token) > 2
-        and token.isalpha()
-    ]
+    # Tokenize and filter: stopwords, punctuation, short words
+    filtered_tokens = tokenize(preprocess_text(text))
     
     # Get most common keywords
     counter = Counter(filtered_tokens)
@@ -82,20 +158,93 @@ def extract_keywords(text: str, top_n: int = 50) -> List[str]:
     return keywords
 
 
+def load_tfidf_model(path: Optional[str] = None):
+    """
+    The corpus vectorizer from fit_tfidf.py, loaded once per process and
+    reloaded when the file changes.
+    Returns None (per-request fitting) if the file does not exist.
+    """
+    global _tfidf_model, _tfidf_model_loaded, _tfidf_model_version, _tfidf_watcher
+    
+    if _tfidf_model_loaded:
+        if _tfidf_watcher is None or not _tfidf_watcher.changed():
+            return _tfidf_model
+        logger.info(f"ATS TF-IDF model changed on disk, reloading {_tfidf_watcher.path}")
+        with _tfidf_model_lock:
+            _tfidf_model_loaded = False
+        with _job_vectors_lock:
+            _job_vectors.clear()
+    
+    with _tfidf_model_lock:
+        if not _tfidf_model_loaded:
+            path = path or ATS_TFIDF_PATH
+            _tfidf_watcher = ModelWatcher(path, ATS_TFIDF_CHECK_INTERVAL_S)
+            if path and os.path.exists(path):
+                artifact = joblib.load(path)
+                _tfidf_model = artifact["vectorizer"]
+                _tfidf_model_version = _tfidf_watcher.fingerprint
+                logger.info(
+                    f"Loaded ATS TF-IDF model from {path} "
+                    f"({artifact['kind']}, {artifact['documents']} documents)"
+                )
+            else:
+                _tfidf_model = None
+                _tfidf_model_version = "per-request"
+                logger.warning(f"ATS TF-IDF model not found at {path}, fitting per request (run fit_tfidf.py)")
+            _tfidf_model_loaded = True
+    
+    return _tfidf_model
+
+
+def set_tfidf_model(vectorizer) -> None:
+    """Use this fitted vectorizer (None = fit per request) instead of loading ATS_TFIDF_PATH"""
+    global _tfidf_model, _tfidf_model_loaded, _tfidf_model_version, _tfidf_model_sets, _tfidf_watcher
+    with _tfidf_model_lock:
+        _tfidf_model = vectorizer
+        _tfidf_model_loaded = True
+        _tfidf_watcher = None
+        _tfidf_model_sets += 1
+        _tfidf_model_version = "per-request" if vectorizer is None else f"set-{_tfidf_model_sets}"
+    with _job_vectors_lock:
+        _job_vectors.clear()
+
+
+def tfidf_model_version() -> str:
+    """
+    Version of the vectorizer in use (the loaded file's fingerprint, "set-N" or
+    "per-request"); part of the response cache key for ATS results
+    """
+    load_tfidf_model()
+    return _tfidf_model_version
+
+
 def calculate_tfidf_similarity(resume_text: str, job_description: str) -> float:
     """
     Calculate TF-IDF cosine similarity between resume and job description.
+    Uses the corpus model (IDF from the whole job/resume corpus) when available.
     Returns a score between 0 and 1.
     """
     # Preprocess texts
     resume_clean = preprocess_text(resume_text)
     job_clean = preprocess_text(job_description)
     
+    vectorizer = load_tfidf_model()
+    if vectorizer is None:
+        return pair_tfidf_similarity(resume_clean, job_clean)
+    
+    vectors = vectorizer.transform([resume_clean, job_clean])
+    return float(cosine_similarity(vectors[0:1], vectors[1:2])[0][0])
+
+
+def pair_tfidf_similarity(resume_clean: str, job_clean: str) -> float:
+    """
+    TF-IDF similarity from a vectorizer fitted on just these two (preprocessed)
+    documents. Fallback when no corpus model has been fitted.
+    """
     # Create TF-IDF vectorizer
     vectorizer = TfidfVectorizer(
-        max_features=500,
-        stop_words='english',
-        ngram_range=(1, 2)  # Include bigrams
+        max_features=PAIR_MAX_FEATURES,
+        analyzer=analyze  # Keyword tokens and their bigrams
     )
     
     try:
@@ -111,6 +260,26 @@ def calculate_tfidf_similarity(resume_text: str, job_description: str) -> float:
         return 0.0
 
 
+def pair_similarity_from_counts(resume_counts: Counter, job_counts: Counter) -> float:
+    """
+    pair_tfidf_similarity from analyze() term counts, without fitting a vectorizer:
+    the same top PAIR_MAX_FEATURES terms, smooth IDF over the 2 documents, L2 norm
+    """
+    terms = sorted(resume_counts.keys() | job_counts.keys())
+    if not terms:
+        return 0.0
+    resume = np.array([resume_counts.get(term, 0) for term in terms], dtype=np.int64)
+    job = np.array([job_counts.get(term, 0) for term in terms], dtype=np.int64)
+    if len(terms) > PAIR_MAX_FEATURES:
+        # Same selection as CountVectorizer: alphabetical order, then argsort of -frequency
+        keep = np.sort((-(resume + job)).argsort()[:PAIR_MAX_FEATURES])
+        resume, job = resume[keep], job[keep]
+    idf = np.log(3 / (1 + (resume > 0) + (job > 0))) + 1
+    resume_weights, job_weights = resume * idf, job * idf
+    norm = np.linalg.norm(resume_weights) * np.linalg.norm(job_weights)
+    return float(resume_weights @ job_weights / norm) if norm else 0.0
+
+
 def calculate_keyword_match(resume_keywords: List[str], job_keywords: List[str]) -> float:
     """
     Calculate keyword match percentage.
@@ -145,6 +314,12 @@ def identify_missing_keywords(resume_keywords: List[str], job_keywords: List[str
     return list(missing)[:top_n]
 
 
+def section_mentions(text: str) -> Set[str]:
+    """SECTION_TERMS that occur in text (case-insensitive substring match)"""
+    text = text.lower()
+    return {term for term in SECTION_TERMS if term in text}
+
+
 def generate_suggestions(
     ats_score: float,
     keyword_match: float,
@@ -155,6 +330,28 @@ def generate_suggestions(
     """
     Generate actionable optimization suggestions based on analysis.
     """
+    return suggestions_from_mentions(
+        ats_score=ats_score,
+        keyword_match=keyword_match,
+        missing_keywords=missing_keywords,
+        resume_mentions=section_mentions(resume_text),
+        job_mentions=section_mentions(job_description),
+        resume_length=len(resume_text)
+    )
+
+
+def suggestions_from_mentions(
+    ats_score: float,
+    keyword_match: float,
+    missing_keywords: List[str],
+    resume_mentions: Set[str],
+    job_mentions: Set[str],
+    resume_length: int
+) -> List[str]:
+    """
+    generate_suggestions from the section_mentions of both texts and the resume
+    length instead of the texts themselves.
+    """
     suggestions = []
     
     # Score-based suggestions (ats_score is 0-100, not 0-1)
@@ -183,29 +380,26 @@ def generate_suggestions(
         suggestions.append(f"Consider adding these keywords: {', '.join(missing_keywords[:3])}")
     
     # Content-specific suggestions
-    resume_lower = resume_text.lower()
-    job_lower = job_description.lower()
-    
     # Check for experience mentions
-    if 'experience' in job_lower and 'experience' not in resume_lower:
+    if 'experience' in job_mentions and 'experience' not in resume_mentions:
         suggestions.append("Add an 'Experience' section if you have relevant work history.")
     
     # Check for education mentions
-    if any(word in job_lower for word in ['degree', 'bachelor', 'master', 'education']) and \
-       'education' not in resume_lower:
+    if any(word in job_mentions for word in ['degree', 'bachelor', 'master', 'education']) and \
+       'education' not in resume_mentions:
         suggestions.append("Include your education qualifications prominently.")
     
     # Check for skills section
-    if 'skills' in job_lower and 'skills' not in resume_lower:
+    if 'skills' in job_mentions and 'skills' not in resume_mentions:
         suggestions.append("Create a dedicated 'Skills' section listing technical and soft skills.")
     
     # Check for certifications
-    if 'certification' in job_lower or 'certified' in job_lower:
-        if 'certification' not in resume_lower and 'certified' not in resume_lower:
+    if 'certification' in job_mentions or 'certified' in job_mentions:
+        if 'certification' not in resume_mentions and 'certified' not in resume_mentions:
             suggestions.append("Add any relevant certifications if you have them.")
     
     # Format suggestions
-    if len(resume_text) < 500:
+    if resume_length < 500:
         suggestions.append("Resume seems too short. Expand descriptions to 1-2 pages for better ATS parsing.")
     
     # Action items
@@ -241,6 +435,25 @@ def optimize_ats(resume_text: str, job_description: str) -> Dict[str, Any]:
     # Calculate TF-IDF similarity
     tfidf_sim = calculate_tfidf_similarity(resume_text, job_description)
     
+    return build_analysis(
+        resume_keywords=resume_keywords,
+        job_keywords=job_keywords,
+        tfidf_sim=tfidf_sim,
+        resume_mentions=section_mentions(resume_text),
+        job_mentions=section_mentions(job_description),
+        resume_length=len(resume_text)
+    )
+
+
+def build_analysis(
+    resume_keywords: List[str],
+    job_keywords: List[str],
+    tfidf_sim: float,
+    resume_mentions: Set[str],
+    job_mentions: Set[str],
+    resume_length: int
+) -> Dict[str, Any]:
+    """optimize_ats result from the keywords, similarity and section mentions of both texts"""
     # Calculate keyword match
     keyword_match = calculate_keyword_match(resume_keywords, job_keywords)
     
@@ -257,12 +470,13 @@ def optimize_ats(resume_text: str, job_description: str) -> Dict[str, Any]:
     ats_score = round((tfidf_sim * 60) + (keyword_match * 0.4), 2)
     
     # Generate suggestions
-    suggestions = generate_suggestions(
+    suggestions = suggestions_from_mentions(
         ats_score=ats_score,
         keyword_match=keyword_match,
         missing_keywords=missing_keywords,
-        resume_text=resume_text,
-        job_description=job_description
+        resume_mentions=resume_mentions,
+        job_mentions=job_mentions,
+        resume_length=resume_length
     )
     
     return {
@@ -277,6 +491,119 @@ def optimize_ats(resume_text: str, job_description: str) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=ATS_JOB_CACHE_SIZE)
+def _job_keywords(job_description: str) -> Tuple[str, ...]:
+    return tuple(extract_keywords(job_description, top_n=100))
+
+
+def _tfidf_similarities(resume_clean: str, job_cleans: List[str]) -> np.ndarray:
+    """
+    TF-IDF similarity of the resume to each job, equal to calculate_tfidf_similarity
+    for every pair.
+    With the corpus model, job rows are cached and only unseen jobs are transformed
+    (in one call), and all similarities come from one sparse matrix-vector product.
+    Without it, each pair is scored as if a vectorizer were fitted on just that
+    resume and job (pair_tfidf_similarity), from term counts; the resume is
+    analyzed once.
+    """
+    vectorizer = load_tfidf_model()
+    if vectorizer is None:
+        resume_counts = Counter(analyze(resume_clean))
+        return np.array([
+            pair_similarity_from_counts(resume_counts, Counter(analyze(job_clean)))
+            for job_clean in job_cleans
+        ])
+    
+    with _job_vectors_lock:
+        cached = {text: _job_vectors[text] for text in job_cleans if text in _job_vectors}
+    missing = list(dict.fromkeys(text for text in job_cleans if text not in cached))
+    if missing:
+        rows = vectorizer.transform(missing).tocsr()
+        with _job_vectors_lock:
+            for idx, text in enumerate(missing):
+                cached[text] = _job_vectors[text] = rows[idx]
+                _job_vectors.move_to_end(text)
+            while len(_job_vectors) > ATS_JOB_CACHE_SIZE:
+                _job_vectors.popitem(last=False)
+    
+    # (jobs x terms) @ (terms x 1), rows L2-normalized -> cosine
+    resume_vector = vectorizer.transform([resume_clean]).tocsr()
+    job_matrix = sp.vstack([cached[text] for text in job_cleans], format="csr")
+    return np.asarray((job_matrix @ resume_vector.T).todense()).ravel()
+
+
+def optimize_ats_batch(resume_text: str, job_descriptions: List[str], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    ATS analysis of one resume against many jobs, ranked by ATS score.
+    
+    The resume is vectorized once. Similarities equal optimize_ats for each pair
+    (see _tfidf_similarities), and keyword matches come from one sparse
+    keyword-incidence matrix against the resume's keyword indicator vector.
+    
+    Returns:
+        optimize_ats results (best first, at most top_k) with job_index and rank added.
+        Matched/missing keywords are listed in order of importance in the job.
+    """
+    if not job_descriptions:
+        return []
+    
+    resume_clean = preprocess_text(resume_text)
+    job_cleans = [preprocess_text(job) for job in job_descriptions]
+    
+    similarities = np.clip(_tfidf_similarities(resume_clean, job_cleans), 0.0, 1.0)
+    
+    # Keywords: binary (jobs x vocabulary) matrix, columns in each job's importance order
+    resume_keywords = extract_keywords(resume_text, top_n=100)
+    job_keywords = [_job_keywords(job) for job in job_descriptions]
+    vocabulary: Dict[str, int] = {}
+    indices = [vocabulary.setdefault(word, len(vocabulary)) for words in job_keywords for word in words]
+    indptr = np.cumsum([0] + [len(words) for words in job_keywords])
+    indices = np.array(indices, dtype=np.int64)
+    
+    in_resume = np.zeros(len(vocabulary), dtype=bool)
+    in_resume[[vocabulary[word] for word in resume_keywords if word in vocabulary]] = True
+    
+    hits = in_resume[indices]
+    job_rows = np.repeat(np.arange(len(job_descriptions)), np.diff(indptr))
+    matched_counts = np.bincount(job_rows, weights=hits.astype(np.float64), minlength=len(job_descriptions))
+    job_counts = np.diff(indptr)
+    keyword_match = np.round(
+        np.divide(matched_counts * 100, job_counts, out=np.zeros(len(job_descriptions)), where=job_counts > 0), 2
+    )
+    ats_scores = np.round(similarities * 60 + keyword_match * 0.4, 2)
+    
+    ranking = sorted(range(len(job_descriptions)), key=lambda idx: ats_scores[idx], reverse=True)
+    if top_k is not None:
+        ranking = ranking[:top_k]
+    
+    words = np.array(list(vocabulary), dtype=object)
+    results = []
+    for rank, idx in enumerate(ranking, 1):
+        row = slice(indptr[idx], indptr[idx + 1])
+        row_words, row_hits = words[indices[row]], hits[row]
+        missing_keywords = row_words[~row_hits][:15].tolist()
+        results.append({
+            "ats_score": float(ats_scores[idx]),
+            "keyword_match_percentage": float(keyword_match[idx]),
+            "missing_keywords": missing_keywords,
+            "matched_keywords": row_words[row_hits][:20].tolist(),
+            "suggestions": generate_suggestions(
+                ats_score=float(ats_scores[idx]),
+                keyword_match=float(keyword_match[idx]),
+                missing_keywords=missing_keywords,
+                resume_text=resume_text,
+                job_description=job_descriptions[idx]
+            ),
+            "tfidf_similarity": round(float(similarities[idx]), 4),
+            "resume_keyword_count": len(resume_keywords),
+            "job_keyword_count": int(job_counts[idx]),
+            "job_index": idx,
+            "rank": rank
+        })
+    
+    return results
+
+
 if __name__ == "__main__":
     # Test with sample data
     sample_resume = """
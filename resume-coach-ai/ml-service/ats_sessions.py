@@ -0,0 +1,415 @@
+"""
+ATS Session Module
+Incremental ATS re-scoring for a resume that is edited a few words at a time
+against one job description.
+
+A session keeps the job's analysis (keywords, TF-IDF row, section mentions) and
+the resume's token stream and term counts. An update diffs the new resume text
+against the previous one, re-tokenizes only the whitespace-delimited chunks that
+changed, applies the resulting count deltas, and refreshes the similarity,
+keyword ranking and suggestions from them. Results equal optimize_ats on the
+full text; the Python-level work grows with the size of the edit, not of the
+resume (only C-level slicing and array copies touch the whole document).
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.pipeline import Pipeline
+
+import ats_optimizer
+from ats_optimizer import (
+    SECTION_TERMS, analyze, build_analysis, pair_similarity_from_counts, preprocess_text, scan_tokens
+)
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle for ATS_SESSION_TTL_S are dropped; beyond ATS_SESSION_MAX the
+# least recently used session is evicted
+ATS_SESSION_TTL_S = float(os.getenv("ATS_SESSION_TTL_S", "1800"))
+ATS_SESSION_MAX = int(os.getenv("ATS_SESSION_MAX", "1000"))
+
+# Same limit as optimize_ats
+KEYWORD_TOP_N = 100
+
+_CHUNK_RE = re.compile(r"\S+")
+
+
+def _joined(text: str, end: int) -> bool:
+    """
+    Whether preprocess_text can treat the chunk ending at `end` and the next one
+    as one: the '.' of its 'www.\\S+' URL pattern also matches a single
+    whitespace character other than a newline.
+    """
+    return (
+        3 <= end < len(text) - 1
+        and text[end] != "\n"
+        and not text[end + 1].isspace()
+        and text[end - 3:end].lower() == "www"
+    )
+
+
+def _group_start(text: str, pos: int) -> int:
+    """Nearest position at or before pos where the text can be preprocessed independently"""
+    while True:
+        while pos > 0 and not text[pos - 1].isspace():
+            pos -= 1
+        if pos >= 2 and not text[pos - 2].isspace() and _joined(text, pos - 1):
+            pos -= 1
+            continue
+        return pos
+
+
+def _group_end(text: str, pos: int) -> int:
+    """Nearest position at or after pos where the text can be preprocessed independently"""
+    while True:
+        while pos < len(text) and not text[pos].isspace():
+            pos += 1
+        if _joined(text, pos):
+            pos += 1
+            continue
+        return pos
+
+
+def _groups(text: str, start: int, end: int) -> Iterator[Tuple[int, str]]:
+    """(offset, text) of each independently preprocessable run of chunks in text[start:end]"""
+    group_start = group_end = None
+    for match in _CHUNK_RE.finditer(text, start, end):
+        if group_start is None:
+            group_start = match.start()
+        elif not _joined(text, group_end):
+            yield group_start, text[group_start:group_end]
+            group_start = match.start()
+        group_end = match.end()
+    if group_start is not None:
+        yield group_start, text[group_start:group_end]
+
+
+def _scan(text: str, start: int, end: int) -> Tuple[List[str], List[int]]:
+    """Keyword tokens of text[start:end] and the offset of the group each came from"""
+    tokens, offsets = [], []
+    for offset, group in _groups(text, start, end):
+        group_tokens = scan_tokens(preprocess_text(group))
+        tokens.extend(group_tokens)
+        offsets.extend([offset] * len(group_tokens))
+    return tokens, offsets
+
+
+def _changed_span(old: str, new: str) -> Tuple[int, int, int]:
+    """
+    (start, old_end, new_end): the smallest span covering the edit whose bounds
+    can be preprocessed independently in both texts; old[:start] == new[:start]
+    and the texts are equal after old_end / new_end.
+    """
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+
+    start = prefix
+    while True:
+        widened = min(_group_start(old, start), _group_start(new, start))
+        if widened == start:
+            break
+        start = widened
+
+    tail = suffix
+    while True:
+        widened = min(len(old) - _group_end(old, len(old) - tail), len(new) - _group_end(new, len(new) - tail))
+        if widened == tail:
+            break
+        tail = widened
+
+    return start, len(old) - tail, len(new) - tail
+
+
+def _common_prefix(a: str, b: str) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _term_counts(tokens: Sequence[str]) -> Counter:
+    """Unigram and bigram counts, as produced by ats_optimizer.analyze"""
+    return Counter(list(tokens) + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])])
+
+
+def _term_space(vectorizer) -> Optional[Tuple[Callable[[List[str]], List[Optional[int]]], np.ndarray]]:
+    """
+    (term -> column lookup, idf) of a corpus model whose TF-IDF row can be
+    updated term by term, or None (e.g. models fitted before ats_optimizer.analyze).
+    """
+    if isinstance(vectorizer, TfidfVectorizer):
+        if vectorizer.analyzer is not analyze or vectorizer.sublinear_tf or vectorizer.binary or vectorizer.norm != "l2":
+            return None
+        vocabulary = vectorizer.vocabulary_
+        return (lambda terms: [vocabulary.get(term) for term in terms]), vectorizer.idf_
+
+    if isinstance(vectorizer, Pipeline):
+        hashing, transformer = vectorizer.steps[0][1], vectorizer.steps[-1][1]
+        if (not isinstance(hashing, HashingVectorizer) or hashing.analyzer is not analyze
+                or hashing.alternate_sign or hashing.norm is not None or hashing.binary
+                or transformer.sublinear_tf or transformer.norm != "l2"):
+            return None
+        # The hasher HashingVectorizer applies to analyzer output
+        hasher = FeatureHasher(n_features=hashing.n_features, input_type="string", alternate_sign=False)
+
+        def columns(terms: List[str]) -> List[Optional[int]]:
+            if not terms:
+                return []
+            return hasher.transform([[term] for term in terms]).indices.tolist()
+
+        return columns, transformer.idf_
+
+    return None
+
+
+class ATSSession:
+    """
+    One resume being edited against one job. Not thread-safe on its own; the
+    ATSSessionStore serializes calls per session.
+    """
+
+    def __init__(self, resume_text: str, job_description: str, vectorizer=None):
+        # Job side, computed once
+        self.job_description = job_description
+        job_clean = preprocess_text(job_description)
+        self.job_keywords = ats_optimizer.extract_keywords(job_description, top_n=KEYWORD_TOP_N)
+        self.job_mentions = ats_optimizer.section_mentions(job_description)
+
+        self.vectorizer = vectorizer
+        self.space = _term_space(vectorizer) if vectorizer is not None else None
+        self.job_clean = job_clean
+        self.job_counts: Counter = Counter()
+        self.job_weights: Dict[int, float] = {}
+        if vectorizer is None:
+            self.job_counts = Counter(analyze(job_clean))
+        elif self.space is not None:
+            row = vectorizer.transform([job_clean]).tocsr()
+            self.job_weights = dict(zip(row.indices.tolist(), row.data.tolist()))
+        else:
+            logger.warning("ATS corpus model does not use ats_optimizer.analyze, session similarity is recomputed per edit")
+
+        self._reset(resume_text)
+
+    def _reset(self, resume_text: str) -> None:
+        """Build the resume state from scratch"""
+        self.resume_text = resume_text
+        tokens, offsets = _scan(resume_text, 0, len(resume_text))
+        self.tokens: List[str] = tokens
+        self.offsets = np.array(offsets, dtype=np.int64)
+        # Order labels of the tokens: rank keyword ties by first occurrence
+        # without renumbering every later token after an edit
+        self.labels: List[float] = [float(idx) for idx in range(len(tokens))]
+
+        self.counts: Counter = _term_counts(tokens)
+        self.mention_counts = Counter({term: resume_text.lower().count(term) for term in SECTION_TERMS})
+
+        # Keyword ranking: (-count, first occurrence label, token), like Counter.most_common
+        self.first: Dict[str, float] = {}
+        for token, label in zip(tokens, self.labels):
+            self.first.setdefault(token, label)
+        self.ranking = sorted((-self.counts[token], label, token) for token, label in self.first.items())
+
+        self.column_counts: Counter = Counter()
+        self.dot = self.sq = 0.0
+        if self.space is not None:
+            self._apply_columns(self.counts)
+
+    def _apply_columns(self, deltas: Dict[str, int]) -> None:
+        """Update the resume's TF-IDF column counts and its dot product / squared norm sums"""
+        columns_of, idf = self.space
+        terms = [term for term, delta in deltas.items() if delta]
+        for term, column in zip(terms, columns_of(terms)):
+            if column is None:
+                continue
+            old = self.column_counts[column]
+            new = old + deltas[term]
+            if new:
+                self.column_counts[column] = new
+            else:
+                del self.column_counts[column]
+            self.dot += (new - old) * idf[column] * self.job_weights.get(column, 0.0)
+            self.sq += (new * new - old * old) * idf[column] ** 2
+        if not self.column_counts:
+            # Drop accumulated rounding error
+            self.dot = self.sq = 0.0
+
+    def similarity(self) -> float:
+        if self.vectorizer is None:
+            return pair_similarity_from_counts(self.counts, self.job_counts)
+        if self.space is None:
+            vectors = self.vectorizer.transform([preprocess_text(self.resume_text), self.job_clean])
+            return float(cosine_similarity(vectors[0:1], vectors[1:2])[0][0])
+        return max(0.0, self.dot / math.sqrt(self.sq)) if self.sq > 1e-12 else 0.0
+
+    def analysis(self) -> Dict[str, Any]:
+        """optimize_ats result for the current resume text"""
+        return build_analysis(
+            resume_keywords=[token for _, _, token in self.ranking[:KEYWORD_TOP_N]],
+            job_keywords=self.job_keywords,
+            tfidf_sim=self.similarity(),
+            resume_mentions={term for term, count in self.mention_counts.items() if count},
+            job_mentions=self.job_mentions,
+            resume_length=len(self.resume_text)
+        )
+
+    def update(self, resume_text: str) -> Dict[str, Any]:
+        """Apply the edit that turns the current resume into resume_text and return the new analysis"""
+        old = self.resume_text
+        if resume_text == old:
+            return self.analysis()
+
+        start, old_end, new_end = _changed_span(old, resume_text)
+        lo = int(np.searchsorted(self.offsets, start, side="left"))
+        hi = int(np.searchsorted(self.offsets, old_end, side="left"))
+        new_tokens, new_offsets = _scan(resume_text, start, new_end)
+
+        # Term deltas: tokens of the span plus the bigrams touching it
+        left, right = self.tokens[max(lo - 1, 0):lo], self.tokens[hi:hi + 1]
+        deltas = _term_counts(left + new_tokens + right)
+        deltas.subtract(_term_counts(left + self.tokens[lo:hi] + right))
+
+        old_window, new_window = old[start:old_end].lower(), resume_text[start:new_end].lower()
+        for term in SECTION_TERMS:
+            self.mention_counts[term] += new_window.count(term) - old_window.count(term)
+
+        self.resume_text = resume_text
+        removed = self.tokens[lo:hi]
+        self.tokens[lo:hi] = new_tokens
+        self.offsets = np.concatenate([
+            self.offsets[:lo],
+            np.array(new_offsets, dtype=np.int64),
+            self.offsets[hi:] + (len(resume_text) - len(old))
+        ])
+        if not self._relabel_span(lo, hi, len(new_tokens)):
+            # Labels between the neighbours ran out of precision: rebuild
+            self._reset(resume_text)
+            return self.analysis()
+
+        self._update_ranking(set(removed) | set(new_tokens), deltas)
+        for term, delta in deltas.items():
+            if delta:
+                count = self.counts[term] + delta
+                if count:
+                    self.counts[term] = count
+                else:
+                    del self.counts[term]
+        if self.space is not None:
+            self._apply_columns(deltas)
+
+        return self.analysis()
+
+    def _relabel_span(self, lo: int, hi: int, inserted: int) -> bool:
+        """Give the tokens inserted at lo labels between their neighbours (False if none fit)"""
+        before = self.labels[lo - 1] if lo > 0 else None
+        after = self.labels[hi] if hi < len(self.labels) else None
+        if before is None and after is None:
+            labels = [float(idx) for idx in range(inserted)]
+        elif after is None:
+            labels = [before + idx + 1 for idx in range(inserted)]
+        elif before is None:
+            labels = [after - inserted + idx for idx in range(inserted)]
+        else:
+            step = (after - before) / (inserted + 1)
+            labels = [before + step * (idx + 1) for idx in range(inserted)]
+            if any(not a < b for a, b in zip([before] + labels, labels + [after])):
+                return False
+        self.labels[lo:hi] = labels
+        return True
+
+    def _update_ranking(self, tokens: set, deltas: Counter) -> None:
+        """Move the keyword ranking entries of tokens whose count or first occurrence changed"""
+        for token in tokens:
+            first = self.first.pop(token, None)
+            if first is not None:
+                key = (-self.counts[token], first, token)
+                del self.ranking[bisect_left(self.ranking, key)]
+            count = self.counts[token] + deltas[token]
+            if count > 0:
+                # Its first occurrence may have been removed or moved before the old one
+                label = self.labels[self.tokens.index(token)]
+                self.first[token] = label
+                insort(self.ranking, (-count, label, token))
+
+
+class SessionNotFoundError(KeyError):
+    """Raised for session ids that are unknown or have expired"""
+
+
+class ATSSessionStore:
+    """Thread-safe session map with LRU eviction and an idle TTL"""
+
+    def __init__(self, max_sessions: int = ATS_SESSION_MAX, ttl_s: float = ATS_SESSION_TTL_S):
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_s = ttl_s
+        # session id -> (session, lock, last used)
+        self._sessions: "OrderedDict[str, Tuple[ATSSession, threading.Lock, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            session_id, (_, _, used) = next(iter(self._sessions.items()))
+            if self.ttl_s <= 0 or now - used < self.ttl_s:
+                break
+            del self._sessions[session_id]
+
+    def create(self, resume_text: str, job_description: str) -> Tuple[str, Dict[str, Any]]:
+        """Start a session; returns its id and the full analysis"""
+        session = ATSSession(resume_text, job_description, ats_optimizer.load_tfidf_model())
+        result = session.analysis()
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._sessions[session_id] = (session, threading.Lock(), now)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id, result
+
+    def update(self, session_id: str, resume_text: str) -> Dict[str, Any]:
+        """Re-score a session's resume after an edit"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if session_id not in self._sessions:
+                raise SessionNotFoundError(session_id)
+            session, lock, _ = self._sessions[session_id]
+            self._sessions[session_id] = (session, lock, now)
+            self._sessions.move_to_end(session_id)
+        with lock:
+            return session.update(resume_text)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
@@ -0,0 +1,151 @@
+"""
+Dynamic Micro-Batching Module
+Collects concurrent requests for a short window (or until a batch is full)
+and runs them through the model in a single padded forward pass.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+QUEUE_WAIT_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+
+class MicroBatcher:
+    """
+    In-process batching scheduler.
+
+    Callers `await submit(item)` and get back their own result. A single worker
+    task drains the queue: it waits for the first item, keeps collecting until
+    `max_batch_size` items are queued or `max_wait_ms` has elapsed since the first
+    one arrived, then hands the whole list to `process_batch` in an executor.
+
+    `process_batch` must return one result per input item, in order.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+        name: str = "predict"
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.batch_size_hist = registry.histogram(
+            f"{name}_batch_size", BATCH_SIZE_BUCKETS,
+            "Number of requests per model forward pass"
+        )
+        self.queue_wait_hist = registry.histogram(
+            f"{name}_queue_wait_ms", QUEUE_WAIT_MS_BUCKETS,
+            "Time a request spent queued before its batch started (ms)"
+        )
+
+    def start(self) -> None:
+        """Start the worker task on the running event loop"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Micro-batcher '{self.name}' started "
+                f"(max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait * 1000:g})"
+            )
+
+    async def stop(self) -> None:
+        """Stop the worker and fail any requests still waiting"""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result"""
+        if self._worker is None:
+            raise RuntimeError(f"Batcher '{self.name}' is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        """Block for the first entry, then gather more until full or the window closes"""
+        batch = [await self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                # Window closed, but still take whatever is already queued
+                while len(batch) < self.max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._collect()
+
+            # Drop callers that gave up (e.g. client disconnected)
+            batch = [entry for entry in batch if not entry[1].cancelled()]
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            for _, _, enqueued in batch:
+                self.queue_wait_hist.observe((started - enqueued) * 1000)
+            self.batch_size_hist.observe(len(batch))
+
+            items = [entry[0] for entry in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, self.process_batch, items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"process_batch returned {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                logger.error(f"Batch of {len(items)} failed: {str(e)}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
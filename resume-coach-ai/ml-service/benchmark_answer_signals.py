@@ -0,0 +1,133 @@
+"""
+Answer Signal Matcher Benchmark
+Compares answer_signals (the answer lowercased and tokenized once, each distinct
+token looked up in a first-token phrase index) with the substring checks
+evaluate_answer used before (one `phrase in answer.lower()` scan per phrase) on generated answers of
+increasing length: how often the signals agree, which phrases only the
+substring checks found, and time per answer.
+
+The substring checks also match inside words ("did" in "candidate"), so some
+disagreement is expected; the listed phrases show where it comes from.
+
+Usage:
+    python benchmark_answer_signals.py
+    python benchmark_answer_signals.py --lengths 100 1000 5000 --samples 200
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from answer_signals import SIGNAL_LEXICONS, answer_signals
+
+# Sentences answers are built from; together they hit every signal class
+SENTENCES = [
+    "In my last project I worked on the payments API for a candidate screening platform.",
+    "There was a situation where the database performance degraded during peak traffic.",
+    "I faced a tight deadline and the goal was to ship the new architecture in six weeks.",
+    "My task was to redesign the caching layer so the team needed to change little code.",
+    "I decided to profile the queries first, then implemented an index and rewrote two endpoints.",
+    "As a result we reduced latency by 45% and the outage rate dropped to zero.",
+    "For example, the nightly batch job completed in 20 minutes instead of three hours.",
+    "I encountered resistance from another team, so I documented the approach and the trade-offs.",
+    "The testing framework we adopted improved deployment confidence across every service.",
+    "We delivered the migration on time and the customers noticed the faster dashboards.",
+    "I enjoy mentoring, and I helped a junior developer learn the codebase quickly.",
+    "Our objective was to make onboarding rapid, so I wrote a guide and recorded demos.",
+    "I did not have prior experience with Kafka, but I learned it in a week.",
+    "The algorithm was simple but the optimization of memory usage was the hard part.",
+    "Communication was the biggest lesson: I now share progress updates every day.",
+]
+
+
+def legacy_signals(answer: str):
+    """Signals as evaluate_answer computed them with substring checks"""
+    return {
+        signal: {phrase for phrase in phrases if phrase in answer.lower()}
+        for signal, phrases in SIGNAL_LEXICONS.items()
+    }
+
+
+def make_answers(num_words: int, samples: int, seed: int = 42):
+    """Answers of roughly num_words words, shuffled from SENTENCES"""
+    rng = random.Random(seed)
+    answers = []
+    for _ in range(samples):
+        words = []
+        while len(words) < num_words:
+            words.extend(rng.choice(SENTENCES).split())
+        answers.append(" ".join(words[:num_words]))
+    return answers
+
+
+def compare(answers):
+    """Per-class agreement on has-signal, plus phrases only one side found"""
+    agree = Counter()
+    only_legacy, only_matcher = Counter(), Counter()
+    for answer in answers:
+        old, new = legacy_signals(answer), answer_signals(answer)
+        for signal in SIGNAL_LEXICONS:
+            agree[signal] += bool(old[signal]) == bool(new[signal])
+            only_legacy.update(f"{signal}:{p}" for p in old[signal] - set(new[signal]))
+            only_matcher.update(f"{signal}:{p}" for p in set(new[signal]) - old[signal])
+    return agree, only_legacy, only_matcher
+
+
+def bench(func, answers, repeat):
+    """Best mean time per answer in microseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for answer in answers:
+            func(answer)
+        elapsed = (time.perf_counter() - start) * 1e6 / len(answers)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the answer signal matcher")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[50, 200, 1000, 5000],
+                        help="Answer lengths in words")
+    parser.add_argument("--samples", type=int, default=100, help="Answers per length")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Answer Signal Matcher Benchmark")
+    print("=" * 60)
+
+    print(f"\n⏱️  Time per answer ({args.samples} answers per length):")
+    print(f"  {'words':>6} {'substring':>12} {'matcher':>12} {'speedup':>8}")
+    all_answers = []
+    for length in args.lengths:
+        answers = make_answers(length, args.samples)
+        all_answers.extend(answers)
+        legacy = bench(legacy_signals, answers, args.repeat)
+        matcher = bench(answer_signals, answers, args.repeat)
+        print(f"  {length:>6} {legacy:9.1f} µs {matcher:9.1f} µs {legacy / matcher:7.1f}x")
+
+    agree, only_legacy, only_matcher = compare(all_answers)
+    print(f"\n🔍 Agreement on each signal over {len(all_answers)} answers:")
+    for signal in SIGNAL_LEXICONS:
+        print(f"  {signal:<10} {agree[signal] / len(all_answers) * 100:6.1f}%")
+
+    if only_legacy:
+        print("\n  Only matched by substring checks (inside other words):")
+        for phrase, count in only_legacy.most_common(10):
+            print(f"    {phrase:<24} {count} answers")
+    if only_matcher:
+        print("\n  Only matched by the phrase matcher:")
+        for phrase, count in only_matcher.most_common(10):
+            print(f"    {phrase:<24} {count} answers")
+
+    print("\n" + "=" * 60)
+    print(f"✅ Mean signal agreement: {np.mean([agree[s] for s in SIGNAL_LEXICONS]) / len(all_answers) * 100:.1f}%")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Structured Field Scanner Benchmark
+Compares the single-pass field scanner against the original per-field regex
+functions from job_parser (extract_experience / extract_salary /
+extract_qualifications) on long job postings, and reports where they differ.
+
+Usage:
+    python benchmark_field_scanner.py
+    python benchmark_field_scanner.py --postings 100 --sections 20 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+from field_scanner import scan_fields, experience_from_spans, salary_from_spans, qualifications_from_spans
+
+SECTIONS = [
+    "Requirements:\n- Bachelor's degree in Computer Science or related field\n- 5+ years of software development experience",
+    "Minimum 3 years building distributed systems. Master of Science preferred.",
+    "Salary: $120,000 - $150,000 per year plus equity.",
+    "Compensation: $90k-$110k depending on experience.",
+    "At least 2 years working with cloud platforms; AWS Certified is a plus.",
+    "We value 4 years of hands-on experience with Python and SQL.",
+    "PhD or equivalent research background in machine learning.",
+    "Our teams ship to millions of users across multiple systems every week.",
+    "3 to 5 years in a client-facing role. MBA welcome.",
+    "Benefits include health insurance, 401k matching and remote work.",
+]
+
+
+# Original implementations, kept verbatim for comparison
+
+def legacy_experience(text: str) -> Optional[str]:
+    """
+    Extract years of experience required using regex patterns.
+    Matches patterns like: "3+ years", "5-7 years", "minimum 2 years", etc.
+    """
+    patterns = [
+        r'(\d+)\+?\s*(?:to|\-)\s*(\d+)\s*years?',  # 3-5 years, 3 to 5 years
+        r'(\d+)\+\s*years?',  # 3+ years
+        r'minimum\s+(\d+)\s*years?',  # minimum 3 years
+        r'at least\s+(\d+)\s*years?',  # at least 3 years
+        r'(\d+)\s*years?.*experience',  # 3 years of experience
+    ]
+    
+    for pattern in patterns:
+        match = re.search(pattern, text.lower())
+        if match:
+            if len(match.groups()) == 2:
+                # Range found (e.g., 3-5 years)
+                return f"{match.group(1)}-{match.group(2)} years"
+            else:
+                # Single value found
+                return f"{match.group(1)}+ years"
+    
+    return None
+
+
+def legacy_qualifications(text: str) -> List[str]:
+    """
+    Extract education and qualification requirements.
+    Looks for degree levels, certifications, and specific qualifications.
+    """
+    qualifications = []
+    
+    # Common degree patterns
+    degree_patterns = [
+        r"bachelor'?s?\s+(?:degree)?(?:\s+in\s+[\w\s]+)?",
+        r"master'?s?\s+(?:degree)?(?:\s+in\s+[\w\s]+)?",
+        r"phd|doctorate|doctoral\s+(?:degree)?",
+        r"associate'?s?\s+(?:degree)?",
+        r"b\.?s\.?|m\.?s\.?|m\.?b\.?a\.?|ph\.?d\.?",
+        r"(?:bachelor|master|doctoral)\s+(?:of\s+)?(?:science|arts|engineering|business)",
+    ]
+    
+    text_lower = text.lower()
+    for pattern in degree_patterns:
+        matches = re.finditer(pattern, text_lower)
+        for match in matches:
+            qual = match.group(0).strip()
+            if qual and qual not in [q.lower() for q in qualifications]:
+                # Capitalize properly
+                qualifications.append(qual.title())
+    
+    # Look for certification mentions
+    if re.search(r'certification|certified', text_lower):
+        cert_match = re.search(r'([A-Z]{2,}(?:\s+[A-Z]{2,})*)\s+certified', text, re.IGNORECASE)
+        if cert_match:
+            qualifications.append(f"{cert_match.group(1)} Certified")
+    
+    return qualifications
+
+
+def legacy_salary(text: str) -> Optional[str]:
+    """
+    Extract salary information from text.
+    Matches patterns like: $80,000 - $100,000, $80k-$100k, etc.
+    """
+    # Salary range patterns
+    patterns = [
+        r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|\-)\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+year|annually|/year)?',
+        r'\$\s*(\d+)k?\s*(?:to|\-)\s*\$?\s*(\d+)k?\s*(?:per\s+year|annually|/year)?',
+    ]
+    
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0).strip()
+    
+    # Single salary value
+    single_pattern = r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+year|annually|/year)'
+    match = re.search(single_pattern, text, re.IGNORECASE)
+    if match:
+        return match.group(0).strip()
+    
+    return None
+
+
+def load_postings(num_postings: int, sections: int) -> List[str]:
+    """Long postings: dataset job descriptions interleaved with typical requirement sections"""
+    random.seed(42)
+    csv_path = 'data/training_dataset.csv'
+    jobs = []
+    if os.path.exists(csv_path):
+        jobs = pd.read_csv(csv_path)['job_description'].astype(str).tolist()
+    else:
+        print(f"⚠️  {csv_path} not found, using built-in sections only")
+
+    postings = []
+    for _ in range(num_postings):
+        parts = []
+        for _ in range(sections):
+            pool = jobs if jobs and random.random() < 0.5 else SECTIONS
+            parts.append(random.choice(pool))
+        postings.append("\n\n".join(parts))
+    return postings
+
+
+def legacy_fields(text: str):
+    return legacy_experience(text), legacy_salary(text), legacy_qualifications(text)
+
+
+def scanner_fields(text: str):
+    spans = scan_fields.__wrapped__(text)  # bypass the memo so every run does the work
+    return experience_from_spans(spans), salary_from_spans(spans), qualifications_from_spans(spans)
+
+
+def bench(label, fn, texts, repeat):
+    """Best-of-repeat wall time over all texts"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+
+    per_text_ms = best / len(texts) * 1000
+    print(f"  {label:<20} {best * 1000:9.1f} ms total  {per_text_ms:7.3f} ms/posting")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structured field extraction")
+    parser.add_argument("--postings", type=int, default=200, help="Number of postings")
+    parser.add_argument("--sections", type=int, default=15, help="Sections per posting")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Structured Field Scanner Benchmark")
+    print("=" * 60)
+
+    postings = load_postings(args.postings, args.sections)
+    avg_chars = sum(len(p) for p in postings) / len(postings)
+    print(f"\n{len(postings)} postings (avg {avg_chars:.0f} chars)")
+
+    print("\nAgreement with the original functions:")
+    for idx, field in enumerate(["experience_years", "salary", "qualifications"]):
+        same = sum(1 for p in postings if legacy_fields(p)[idx] == scanner_fields(p)[idx])
+        print(f"  {field:<20} {same}/{len(postings)}")
+
+    example = next((p for p in postings if legacy_fields(p)[2] != scanner_fields(p)[2]), None)
+    if example is not None:
+        print("\n  e.g. qualifications")
+        print(f"    original: {legacy_fields(example)[2]}")
+        print(f"    scanner:  {scanner_fields(example)[2]}")
+
+    print("\nTiming:")
+    baseline = bench("original functions", legacy_fields, postings, args.repeat)
+    scanner = bench("field scanner", scanner_fields, postings, args.repeat)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Speedup: {baseline / scanner:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
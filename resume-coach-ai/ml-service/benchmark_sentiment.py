@@ -0,0 +1,119 @@
+"""
+Sentiment Backend Benchmark
+Loads each SENTIMENT_BACKEND in a fresh process and reports load time, the
+memory the load added (peak RSS), per-answer latency one at a time and batched,
+and how often its labels agree with the fp32 transformer.
+
+Usage:
+    python benchmark_sentiment.py
+    python benchmark_sentiment.py --backends lexicon transformer-int8 --samples 256
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+import numpy as np
+
+import sentiment
+
+SAMPLE_ANSWERS = [
+    "I led the migration of our monolith to microservices and reduced deployment time by 60%.",
+    "Honestly I struggled with that project, the requirements were unclear and we missed the deadline.",
+    "I enjoy mentoring junior developers and I'm proud that two of them were promoted last year.",
+    "We had a production outage caused by a bad config change. I rolled it back and wrote a postmortem.",
+    "I haven't worked with Kubernetes directly, but I have used Docker Compose for local environments.",
+    "My manager and I disagreed on the rollout plan, so I gathered data and we agreed on a staged release.",
+    "The test suite was slow and flaky, which frustrated the whole team until we parallelized it.",
+    "I designed the caching layer, which cut API latency in half and saved about $4k a month.",
+    "I don't think the project was a failure, we learned a lot about our users.",
+    "It was not a great experience; the codebase was messy and the documentation was out of date.",
+    "I'm passionate about clean code and I always write tests before refactoring anything important.",
+    "I would start by clarifying the requirements, then sketch the data model and review it with the team.",
+]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(backend: str, answers, batch_size: int, repeat: int):
+    """Runs in a child process so every backend starts from the same baseline memory"""
+    before = _peak_rss_mb()
+    start = time.perf_counter()
+    try:
+        analyzer = sentiment.load_analyzer(backend)
+    except Exception as e:
+        return {"backend": backend, "error": str(e)}
+    load_s = time.perf_counter() - start
+    memory_mb = _peak_rss_mb() - before
+
+    if analyzer is None:
+        return {"backend": backend, "load_s": load_s, "memory_mb": memory_mb,
+                "single_ms": 0.0, "batched_ms": 0.0, "labels": ["neutral"] * len(answers)}
+
+    analyzer.labels(answers[:batch_size], batch_size=batch_size)  # warm-up
+
+    single = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for answer in answers:
+            analyzer.label(answer)
+        single.append((time.perf_counter() - start) * 1000 / len(answers))
+
+    batched = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        labels = analyzer.labels(answers, batch_size=batch_size)
+        batched.append((time.perf_counter() - start) * 1000 / len(answers))
+
+    return {"backend": backend, "load_s": load_s, "memory_mb": memory_mb,
+            "single_ms": min(single), "batched_ms": min(batched), "labels": labels}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sentiment backends")
+    parser.add_argument("--backends", nargs="+", default=[b for b in sentiment.BACKENDS if b != "none"],
+                        choices=sentiment.BACKENDS, help="Backends to measure")
+    parser.add_argument("--samples", type=int, default=96, help="Answers to label per run")
+    parser.add_argument("--batch-size", type=int, default=16, help="Answers per batched call")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Sentiment Backend Benchmark")
+    print("=" * 60)
+
+    answers = [SAMPLE_ANSWERS[i % len(SAMPLE_ANSWERS)] for i in range(args.samples)]
+    print(f"\n{len(answers)} answers, batch size {args.batch_size}")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in args.backends:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(measure, (backend, answers, args.batch_size, args.repeat)))
+
+    reference = next((r["labels"] for r in results if r["backend"] == "transformer" and "labels" in r), None)
+
+    print(f"\n  {'backend':<18} {'load':>8} {'memory':>9} {'single':>11} {'batched':>11} {'agree':>7}")
+    for r in results:
+        if "error" in r:
+            print(f"  {r['backend']:<18} ❌ {r['error'][:70]}")
+            continue
+        agree = "-"
+        if reference is not None:
+            agree = f"{np.mean([a == b for a, b in zip(r['labels'], reference)]) * 100:.0f}%"
+        print(f"  {r['backend']:<18} {r['load_s']:7.2f}s {r['memory_mb']:6.0f} MB "
+              f"{r['single_ms']:8.3f} ms {r['batched_ms']:8.3f} ms {agree:>7}")
+
+    print("\n" + "=" * 60)
+    print("✅ Latency is per answer; memory is the peak RSS the load added")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Skill Matching Microbenchmark
+Compares the precompiled SkillMatcher against the original per-skill regex loop
+from job_parser.extract_skills, and checks both return the same skills.
+
+Usage:
+    python benchmark_skill_matcher.py
+    python benchmark_skill_matcher.py --samples 500 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from skill_matcher import SkillMatcher
+
+SKILLS_DB_PATH = Path(__file__).parent / "skills_database.json"
+
+SAMPLE_JOB = """
+Senior Software Engineer at ABC Tech Company. 5+ years of experience in Python,
+JavaScript and cloud technologies. Strong proficiency in React, Node.js, C++ and C#.
+Experience with AWS, Docker, Kubernetes, PostgreSQL, MongoDB and CI/CD pipelines.
+Agile/Scrum, excellent communication and leadership skills. AWS Certified preferred.
+"""
+
+
+def load_skills():
+    """Same flattening as job_parser.SKILLS_DB"""
+    with open(SKILLS_DB_PATH, "r") as f:
+        skills_data = json.load(f)
+    skills = [skill for skills_list in skills_data.values() for skill in skills_list]
+    return sorted(set(skills), key=lambda x: len(x), reverse=True)
+
+
+def load_texts(num_samples):
+    """Job descriptions and resumes from the prepared dataset, or a synthetic sample"""
+    csv_path = 'data/training_dataset.csv'
+    if os.path.exists(csv_path):
+        df = pd.read_csv(csv_path).head(num_samples)
+        return df['job_description'].astype(str).tolist() + df['resume_text'].astype(str).tolist()
+
+    print(f"⚠️  {csv_path} not found, using a built-in sample job description")
+    return [SAMPLE_JOB] * num_samples
+
+
+def regex_loop(skills, text):
+    """The original implementation: one re.search per skill, list membership for dedup"""
+    text_lower = text.lower()
+    found_skills = []
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
+        if re.search(pattern, text_lower):
+            if skill not in found_skills:
+                found_skills.append(skill)
+    return found_skills
+
+
+def bench(label, fn, texts, repeat):
+    """Best-of-repeat wall time over all texts"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+
+    per_text_ms = best / len(texts) * 1000
+    print(f"  {label:<22} {best * 1000:9.1f} ms total  {per_text_ms:7.3f} ms/text")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction")
+    parser.add_argument("--samples", type=int, default=200, help="Rows of the dataset to use")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Skill Matching Benchmark")
+    print("=" * 60)
+
+    skills = load_skills()
+    texts = load_texts(args.samples)
+    avg_chars = sum(len(t) for t in texts) / len(texts)
+    print(f"\n{len(skills)} skills, {len(texts)} texts (avg {avg_chars:.0f} chars)")
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(skills)
+    print(f"Automaton built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    mismatches = sum(1 for text in texts if regex_loop(skills, text) != matcher.find_skills(text))
+    if mismatches:
+        print(f"⚠️  {mismatches} texts returned different skills")
+    else:
+        print("✅ Both implementations return identical skills")
+
+    print("\nTiming:")
+    baseline = bench("regex loop", lambda t: regex_loop(skills, t), texts, args.repeat)
+    compiled = bench("SkillMatcher", matcher.find_skills, texts, args.repeat)
+    bench("SkillMatcher (offsets)", matcher.find_all, texts, args.repeat)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Speedup: {baseline / compiled:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+ATS Tokenizer Equivalence Check and Benchmark
+Compares ats_optimizer.tokenize (one compiled regex) with the NLTK pipeline it
+replaced (word_tokenize, then keep alphabetic non-stopword tokens longer than
+two characters) on every resume/job text of the dataset plus edge cases, and
+times both. Exits with status 1 if any document tokenizes differently.
+
+Usage:
+    python benchmark_tokenizer.py
+    python benchmark_tokenizer.py --input data/training_dataset.csv --repeat 5
+"""
+
+import argparse
+import difflib
+import os
+import string
+import sys
+import time
+from typing import List
+
+import nltk
+import pandas as pd
+from nltk.tokenize import word_tokenize
+
+from ats_optimizer import STOP_WORDS, preprocess_text, scan_tokens, tokenize
+
+# Contractions, quotes, Treebank split rules and punctuation the regex has to mirror
+EDGE_CASES = [
+    "Bachelor's degree. We don't, can't and won't; cannot gonna wanna gotta lemme gimme",
+    "'quoted' words \"here\" and (parens) [brackets] {braces} <angles>",
+    "Node.js, CI/CD; C++ & C# @home #tag 50% $100 e.g. i.e. etc. inc. dr. smith",
+    "state-of-the-art -- dashes...ellipsis... wait... ok!? yes?! no.",
+    "python,3 a:b skills:python time: 10:30, 1,000 users",
+    "it's o'reilly rock'n'roll y'all the teams' goals",
+    "end.next word.) (see docs.) “smart” ‘quotes’ – en — em dash",
+    "Café naïve résumé façade Zürich",
+]
+
+TEXT_COLUMNS = ('resume_text', 'job_description', 'description')
+
+
+def legacy_tokenize(text: str) -> List[str]:
+    """The keyword filter ats_optimizer ran on NLTK word_tokenize output"""
+    return [
+        token for token in word_tokenize(text)
+        if token not in STOP_WORDS
+        and token not in string.punctuation
+        and len(token) > 2
+        and token.isalpha()
+    ]
+
+
+def load_texts(path: str) -> List[str]:
+    """Unique preprocessed documents of the dataset plus the edge cases"""
+    texts = list(EDGE_CASES)
+    if os.path.exists(path):
+        df = pd.read_csv(path)
+        for column in TEXT_COLUMNS:
+            if column in df.columns:
+                texts.extend(df[column].dropna().astype(str))
+    else:
+        print(f"⚠️  {path} not found, checking edge cases only")
+    return list(dict.fromkeys(preprocess_text(text) for text in texts))
+
+
+def check_equivalence(texts: List[str], show: int = 5) -> int:
+    """Number of documents whose token streams differ (first few are printed)"""
+    mismatches = 0
+    for text in texts:
+        expected, actual = legacy_tokenize(text), list(tokenize(text))
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= show:
+                diff = [line for line in difflib.ndiff(expected, actual) if line[:1] in "+-"]
+                print(f"  ❌ {text[:70]!r}")
+                print(f"     {diff[:10]}")
+    return mismatches
+
+
+def bench(label: str, func, texts: List[str], repeat: int) -> float:
+    """Best wall time of tokenizing every text `repeat` times"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    megabytes = sum(len(text) for text in texts) / 1e6
+    print(f"  {label:<18} {best * 1000:8.1f} ms  {len(texts) / best:9.0f} docs/s  {megabytes / best:6.2f} MB/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the ATS keyword tokenizer")
+    parser.add_argument("--input", default="data/training_dataset.csv", help="CSV with resume/job text columns")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per tokenizer (best is reported)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ATS Tokenizer Equivalence and Throughput")
+    print("=" * 60)
+
+    for resource, package in (('tokenizers/punkt', 'punkt'), ('tokenizers/punkt_tab', 'punkt_tab')):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+    texts = load_texts(args.input)
+    print(f"\n{len(texts)} unique documents")
+
+    print("\n🔍 Equivalence (regex vs word_tokenize + filter):")
+    mismatches = check_equivalence(texts)
+    if mismatches:
+        print(f"  ❌ {mismatches} of {len(texts)} documents differ")
+    else:
+        print(f"  ✅ Identical token streams for all {len(texts)} documents")
+
+    print("\n⏱️  Throughput (uncached):")
+    legacy = bench("word_tokenize", legacy_tokenize, texts, args.repeat)
+    regex = bench("regex", scan_tokens, texts, args.repeat)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Speedup: {legacy / regex:.1f}x")
+    print("=" * 60)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
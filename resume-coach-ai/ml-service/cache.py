@@ -0,0 +1,198 @@
+"""
+Response Cache Module
+Content-addressed cache for ML endpoint responses.
+Keys are a hash of the endpoint, the model/version and the normalized request
+body; entries are evicted least-recently-used once the byte budget is exceeded
+and expire after a TTL.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_payload(value: Any) -> Any:
+    """Strip surrounding whitespace from every string so trivially different bodies share a key"""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {k: normalize_payload(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_payload(v) for v in value]
+    return value
+
+
+def make_key(endpoint: str, version: str, payload: Dict[str, Any]) -> str:
+    """SHA-256 over endpoint, version and the canonical JSON of the normalized body"""
+    body = json.dumps(normalize_payload(payload), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256()
+    for part in (endpoint, version, body):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def model_fingerprint(path: str) -> str:
+    """
+    Short hash of the files under a model directory, or of a single model file
+    (relative path, size, mtime).
+    Changes whenever the model is retrained or re-exported.
+    """
+    digest = hashlib.sha256()
+    if not os.path.exists(path):
+        return "missing"
+
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            try:
+                stat = os.stat(full)
+            except OSError:
+                continue
+            digest.update(f"{os.path.relpath(full, path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+
+    return digest.hexdigest()[:16]
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache bounded by the approximate size of its values in bytes.
+
+    Values must be JSON-serializable; their size is the length of their JSON
+    encoding. A max_bytes or ttl_s of 0 disables the cache.
+    """
+
+    def __init__(self, max_bytes: int, ttl_s: float, name: str = "response_cache"):
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.name = name
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = registry.counter(f"{name}_hits", "Responses served from the cache")
+        self.misses = registry.counter(f"{name}_misses", "Cache lookups that had to compute the response")
+        self.evictions = registry.counter(f"{name}_evictions", "Entries evicted to stay under the byte budget")
+        self.expirations = registry.counter(f"{name}_expirations", "Entries dropped after their TTL")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl_s > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value (and mark it recently used), or None"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._drop(key)
+                self.expirations.inc()
+                entry = None
+
+            if entry is None:
+                self.misses.inc()
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits.inc()
+            return entry[2]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting least-recently-used entries past max_bytes"""
+        if not self.enabled:
+            return
+
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl_s, size, value)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions.inc()
+
+    def invalidate(self) -> int:
+        """Drop every entry; returns how many were removed"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = len(self._entries), self._bytes
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl_s": self.ttl_s,
+            "hits": self.hits.value,
+            "misses": self.misses.value
+        }
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+class ModelWatcher:
+    """
+    Re-fingerprints a model directory at most once per `interval_s` and reports
+    whether it changed since the last check, so the cache can be invalidated
+    without stat-ing the model files on every request.
+    """
+
+    def __init__(self, path: str, interval_s: float = 30.0):
+        self.path = path
+        self.interval_s = interval_s
+        self.fingerprint = model_fingerprint(path)
+        self._next_check = time.monotonic() + interval_s
+        self._lock = threading.Lock()
+
+    def changed(self) -> bool:
+        if self.interval_s <= 0:
+            return False
+
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+
+        with self._lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + self.interval_s
+
+            current = model_fingerprint(self.path)
+            if current == self.fingerprint:
+                return False
+
+            logger.warning(f"Model files under {self.path} changed ({self.fingerprint} -> {current})")
+            self.fingerprint = current
+            return True
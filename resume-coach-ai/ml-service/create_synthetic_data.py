@@ -7,6 +7,8 @@ import pandas as pd
 import numpy as np
 import os
 
+from skill_bitsets import SkillBitsets
+
 # Define job categories with their key skills
 JOB_CATEGORIES = {
     'Software Engineer': {
@@ -51,6 +53,9 @@ JOB_CATEGORIES = {
     }
 }
 
+# Every category skill gets an ID so resumes and jobs can be compared as bitsets
+CATEGORY_SKILLS = SkillBitsets(sorted({skill for info in JOB_CATEGORIES.values() for skill in info['skills']}))
+
 def generate_resume(category, match_level='high'):
     """Generate a synthetic resume"""
     cat_info = JOB_CATEGORIES[category]
@@ -111,17 +116,26 @@ def generate_job(category):
     
     return job, required_years, set(required_skills)
 
-def calculate_accurate_score(resume, job, resume_years, job_years, job_required_skills):
+def skill_match_ratios(resumes, job_skill_sets):
+    """
+    Share of each job's skills found in its paired resume, for every pair at once:
+    resumes and jobs are encoded into one bitset matrix each and compared row by row
+    """
+    resume_bits = CATEGORY_SKILLS.encode_many(
+        [idx for idx, skill in enumerate(CATEGORY_SKILLS.vocabulary) if skill in resume.lower()]
+        for resume in resumes
+    )
+    job_bits = CATEGORY_SKILLS.encode_many(
+        [CATEGORY_SKILLS.ids[skill] for skill in skills] for skills in job_skill_sets
+    )
+    _, ratios = CATEGORY_SKILLS.overlap_pairs(resume_bits, job_bits)
+    return ratios
+
+def calculate_accurate_score(resume, job, resume_years, job_years, skill_match_ratio, noise):
     """Calculate accurate match score based on clear rules"""
     resume_lower = resume.lower()
     
-    # 1. Skill match (50% weight)
-    resume_skills = set()
-    for skill in job_required_skills:
-        if skill in resume_lower:
-            resume_skills.add(skill)
-    
-    skill_match_ratio = len(resume_skills) / len(job_required_skills) if job_required_skills else 0
+    # 1. Skill match (50% weight): share of the job's skills found in the resume
     skill_score = skill_match_ratio * 50
     
     # 2. Experience match (30% weight)
@@ -144,7 +158,7 @@ def calculate_accurate_score(resume, job, resume_years, job_years, job_required_
     total_score = skill_score + exp_score + relevance_score
     
     # Add small random noise (±2 points)
-    total_score += np.random.uniform(-2, 2)
+    total_score += noise
     
     return round(np.clip(total_score, 0, 100), 2)
 
@@ -153,6 +167,9 @@ def create_synthetic_dataset(num_samples=2000):
     print("🔧 Creating synthetic dataset with accurate match scores...")
     
     data = []
+    # (resume, job, resume years, job years, job skills, noise) per row of data;
+    # scores are computed once every pair exists, so skills are encoded in one pass
+    pairs = []
     np.random.seed(42)
     
     categories = list(JOB_CATEGORIES.keys())
@@ -168,12 +185,11 @@ def create_synthetic_dataset(num_samples=2000):
         category = np.random.choice(categories)
         resume, resume_years = generate_resume(category, 'high')
         job, job_years, job_skills = generate_job(category)
-        score = calculate_accurate_score(resume, job, resume_years, job_years, job_skills)
+        pairs.append((resume, job, resume_years, job_years, job_skills, np.random.uniform(-2, 2)))
         
         data.append({
             'resume_text': resume,
             'job_description': job,
-            'match_score': score,
             'category': category,
             'match_level': 'high'
         })
@@ -187,12 +203,11 @@ def create_synthetic_dataset(num_samples=2000):
         category = np.random.choice(categories)
         resume, resume_years = generate_resume(category, 'medium')
         job, job_years, job_skills = generate_job(category)
-        score = calculate_accurate_score(resume, job, resume_years, job_years, job_skills)
+        pairs.append((resume, job, resume_years, job_years, job_skills, np.random.uniform(-2, 2)))
         
         data.append({
             'resume_text': resume,
             'job_description': job,
-            'match_score': score,
             'category': category,
             'match_level': 'medium'
         })
@@ -208,12 +223,11 @@ def create_synthetic_dataset(num_samples=2000):
         
         resume, resume_years = generate_resume(resume_category, 'low')
         job, job_years, job_skills = generate_job(job_category)
-        score = calculate_accurate_score(resume, job, resume_years, job_years, job_skills)
+        pairs.append((resume, job, resume_years, job_years, job_skills, np.random.uniform(-2, 2)))
         
         data.append({
             'resume_text': resume,
             'job_description': job,
-            'match_score': score,
             'category': f'{resume_category} -> {job_category}',
             'match_level': 'low'
         })
@@ -221,6 +235,10 @@ def create_synthetic_dataset(num_samples=2000):
         if (i + 1) % 100 == 0:
             print(f"  Generated {i + 1}/{low_count} low-match pairs...")
     
+    ratios = skill_match_ratios([pair[0] for pair in pairs], [pair[4] for pair in pairs])
+    for row, (resume, job, resume_years, job_years, _, noise), ratio in zip(data, pairs, ratios):
+        row['match_score'] = calculate_accurate_score(resume, job, resume_years, job_years, ratio, noise)
+    
     df = pd.DataFrame(data)
     
     # Save dataset
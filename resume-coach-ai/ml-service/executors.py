@@ -0,0 +1,132 @@
+"""
+Execution Engines Module
+Runs blocking CPU-bound work (model inference, spaCy, ATS analysis, sentiment)
+off the asyncio event loop, with a separate pool and concurrency limit per engine.
+
+Each engine is configured through environment variables:
+    EXECUTOR_<ENGINE>_KIND         "thread" or "process"
+    EXECUTOR_<ENGINE>_WORKERS      pool size
+    EXECUTOR_<ENGINE>_CONCURRENCY  max calls admitted at once (running + queued in the pool)
+EXECUTOR_QUEUE_TIMEOUT_S bounds how long a call waits for admission before
+EngineBusyError is raised.
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Engine name -> (kind, workers, concurrency)
+# "model" must stay in-process: the loaded weights live in this process only.
+ENGINE_DEFAULTS = {
+    "model": ("thread", 1, 64),
+    "nlp": ("thread", 2, 32),
+    "ats": ("thread", 2, 32),
+    "interview": ("thread", 1, 32),
+}
+THREAD_ONLY_ENGINES = {"model"}
+
+QUEUE_TIMEOUT_S = float(os.getenv("EXECUTOR_QUEUE_TIMEOUT_S", "30"))
+
+
+class EngineBusyError(RuntimeError):
+    """Raised when an engine's concurrency limit stays saturated past the queue timeout"""
+
+
+class Engine:
+    """A pool plus an admission semaphore for one kind of blocking work"""
+
+    def __init__(self, name: str, kind: str, workers: int, concurrency: int):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind for engine '{name}': {kind}")
+        if kind == "process" and name in THREAD_ONLY_ENGINES:
+            logger.warning(f"Engine '{name}' cannot use a process pool, falling back to threads")
+            kind = "thread"
+
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.concurrency = max(1, concurrency)
+        self.executor: Executor = (
+            ProcessPoolExecutor(max_workers=self.workers)
+            if kind == "process"
+            else ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"{name}-engine")
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.rejected = registry.counter(
+            f"engine_{name}_rejected",
+            f"Calls rejected because the '{name}' engine stayed saturated"
+        )
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the server's running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    @contextlib.asynccontextmanager
+    async def admit(self):
+        """Hold one of this engine's concurrency slots for the duration of the block"""
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), timeout=QUEUE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            self.rejected.inc()
+            raise EngineBusyError(f"Engine '{self.name}' is busy, try again later")
+
+        try:
+            yield
+        finally:
+            self.semaphore.release()
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) in this engine's pool and await the result"""
+        async with self.admit():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class EngineRegistry:
+    """All execution engines of the service, built from environment configuration"""
+
+    def __init__(self, engines: Dict[str, Engine]):
+        self.engines = engines
+
+    @classmethod
+    def from_env(cls) -> "EngineRegistry":
+        engines = {}
+        for name, (kind, workers, concurrency) in ENGINE_DEFAULTS.items():
+            prefix = f"EXECUTOR_{name.upper()}_"
+            engines[name] = Engine(
+                name,
+                kind=os.getenv(prefix + "KIND", kind).lower(),
+                workers=int(os.getenv(prefix + "WORKERS", workers)),
+                concurrency=int(os.getenv(prefix + "CONCURRENCY", concurrency))
+            )
+        return cls(engines)
+
+    def __getitem__(self, name: str) -> Engine:
+        return self.engines[name]
+
+    async def run(self, engine: str, fn: Callable, *args, **kwargs) -> Any:
+        return await self.engines[engine].run(fn, *args, **kwargs)
+
+    def describe(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {"kind": e.kind, "workers": e.workers, "concurrency": e.concurrency}
+            for name, e in self.engines.items()
+        }
+
+    def shutdown(self) -> None:
+        for engine in self.engines.values():
+            engine.shutdown()
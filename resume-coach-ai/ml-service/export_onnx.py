@@ -0,0 +1,140 @@
+"""
+Export the trained resume scorer to ONNX
+Writes an ONNX graph with dynamic batch and sequence axes so app.py can serve
+/predict-match from ONNX Runtime (SCORER_BACKEND=onnx) without importing torch.
+
+Usage:
+    python export_onnx.py
+    python export_onnx.py --optimize all --verify 32
+"""
+
+import argparse
+import inspect
+import os
+
+import torch
+from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
+
+from scorer import MODEL_PATH, MAX_SEQ_LENGTH, OnnxScorer, TorchScorer, compare_backends, load_holdout_texts
+
+
+def export(model_path: str, output_path: str, opset: int) -> None:
+    """Trace the model with a dummy pair and write the ONNX graph"""
+    print(f"\nLoading model from {model_path}...")
+    model = DistilBertForSequenceClassification.from_pretrained(model_path)
+    tokenizer = DistilBertTokenizer.from_pretrained(model_path)
+    model.eval()
+
+    dummy = tokenizer(
+        ["Resume: Python developer [SEP] Job: Python developer wanted"] * 2,
+        return_tensors='pt',
+        truncation=True,
+        max_length=MAX_SEQ_LENGTH,
+        padding=True
+    )
+
+    export_kwargs = {}
+    # Newer torch defaults to the dynamo exporter; dynamic_axes needs the TorchScript one
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+
+    print(f"Exporting to {output_path} (opset {opset})...")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            output_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"}
+            },
+            opset_version=opset,
+            do_constant_folding=True,
+            **export_kwargs
+        )
+
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"✅ Exported ONNX model ({size_mb:.1f} MB)")
+
+
+def optimize(input_path: str, output_path: str, level: str) -> None:
+    """Run ONNX Runtime graph optimizations offline and save the optimized graph"""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = getattr(
+        ort.GraphOptimizationLevel, OnnxScorer.GRAPH_OPTIMIZATION_LEVELS[level]
+    )
+    options.optimized_model_filepath = output_path
+
+    print(f"\nApplying '{level}' graph optimizations...")
+    ort.InferenceSession(input_path, options, providers=["CPUExecutionProvider"])
+
+    size_mb = os.path.getsize(output_path) / (1024 * 1024)
+    print(f"✅ Optimized model saved to {output_path} ({size_mb:.1f} MB)")
+
+
+def verify(model_path: str, onnx_path: str, num_samples: int) -> None:
+    """Compare ONNX Runtime scores against the PyTorch model on held-out rows"""
+    import scorer as scorer_backends
+
+    print(f"\nVerifying against PyTorch on {num_samples} held-out samples...")
+    torch_scorer = TorchScorer.load(model_path)
+
+    scorer_backends.ONNX_GRAPH_OPTIMIZATION = "disable"  # the graph is already optimized if requested
+    onnx_scorer = OnnxScorer.load(model_path, onnx_path)
+
+    texts, labels = load_holdout_texts(num_samples=num_samples)
+    report = compare_backends(torch_scorer, onnx_scorer, texts, labels)
+
+    for key, value in report.items():
+        print(f"  {key}: {value}")
+
+    if report["max_abs_drift"] > 0.5:
+        print("⚠️  ONNX scores drift by more than 0.5 points from PyTorch")
+    else:
+        print("✅ ONNX scores match PyTorch")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the resume scorer to ONNX")
+    parser.add_argument("--model-path", default=MODEL_PATH, help="Directory of the trained model")
+    parser.add_argument("--output", default=None, help="ONNX file to write (default: <model-path>/model.onnx)")
+    parser.add_argument("--opset", type=int, default=17, help="ONNX opset version")
+    parser.add_argument(
+        "--optimize",
+        choices=["none"] + list(OnnxScorer.GRAPH_OPTIMIZATION_LEVELS),
+        default="none",
+        help="Bake ONNX Runtime graph optimizations into the exported file"
+    )
+    parser.add_argument("--verify", type=int, default=0, metavar="N",
+                        help="Compare against PyTorch on N held-out samples")
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.join(args.model_path, "model.onnx")
+
+    print("=" * 60)
+    print("Resume Scorer ONNX Export")
+    print("=" * 60)
+
+    export(args.model_path, output_path, args.opset)
+
+    if args.optimize not in ("none", "disable"):
+        raw_path = output_path + ".raw"
+        os.replace(output_path, raw_path)
+        optimize(raw_path, output_path, args.optimize)
+        os.remove(raw_path)
+
+    if args.verify > 0:
+        verify(args.model_path, output_path, args.verify)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Serve it with: SCORER_BACKEND=onnx ONNX_MODEL_PATH={output_path} uvicorn app:app")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
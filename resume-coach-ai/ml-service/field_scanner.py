@@ -0,0 +1,199 @@
+"""
+Structured Field Scanner Module
+One precompiled pattern that walks a job description once and emits every
+structured span it recognizes (experience requirements, salary figures,
+degrees and certifications) with character offsets. job_parser derives its
+experience_years / salary / qualifications fields from these spans, along
+with their numeric bounds (salary_min/max, experience_min/max).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+_MONEY = r"\d{1,3}(?:,\d{3})*(?:\.\d{2})?"
+_PER_YEAR = r"(?:per\s+year|annually|/year)"
+_FIELD_OF_STUDY = r"(?:[ \t]+degree)?(?:[ \t]+in[ \t]+[a-z][a-z \t]*[a-z])?"
+_NAMED_DEGREE = r"\s+(?:of\s+)?(?:science|arts|engineering|business)\b"
+
+# The pattern opens with a plain character class holding the first character of
+# every span ("$", a digit, or the initial of a keyword), which lets the regex
+# engine skip everything else in C. Each branch then continues after that first
+# character, selected by a lookbehind on it. Degree and certification branches
+# also require the first character to start a word. Within a group, more
+# specific alternatives come first.
+FIELD_PATTERN = re.compile(
+    r"[$0-9AaBbCcDdMmPp]"
+    r"(?:"
+    # Salary
+    rf"(?<=\$)(?i:"
+    rf"(?P<salary_range>\s*{_MONEY}\s*(?:to|\-)\s*\$?\s*{_MONEY}\s*{_PER_YEAR}?)"
+    rf"|(?P<salary_range_k>\s*\d+k?\s*(?:to|\-)\s*\$?\s*\d+k?\s*{_PER_YEAR}?)"
+    rf"|(?P<salary_single>\s*{_MONEY}\s*{_PER_YEAR}))"
+    # Experience figures
+    r"|(?<=\d)(?i:"
+    r"(?P<exp_range>\d*\+?\s*(?:to|\-)\s*\d+\s*years?)"
+    r"|(?P<exp_plus>\d*\+\s*years?)"
+    r"|(?P<exp_mention>\d*\s*years?))"
+    # Experience keywords (matched anywhere, as the original patterns were)
+    r"|(?i:(?<=[Mm])(?P<exp_minimum>inimum\s+\d+\s*years?)"
+    r"|(?<=[Aa])(?P<exp_at_least>t least\s+\d+\s*years?))"
+    # Degree and certification keywords (must start a word)
+    r"|(?<!\w.)(?i:"
+    rf"(?<=[Mm])(?:(?P<degree_named_m>aster{_NAMED_DEGREE})"
+    rf"|(?P<degree_master>aster['’]?s?\b{_FIELD_OF_STUDY})"
+    r"|(?P<degree_abbrev_m>(?:\.?b\.?a|\.?s)\b\.?))"
+    r"|(?<=[Aa])(?P<degree_associate>ssociate['’]?s?[ \t]+degree\b)"
+    rf"|(?<=[Bb])(?:(?P<degree_named_b>achelor{_NAMED_DEGREE})"
+    rf"|(?P<degree_bachelor>achelor['’]?s?\b{_FIELD_OF_STUDY})"
+    r"|(?P<degree_abbrev_b>\.?s\b\.?))"
+    rf"|(?<=[Dd])(?:(?P<degree_named_d>octoral{_NAMED_DEGREE})"
+    r"|(?P<degree_doctorate>(?:octorate|octoral(?:[ \t]+degree)?)\b))"
+    r"|(?<=[Pp])(?P<degree_abbrev_p>h\.?d\b\.?)"
+    r"|(?<=[Cc])(?P<certification>ertified\b))"
+    r")"
+)
+
+# A plain "N years" only counts when "experience" follows on the same line
+_EXPERIENCE_WORD = re.compile(r"experience", re.IGNORECASE)
+# Certification name: capitalized words right before "certified" (e.g. "AWS Certified")
+_CERT_NAME = re.compile(r"(?<![\w+])([A-Z][\w+]*(?:[ \t]+[A-Z][\w+]*){0,3})[ \t]+$")
+_CERT_WINDOW = 80
+_NUMBER = re.compile(r"\d[\d,]*(?:\.\d{2})?")
+# Amount with an optional thousands suffix, for normalizing salary spans
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)([kK]?)")
+
+# Branch group name -> (kind, label)
+BRANCHES: Dict[str, Tuple[str, str]] = {
+    "salary_range": ("salary", "range"),
+    "salary_range_k": ("salary", "range_k"),
+    "salary_single": ("salary", "single"),
+    "exp_range": ("experience", "range"),
+    "exp_plus": ("experience", "plus"),
+    "exp_minimum": ("experience", "minimum"),
+    "exp_at_least": ("experience", "at_least"),
+    "exp_mention": ("experience", "mention"),
+    "degree_named_b": ("degree", "named"),
+    "degree_named_m": ("degree", "named"),
+    "degree_named_d": ("degree", "named"),
+    "degree_bachelor": ("degree", "bachelor"),
+    "degree_master": ("degree", "master"),
+    "degree_doctorate": ("degree", "doctorate"),
+    "degree_associate": ("degree", "associate"),
+    "degree_abbrev_b": ("degree", "abbreviation"),
+    "degree_abbrev_m": ("degree", "abbreviation"),
+    "degree_abbrev_p": ("degree", "abbreviation"),
+    "certification": ("certification", "named"),
+}
+
+# When several spans of a kind are found, the lowest-ranked label wins (then the earliest)
+EXPERIENCE_PRIORITY = ("range", "plus", "minimum", "at_least", "mention")
+SALARY_PRIORITY = ("range", "range_k", "single")
+
+
+class FieldSpan(NamedTuple):
+    """One structured span; start/end are character offsets into the scanned text"""
+    kind: str                 # experience | salary | degree | certification
+    label: str                # which pattern matched (see BRANCHES)
+    text: str
+    start: int
+    end: int
+    values: Tuple[str, ...]   # captured numbers or names, e.g. ("3", "5") for "3-5 years", ("120k", "150k") for "$120k-$150k"
+
+
+@lru_cache(maxsize=256)
+def scan_fields(text: str) -> Tuple[FieldSpan, ...]:
+    """Every structured span in text, in order of position (memoized per text)"""
+    spans = []
+    for match in FIELD_PATTERN.finditer(text):
+        kind, label = BRANCHES[match.lastgroup]
+        start, end = match.start(), match.end()
+
+        if label == "mention":
+            line_end = text.find("\n", end)
+            if not _EXPERIENCE_WORD.search(text, end, line_end if line_end != -1 else len(text)):
+                continue
+
+        if kind == "certification":
+            name = _CERT_NAME.search(text, max(0, start - _CERT_WINDOW), start)
+            if name is None:
+                continue
+            start, values = name.start(), (name.group(1),)
+        elif kind == "salary":
+            # Keep "k" suffixes, including one just past the span ("$90-110k" matches as "$90-110")
+            amounts = _AMOUNT.findall(text, start, end + 1)
+            values = tuple(number + suffix.lower() for number, suffix in amounts)
+        else:
+            values = tuple(_NUMBER.findall(match.group(0)))
+
+        raw = text[start:end]
+        value = raw.rstrip()
+        spans.append(FieldSpan(kind, label, value, start, start + len(value), values))
+    return tuple(spans)
+
+
+def _best(spans: Tuple[FieldSpan, ...], kind: str, priority: Tuple[str, ...]) -> Optional[FieldSpan]:
+    candidates = [span for span in spans if span.kind == kind]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda span: (priority.index(span.label), span.start))
+
+
+def experience_from_spans(spans: Tuple[FieldSpan, ...]) -> Optional[str]:
+    """"3-5 years" for a range, "N+ years" for any single requirement"""
+    span = _best(spans, "experience", EXPERIENCE_PRIORITY)
+    if span is None:
+        return None
+    if span.label == "range":
+        return f"{span.values[0]}-{span.values[1]} years"
+    return f"{span.values[0]}+ years"
+
+
+def experience_bounds_from_spans(spans: Tuple[FieldSpan, ...]) -> Tuple[Optional[int], Optional[int]]:
+    """(min, max) years; max is None for open-ended requirements ("5+ years", "minimum 2 years")"""
+    span = _best(spans, "experience", EXPERIENCE_PRIORITY)
+    if span is None:
+        return None, None
+    years = [int(value.replace(",", "")) for value in span.values]
+    if span.label == "range":
+        return min(years[:2]), max(years[:2])
+    return years[0], None
+
+
+def salary_from_spans(spans: Tuple[FieldSpan, ...]) -> Optional[str]:
+    """Salary text as written, ranges preferred over single figures"""
+    span = _best(spans, "salary", SALARY_PRIORITY)
+    return span.text if span is not None else None
+
+
+def salary_bounds_from_spans(spans: Tuple[FieldSpan, ...]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    (min, max) salary in whole currency units, e.g. (120000, 150000) for both
+    "$120,000 - $150,000" and "$120k-$150k"; a single figure gives min == max.
+    """
+    span = _best(spans, "salary", SALARY_PRIORITY)
+    if span is None:
+        return None, None
+    amounts = [(float(value.rstrip("k").replace(",", "")), value.endswith("k")) for value in span.values]
+    if any(suffix for _, suffix in amounts):
+        # "$120-150k": a "k" on either figure applies to both unless one is already in full
+        amounts = [(value * 1000 if suffix or value < 1000 else value, suffix) for value, suffix in amounts]
+    values = [int(round(value)) for value, _ in amounts[:2]]
+    return min(values), max(values)
+
+
+def qualifications_from_spans(spans: Tuple[FieldSpan, ...]) -> List[str]:
+    """Degrees (title-cased) then certifications, de-duplicated case-insensitively"""
+    qualifications, seen = [], set()
+    for span in spans:
+        if span.kind == "degree":
+            value = span.text.title()
+        elif span.kind == "certification":
+            value = f"{span.values[0]} Certified"
+        else:
+            continue
+        if value.lower() not in seen:
+            seen.add(value.lower())
+            qualifications.append(value)
+    # Degrees first, as before; order within each group follows the text
+    return sorted(qualifications, key=lambda q: q.endswith(" Certified"))
@@ -0,0 +1,120 @@
+"""
+Fit the ATS TF-IDF model offline
+Fits a TF-IDF vectorizer on the job and resume corpus and saves it, so
+ats_optimizer only calls transform() at request time and IDF weights come from
+the whole corpus instead of the two documents of a request.
+
+Two variants:
+    tfidf    TfidfVectorizer with a learned vocabulary (capped at --max-features)
+    hashing  HashingVectorizer + TfidfTransformer: fixed memory (--n-features
+             columns), no vocabulary to store, IDF precomputed on the corpus
+
+Usage:
+    python fit_tfidf.py
+    python fit_tfidf.py --input data/training_dataset.csv ../backend/database/populate_jobs.sql
+    python fit_tfidf.py --kind hashing --n-features 262144
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime, timezone
+from typing import List
+
+import joblib
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import make_pipeline
+
+from ats_optimizer import ATS_TFIDF_PATH, analyze, preprocess_text
+
+# Text columns read from CSV inputs
+TEXT_COLUMNS = ('resume_text', 'job_description', 'description')
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    """Unique preprocessed documents from CSV files and jobs SQL dumps"""
+    documents = []
+    for path in paths:
+        if path.lower().endswith('.sql'):
+            # Imported here: ingest_jobs loads the spaCy pipeline
+            from ingest_jobs import job_text, read_jobs
+            texts = [job_text(row) for row in read_jobs(path)]
+        else:
+            df = pd.read_csv(path)
+            columns = [column for column in TEXT_COLUMNS if column in df.columns]
+            texts = [text for column in columns for text in df[column].dropna().astype(str)]
+        print(f"  {path}: {len(texts)} texts")
+        documents.extend(texts)
+
+    # Repeated job descriptions would otherwise skew document frequencies
+    return list(dict.fromkeys(preprocess_text(text) for text in documents))
+
+
+def build_vectorizer(kind: str, max_features: int, n_features: int, min_df: int):
+    """Unfitted vectorizer over ats_optimizer's keyword tokens and bigrams (same analyzer as requests)"""
+    if kind == 'hashing':
+        return make_pipeline(
+            HashingVectorizer(
+                n_features=n_features,
+                alternate_sign=False,
+                norm=None,
+                analyzer=analyze
+            ),
+            TfidfTransformer()
+        )
+    return TfidfVectorizer(
+        max_features=max_features,
+        min_df=min_df,
+        analyzer=analyze
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit the ATS TF-IDF model on the job/resume corpus")
+    parser.add_argument("--input", nargs="+", default=["data/training_dataset.csv"],
+                        help="CSV files (resume_text/job_description/description columns) or jobs SQL dumps")
+    parser.add_argument("--output", default=ATS_TFIDF_PATH, help="Model file to write (ATS_TFIDF_PATH)")
+    parser.add_argument("--kind", choices=["tfidf", "hashing"], default="tfidf", help="Vectorizer variant")
+    parser.add_argument("--max-features", type=int, default=20000, help="Vocabulary cap (tfidf)")
+    parser.add_argument("--min-df", type=int, default=2, help="Minimum document frequency (tfidf)")
+    parser.add_argument("--n-features", type=int, default=2 ** 18, help="Hash space size (hashing)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ATS TF-IDF Model Fitting")
+    print("=" * 60)
+
+    print("\n📂 Loading corpus...")
+    documents = load_corpus(args.input)
+    print(f"✅ {len(documents)} unique documents")
+
+    # min_df can not exceed the corpus size
+    min_df = min(args.min_df, len(documents))
+    vectorizer = build_vectorizer(args.kind, args.max_features, args.n_features, min_df)
+
+    print(f"\n🔧 Fitting {args.kind} vectorizer...")
+    start = time.perf_counter()
+    vectorizer.fit(documents)
+    print(f"✅ Fitted in {time.perf_counter() - start:.1f}s")
+
+    features = len(vectorizer.vocabulary_) if args.kind == 'tfidf' else args.n_features
+    artifact = {
+        "vectorizer": vectorizer,
+        "kind": args.kind,
+        "documents": len(documents),
+        "features": features,
+        "fitted_at": datetime.now(timezone.utc).isoformat()
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    joblib.dump(artifact, args.output)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Saved {args.kind} model ({features} features) to {args.output}")
+    print(f"   Served by /optimize-ats with ATS_TFIDF_PATH={args.output}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
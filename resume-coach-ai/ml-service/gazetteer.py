@@ -0,0 +1,133 @@
+"""
+Gazetteer Module
+Rule-based location and company extraction that does not need spaCy NER.
+Uses labeled header lines ("Location: ...", "Company: ..."), "City, ST" pairs
+(for known cities, or alone on a line), a compiled city/state/country list
+(locations_gazetteer.json) and the usual "<Company> is seeking ..." opening line
+of a posting.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from skill_matcher import SkillMatcher
+
+GAZETTEER_PATH = Path(__file__).parent / "locations_gazetteer.json"
+
+with open(GAZETTEER_PATH, "r") as f:
+    gazetteer_data = json.load(f)
+
+STATE_ABBREVIATIONS = set(gazetteer_data["states"].values())
+CITY_NAMES = set(gazetteer_data["cities"])
+
+# Same Aho-Corasick automaton as skill matching, over place names
+PLACE_MATCHER = SkillMatcher(
+    gazetteer_data["cities"] + list(gazetteer_data["states"]) + gazetteer_data["countries"]
+)
+
+LOCATION_HEADER = re.compile(
+    r"^[\s\-*•]*(?:job\s+|work\s+|office\s+)?(?:location|based\s+in)\s*[:\-–]\s*(\S.*?)[\s.;]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+COMPANY_HEADER = re.compile(
+    r"^[\s\-*•]*(?:company(?:\s+name)?|employer|organization|hiring\s+company)\s*[:\-–]\s*(\S.*?)[\s.;]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+CITY_STATE = re.compile(r"\b([A-Z][\w.'\-]*(?:[ \t]+[A-Z][\w.'\-]*){0,3}),[ \t]*([A-Z]{2})\b")
+COMPANY_INTRO = re.compile(
+    r"^[ \t]*([A-Z][\w&.,'\-]*(?:[ \t]+[A-Z][\w&.,'\-]*){0,5})[ \t]+(?:is|are)[ \t]+"
+    r"(?:seeking|hiring|looking[ \t]+for|searching[ \t]+for|recruiting)\b",
+    re.MULTILINE
+)
+
+# Only the opening lines are checked for "<Company> is seeking ..."
+COMPANY_INTRO_LINES = 5
+MAX_FIELD_LENGTH = 100
+
+
+def _header_value(pattern: re.Pattern, text: str) -> Optional[str]:
+    match = pattern.search(text)
+    if match:
+        value = match.group(1).strip()
+        if value and len(value) <= MAX_FIELD_LENGTH:
+            return value
+    return None
+
+
+def find_places(text: str, limit: int = 2) -> List[str]:
+    """First `limit` distinct capitalized place names, in order of appearance, without overlaps"""
+    places, last_end = [], -1
+    for match in sorted(PLACE_MATCHER.iter_matches(text), key=lambda m: (m.start, -m.end)):
+        if match.start < last_end or not text[match.start].isupper():
+            continue
+        last_end = match.end
+        name = text[match.start:match.end]
+        if name not in places:
+            places.append(name)
+            if len(places) == limit:
+                break
+    return places
+
+
+def _city_state(text: str, match: re.Match) -> Optional[str]:
+    """
+    "City, ST" for a CITY_STATE match when the city is in the gazetteer, or when
+    the pair stands alone on its line (a posting's location line). Anything else
+    ("Azure, MS", "Java, IN") is a capitalized word that happens to precede two capitals.
+    """
+    words = match.group(1).split()
+    # The match may start with other capitalized words ("Remote Austin, TX")
+    for start in range(len(words)):
+        city = " ".join(words[start:])
+        if city in CITY_NAMES:
+            return f"{city}, {match.group(2)}"
+
+    line_start = text.rfind("\n", 0, match.start()) + 1
+    line_end = text.find("\n", match.end())
+    line = text[line_start:line_end if line_end != -1 else len(text)]
+    if line.strip(" \t-*•.;") == match.group(0):
+        return match.group(0)
+    return None
+
+
+def find_location(text: str) -> Tuple[Optional[str], str]:
+    """
+    Location from a "Location:" header, a "City, ST" pair, or the place list.
+    Returns (location, source) with source "header", "gazetteer" or "none".
+    """
+    header = _header_value(LOCATION_HEADER, text)
+    if header:
+        return header, "header"
+
+    for match in CITY_STATE.finditer(text):
+        if match.group(2) in STATE_ABBREVIATIONS:
+            location = _city_state(text, match)
+            if location:
+                return location, "gazetteer"
+
+    places = find_places(text)
+    if places:
+        return ", ".join(places), "gazetteer"
+
+    return None, "none"
+
+
+def find_company(text: str) -> Tuple[Optional[str], str]:
+    """
+    Company from a "Company:" header or an opening "<Company> is seeking/hiring" line.
+    Returns (company, source) with source "header", "rule" or "none".
+    """
+    header = _header_value(COMPANY_HEADER, text)
+    if header:
+        return header, "header"
+
+    lines = [line for line in text.splitlines() if line.strip()][:COMPANY_INTRO_LINES]
+    match = COMPANY_INTRO.search("\n".join(lines))
+    if match:
+        company = match.group(1).strip(" ,.")
+        if company.lower() not in ("we", "our team", "the company") and len(company) <= MAX_FIELD_LENGTH:
+            return company, "rule"
+
+    return None, "none"
@@ -0,0 +1,431 @@
+"""
+Bulk Job Ingestion
+Reads jobs from a CSV export or a SQL dump of the jobs table (INSERT ... VALUES
+statements like backend/database/populate_jobs.sql, or pg_dump COPY blocks),
+parses them with job_parser in parallel worker processes and writes a columnar
+store (NumPy .npz) of parsed fields and skill IDs. Re-runs only parse jobs whose
+content hash changed; everything else is carried over from the existing store.
+The hash covers the parser as well as the text (job_parser.PARSER_VERSION, the
+skills database, the location gazetteer and, in "full" mode, the spaCy model), so
+a parser or data update re-parses every job.
+
+Usage:
+    python ingest_jobs.py ../backend/database/populate_jobs.sql
+    python ingest_jobs.py jobs.csv --output data/parsed_jobs.npz --workers 4 --mode fast
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import job_parser
+from cache import ModelWatcher
+from gazetteer import GAZETTEER_PATH
+from job_index import NUMERIC_FIELDS, JobIndex
+from skills import SKILLS_DB_PATH, skill_index
+
+DEFAULT_OUTPUT = "data/parsed_jobs.npz"
+STORE_VERSION = 1
+
+# Parsed string fields stored as columns ("" when not found)
+STRING_FIELDS = ("job_title", "experience_years", "salary", "location", "company")
+
+# CSV headers accepted for the job text (the training dataset uses job_description)
+COLUMN_ALIASES = {"job_description": "description", "job_id": "id"}
+
+_SQL_TOKEN = re.compile(
+    r"\s+|--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|::\s*\w+(?:\[\])?|[(),;]|[^\s(),;']+",
+    re.DOTALL
+)
+_INSERT = re.compile(r"INSERT\s+INTO\s+(?:\w+\.)?\"?jobs\"?\s*\(([^)]*)\)\s*VALUES", re.IGNORECASE)
+_COPY = re.compile(
+    r"^COPY\s+(?:\w+\.)?\"?jobs\"?\s*\(([^)]*)\)\s+FROM\s+stdin;\n(.*?)^\\\.$",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_COPY_ESCAPE = re.compile(r"\\(.)")
+_COPY_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v"}
+
+
+# ---------------------------------------------------------------------------
+# Reading jobs
+# ---------------------------------------------------------------------------
+
+def _columns(header: str) -> List[str]:
+    return [name.strip().strip('"').lower() for name in header.split(",")]
+
+
+def _insert_rows(text: str) -> Iterator[Dict[str, Any]]:
+    """Rows of every INSERT INTO jobs (...) VALUES (...), (...); statement"""
+    for statement in _INSERT.finditer(text):
+        columns = _columns(statement.group(1))
+        depth, row, value = 0, [], None
+        for match in _SQL_TOKEN.finditer(text, statement.end()):
+            token = match.group(0)
+            if token.isspace() or token.startswith(("--", "/*", "::")):
+                continue
+            if depth == 0:
+                if token == "(":
+                    depth, row, value = 1, [], None
+                elif token != ",":
+                    break  # ";" or ON CONFLICT ...
+            elif token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+                if depth == 0:
+                    row.append(value)
+                    yield dict(zip(columns, row))
+            elif depth > 1:
+                continue  # function arguments, e.g. now()
+            elif token == ",":
+                row.append(value)
+                value = None
+            elif token.startswith("'"):
+                value = token[1:-1].replace("''", "'")
+            elif token.upper() != "NULL":
+                value = token
+
+
+def _copy_rows(text: str) -> Iterator[Dict[str, Any]]:
+    """Rows of every pg_dump COPY jobs (...) FROM stdin; block"""
+    for block in _COPY.finditer(text):
+        columns = _columns(block.group(1))
+        for line in block.group(2).splitlines():
+            values = [
+                None if field == "\\N"
+                else _COPY_ESCAPE.sub(lambda m: _COPY_ESCAPES.get(m.group(1), m.group(1)), field)
+                for field in line.split("\t")
+            ]
+            yield dict(zip(columns, values))
+
+
+def read_sql(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    rows = list(_copy_rows(text))
+    # COPY data is not SQL, so it is cut out before scanning for INSERT statements
+    rows.extend(_insert_rows(_COPY.sub("", text)))
+    return rows
+
+
+def read_csv(path: str) -> List[Dict[str, Any]]:
+    csv.field_size_limit(1 << 30)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [
+            {COLUMN_ALIASES.get(key.strip().lower(), key.strip().lower()): value for key, value in row.items() if key}
+            for row in csv.DictReader(f)
+        ]
+
+
+def read_jobs(path: str) -> List[Dict[str, Any]]:
+    """Job rows from a .csv or .sql file, keyed by lowercased column name"""
+    rows = read_sql(path) if path.lower().endswith(".sql") else read_csv(path)
+    return [row for row in rows if (row.get("description") or "").strip()]
+
+
+def _as_list(value: Any) -> List[str]:
+    """A JSONB array, a Postgres array literal or a comma-separated string"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    value = value.strip()
+    if value.startswith("["):
+        try:
+            return [str(item) for item in json.loads(value)]
+        except json.JSONDecodeError:
+            pass
+    if value.startswith("{") and value.endswith("}"):
+        value = value[1:-1]
+    return [item.strip().strip('"') for item in value.split(",") if item.strip()]
+
+
+def job_text(row: Dict[str, Any]) -> str:
+    """
+    Text handed to job_parser: title line, labeled headers the gazetteer fast
+    path reads, then the description, requirements and listed skills.
+    """
+    lines = []
+    if row.get("title"):
+        lines.append(row["title"].strip())
+    for label in ("company", "location", "salary"):
+        if row.get(label):
+            lines.append(f"{label.title()}: {row[label].strip()}")
+    lines.append("")
+    lines.append(row["description"].strip())
+
+    requirements = _as_list(row.get("requirements"))
+    if requirements:
+        lines.append("")
+        lines.append("Requirements:")
+        lines.extend(f"- {item}" for item in requirements)
+
+    skills = _as_list(row.get("skills"))
+    if skills:
+        lines.append(f"Skills: {', '.join(skills)}")
+
+    return "\n".join(lines)
+
+
+def job_id(row: Dict[str, Any]) -> str:
+    """The row's id, or a stable id from title/company/location (else the description) for dumps without one"""
+    if row.get("id"):
+        return str(row["id"])
+    key = "\0".join(str(row.get(column) or "") for column in ("title", "company", "location"))
+    if not key.strip("\0"):
+        key = row["description"]
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def parser_fingerprint(mode: str) -> str:
+    """
+    Hash of everything besides the text that decides a parse result: the mode,
+    job_parser.PARSER_VERSION, skills_database.json, locations_gazetteer.json and,
+    in "full" mode, the spaCy model name and version
+    """
+    digest = hashlib.sha256(f"{mode}\0{job_parser.PARSER_VERSION}".encode("utf-8"))
+    for path in (SKILLS_DB_PATH, GAZETTEER_PATH):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    if mode == "full":
+        digest.update(f"{job_parser.SPACY_MODEL}\0{job_parser.nlp.meta.get('version', '')}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def content_hash(text: str, parser: str) -> str:
+    """Hash of a job's text under one parser_fingerprint()"""
+    return hashlib.sha256(f"{parser}\0{text}".encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Columnar store
+# ---------------------------------------------------------------------------
+
+def load_store(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Records of an existing store keyed by job id. Each record has content_hash,
+    title, the parsed fields and skills (names, so they survive skill ID changes).
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with np.load(path) as store:
+        if int(store["store_version"]) != STORE_VERSION:
+            return {}
+        vocab = store["skill_vocab"].tolist()
+        offsets = store["skill_offsets"]
+        skill_ids = store["skill_ids"]
+        columns = {name: store[name] for name in store.files}
+
+    records = {}
+    for row, identifier in enumerate(columns["job_id"].tolist()):
+        record = {
+            "content_hash": str(columns["content_hash"][row]),
+            "title": str(columns["title"][row]),
+            "qualifications": json.loads(str(columns["qualifications"][row])),
+            "skills": [vocab[idx] for idx in skill_ids[offsets[row]:offsets[row + 1]]],
+        }
+        for field in STRING_FIELDS:
+            record[field] = str(columns[field][row]) or None
+        for field in NUMERIC_FIELDS:
+            value = float(columns[field][row])
+            record[field] = None if np.isnan(value) else int(value)
+        records[identifier] = record
+    return records
+
+
+class StoredJobs:
+    """
+    A store written by ingest() held in memory with a JobIndex over its numeric
+    fields, so salary/experience range queries take binary searches instead of a
+    scan. The file is re-fingerprinted at most every interval_s seconds and
+    reloaded when ingest_jobs.py rewrites it.
+    """
+
+    def __init__(self, path: str, interval_s: float = 30.0):
+        self.path = path
+        self.watcher = ModelWatcher(path, interval_s)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        records = load_store(self.path)
+        index = JobIndex.build(records.items())
+        # Swapped as one tuple, so a query never sees records and index from different loads
+        self._state = (records, index)
+
+    def __len__(self) -> int:
+        return len(self._state[0])
+
+    def query(self, include_missing: bool = False, **bounds) -> List[Tuple[str, Dict[str, Any]]]:
+        """(job id, record) of stored jobs matching JobIndex.query bounds, in store order"""
+        if self.watcher.changed():
+            with self._lock:
+                self._load()
+        records, index = self._state
+        return [(identifier, records[identifier]) for identifier in index.query(include_missing, **bounds)]
+
+
+def write_store(path: str, records: Dict[str, Dict[str, Any]], mode: str, parser: str = "") -> None:
+    """Write records as columns; skills become a CSR list of IDs into skill_vocab"""
+    ids = list(records)
+    rows = [records[identifier] for identifier in ids]
+
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    flat: List[int] = []
+    for row, record in enumerate(rows):
+        flat.extend(
+            skill_id for skill_id in (skill_index.skill_id(skill) for skill in record["skills"])
+            if skill_id is not None
+        )
+        offsets[row + 1] = len(flat)
+
+    columns = {
+        "store_version": np.array(STORE_VERSION),
+        "mode": np.array(mode),
+        "parser": np.array(parser),
+        "job_id": np.array(ids, dtype=str),
+        "content_hash": np.array([record["content_hash"] for record in rows], dtype=str),
+        "title": np.array([record["title"] or "" for record in rows], dtype=str),
+        "qualifications": np.array([json.dumps(record["qualifications"]) for record in rows], dtype=str),
+        "skill_vocab": np.array(skill_index.skills, dtype=str),
+        "skill_offsets": offsets,
+        "skill_ids": np.array(flat, dtype=np.int32),
+    }
+    for field in STRING_FIELDS:
+        columns[field] = np.array([record[field] or "" for record in rows], dtype=str)
+    for field in NUMERIC_FIELDS:
+        columns[field] = np.array(
+            [np.nan if record[field] is None else record[field] for record in rows], dtype=np.float64
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, **columns)
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def parse_chunk(texts: List[str], mode: str, batch_size: int) -> List[Dict[str, Any]]:
+    """Worker entry point: one chunk of jobs through job_parser"""
+    return job_parser.parse_job_descriptions(texts, batch_size=batch_size, n_process=1, mode=mode)
+
+
+def parse_all(texts: List[str], mode: str, workers: int, chunk_size: int, batch_size: int) -> List[Dict[str, Any]]:
+    """Parse texts in chunks across worker processes, preserving order"""
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        return [result for chunk in chunks for result in parse_chunk(chunk, mode, batch_size)]
+
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for done, parsed in enumerate(
+            pool.map(parse_chunk, chunks, [mode] * len(chunks), [batch_size] * len(chunks)), 1
+        ):
+            results.extend(parsed)
+            print(f"   {done}/{len(chunks)} chunks ({len(results)} jobs)")
+    return results
+
+
+def ingest(
+    input_path: str,
+    output_path: str,
+    mode: str = "full",
+    workers: int = 1,
+    chunk_size: int = 256,
+    batch_size: int = 32,
+    force: bool = False
+) -> Dict[str, int]:
+    """Parse new or changed jobs from input_path and rewrite the store; returns counts"""
+    rows = read_jobs(input_path)
+    previous = {} if force else load_store(output_path)
+    parser = parser_fingerprint(mode)
+
+    records: Dict[str, Dict[str, Any]] = {}
+    repeats: Counter = Counter()
+    pending: List[Tuple[str, str, str, Optional[str]]] = []  # (job id, text, hash, title)
+    for row in rows:
+        identifier = job_id(row)
+        repeats[identifier] += 1
+        if repeats[identifier] > 1:
+            # Same id twice in one dump (e.g. a title/company/location posted again): number the repeats
+            identifier = f"{identifier}-{repeats[identifier] - 1}"
+        text = job_text(row)
+        digest = content_hash(text, parser)
+        old = previous.get(identifier)
+        if old is not None and old["content_hash"] == digest:
+            records[identifier] = old
+        else:
+            records[identifier] = None  # keeps input order
+            pending.append((identifier, text, digest, row.get("title")))
+
+    parsed = parse_all([text for _, text, _, _ in pending], mode, workers, chunk_size, batch_size)
+    for (identifier, _, digest, title), result in zip(pending, parsed):
+        record = {field: result[field] for field in STRING_FIELDS + NUMERIC_FIELDS}
+        record.update(
+            content_hash=digest,
+            title=title,
+            skills=result["skills"],
+            qualifications=result["qualifications"]
+        )
+        records[identifier] = record
+
+    write_store(output_path, records, mode, parser)
+    return {
+        "jobs": len(records),
+        "parsed": len(pending),
+        "unchanged": len(records) - len(pending),
+        "removed": len(set(previous) - set(records)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse jobs in bulk into a columnar store")
+    parser.add_argument("input", help="CSV export or SQL dump of the jobs table")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Store to create or update (.npz)")
+    parser.add_argument("--mode", choices=job_parser.PARSE_MODES, default="full",
+                        help="'fast' skips spaCy NER (see job_parser.PARSE_MODES)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Jobs per worker task")
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per spaCy nlp.pipe batch")
+    parser.add_argument("--force", action="store_true", help="Re-parse every job, ignoring the existing store")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Bulk Job Ingestion")
+    print("=" * 60)
+    print(f"\n📂 Input:  {args.input}")
+    print(f"💾 Output: {args.output} (mode={args.mode}, workers={args.workers})")
+
+    start = time.perf_counter()
+    counts = ingest(
+        args.input, args.output, args.mode, args.workers, args.chunk_size, args.batch_size, args.force
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✅ {counts['jobs']} jobs stored: {counts['parsed']} parsed, "
+          f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+    if counts["parsed"]:
+        print(f"⏱️  {elapsed:.1f}s ({counts['parsed'] / elapsed:.1f} jobs/s)")
+
+    print("\n" + "=" * 60)
+    print(f"✅ Store written: {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
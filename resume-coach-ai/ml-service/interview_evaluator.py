@@ -4,23 +4,26 @@ Generates interview questions and evaluates user responses using LLM.
 """
 
 from typing import List, Dict, Any, Optional
+import os
 import re
-from transformers import pipeline
-import torch
 
-# Initialize sentiment analysis for tone detection
-try:
-    sentiment_analyzer = pipeline(
-        "sentiment-analysis",
-        model="distilbert-base-uncased-finetuned-sst-2-english",
-        device=0 if torch.cuda.is_available() else -1
-    )
-except Exception as e:
-    print(f"Warning: Could not load sentiment analyzer: {e}")
-    sentiment_analyzer = None
+from answer_signals import answer_signals
+import question_bank
+import sentiment as sentiment_backends
+
+# Answers per forward pass when evaluate_answers runs the sentiment model over a whole interview
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
 
+# Answers shorter than this (after stripping) are not analyzed, only flagged as too short
+MIN_ANSWER_LENGTH = 10
 
-def generate_interview_questions(job_description: str, job_role: str = "", num_questions: int = 5) -> List[Dict[str, str]]:
+
+def generate_interview_questions(
+    job_description: str,
+    job_role: str = "",
+    num_questions: int = 5,
+    seed: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Generate interview questions based on job description and role.
     
@@ -28,409 +31,33 @@ def generate_interview_questions(job_description: str, job_role: str = "", num_q
         job_description: The job posting text
         job_role: Job title/role (e.g., "Software Engineer")
         num_questions: Number of questions to generate
+        seed: Makes the selection reproducible (and cached, see question_bank.py)
         
     Returns:
         List of question dictionaries with id, question, category, and difficulty
     """
-    
-    # Extract key requirements from job description
-    job_lower = job_description.lower()
-    
-    # Detect technical skills mentioned
-    technical_skills = []
-    common_skills = ['python', 'javascript', 'react', 'node', 'aws', 'docker', 
-                    'kubernetes', 'sql', 'mongodb', 'machine learning', 'ai',
-                    'django', 'flask', 'fastapi', 'java', 'c++', 'golang']
-    
-    for skill in common_skills:
-        if skill in job_lower:
-            technical_skills.append(skill)
-    
-    # Detect experience level
-    experience_level = "entry"
-    if any(word in job_lower for word in ['senior', '5+ years', '7+ years', 'lead']):
-        experience_level = "senior"
-    elif any(word in job_lower for word in ['mid-level', '3+ years', '4+ years']):
-        experience_level = "mid"
-    
-    # Expanded question bank with 60+ questions customized by job context
-    questions_bank = {
-        "introduction": [
-            {
-                "question": "Tell me about yourself and your background in the context of this role.",
-                "category": "Introduction",
-                "difficulty": "easy"
-            },
-            {
-                "question": "Walk me through your resume and highlight your most relevant experience for this position.",
-                "category": "Introduction",
-                "difficulty": "easy"
-            },
-            {
-                "question": f"What interests you about working in {job_role if job_role else 'this field'}?",
-                "category": "Introduction",
-                "difficulty": "easy"
-            },
-            {
-                "question": "How did you get started in your current career path?",
-                "category": "Introduction",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What are your key strengths that make you suitable for this role?",
-                "category": "Introduction",
-                "difficulty": "easy"
-            }
-        ],
-        "technical": [
-            {
-                "question": f"Describe your hands-on experience with {technical_skills[0] if technical_skills else 'the technologies'} mentioned in the job description.",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Explain a challenging technical problem you solved recently and walk me through your approach.",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How do you stay updated with the latest technologies and industry trends in your field?",
-                "category": "Technical",
-                "difficulty": "easy"
-            },
-            {
-                "question": f"Can you explain how you would architect a system using {', '.join(technical_skills[:2]) if len(technical_skills) >= 2 else 'modern technologies'}?",
-                "category": "Technical",
-                "difficulty": "hard"
-            },
-            {
-                "question": "Describe a time when you had to debug a complex issue. What was your methodology?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How do you ensure code quality and maintainability in your projects?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Tell me about a technical decision you made that you later regretted. What did you learn?",
-                "category": "Technical",
-                "difficulty": "hard"
-            },
-            {
-                "question": "How do you approach performance optimization in your applications?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe your experience with version control and collaborative development workflows.",
-                "category": "Technical",
-                "difficulty": "easy"
-            },
-            {
-                "question": "How do you handle technical debt in a codebase?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "What testing strategies do you implement to ensure software reliability?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Explain a recent technology you learned and how you applied it in a project.",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How would you explain a complex technical concept to a non-technical stakeholder?",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe your experience with database design and optimization.",
-                "category": "Technical",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How do you approach security considerations in your development work?",
-                "category": "Technical",
-                "difficulty": "medium"
-            }
-        ],
-        "behavioral": [
-            {
-                "question": "Describe a time when you had to work under tight deadlines. How did you manage your time and priorities?",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Tell me about a time when you disagreed with a team member or manager. How did you handle the situation?",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Give an example of a project where you demonstrated leadership, even if you weren't the formal leader.",
-                "category": "Behavioral",
-                "difficulty": "hard"
-            },
-            {
-                "question": "Describe a situation where you had to learn something completely new quickly. How did you approach it?",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Tell me about a time when you made a mistake at work. How did you handle it?",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe a situation where you had to give difficult feedback to a colleague. How did you approach it?",
-                "category": "Behavioral",
-                "difficulty": "hard"
-            },
-            {
-                "question": "Give me an example of when you went above and beyond your job responsibilities.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Tell me about a time when you had to deal with a difficult client or stakeholder.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe a project that failed or didn't go as planned. What did you learn from it?",
-                "category": "Behavioral",
-                "difficulty": "hard"
-            },
-            {
-                "question": "Tell me about a time when you had to persuade others to adopt your idea or approach.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe a situation where you had to balance multiple competing priorities.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Give an example of when you helped a team member who was struggling.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Tell me about a time when you received constructive criticism. How did you respond?",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Describe a situation where you had to adapt to significant changes at work.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Give an example of when you took initiative without being asked.",
-                "category": "Behavioral",
-                "difficulty": "medium"
-            }
-        ],
-        "situational": [
-            {
-                "question": "How would you prioritize multiple urgent tasks with conflicting deadlines from different stakeholders?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "If you inherited a poorly documented and legacy codebase, what would be your step-by-step approach?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How would you handle a situation where you discovered a critical bug in production?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "If a project deadline is at risk, what steps would you take to get back on track?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How would you approach a situation where a team member is consistently missing deadlines?",
-                "category": "Situational",
-                "difficulty": "hard"
-            },
-            {
-                "question": "If you had to choose between delivering a feature quickly or ensuring perfect code quality, how would you decide?",
-                "category": "Situational",
-                "difficulty": "hard"
-            },
-            {
-                "question": "How would you handle a disagreement about technical architecture with senior team members?",
-                "category": "Situational",
-                "difficulty": "hard"
-            },
-            {
-                "question": "If you were asked to work on a project with unfamiliar technology, how would you approach it?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "How would you respond if a stakeholder kept changing project requirements?",
-                "category": "Situational",
-                "difficulty": "medium"
-            },
-            {
-                "question": "What would you do if you discovered that your team's approach was inefficient, but they were resistant to change?",
-                "category": "Situational",
-                "difficulty": "hard"
-            },
-            {
-                "question": "How would you handle a situation where you need to say no to a manager's request?",
-                "category": "Situational",
-                "difficulty": "hard"
-            },
-            {
-                "question": "If you noticed a team member struggling but not asking for help, what would you do?",
-                "category": "Situational",
-                "difficulty": "medium"
-            }
-        ],
-        "motivation": [
-            {
-                "question": f"Why are you interested in this {job_role if job_role else 'particular position'}?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "Where do you see yourself in 5 years, and how does this role fit into your career goals?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What motivates you in your work, and what are you most passionate about professionally?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What attracts you to our company specifically?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What kind of work environment do you thrive in?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What are your salary expectations and what factors are important to you beyond compensation?",
-                "category": "Motivation",
-                "difficulty": "medium"
-            },
-            {
-                "question": "Why are you looking to leave your current role?",
-                "category": "Motivation",
-                "difficulty": "medium"
-            },
-            {
-                "question": "What would make you choose our company over other opportunities?",
-                "category": "Motivation",
-                "difficulty": "medium"
-            },
-            {
-                "question": "What are your long-term career aspirations?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What type of projects or challenges are you most excited to work on?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "How do you define success in your career?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            },
-            {
-                "question": "What professional achievement are you most proud of and why?",
-                "category": "Motivation",
-                "difficulty": "easy"
-            }
-        ]
-    }
-    
-    # Add skill-specific technical questions dynamically
-    if technical_skills:
-        for skill in technical_skills[:3]:  # Add up to 3 skill-specific questions
-            questions_bank["technical"].append({
-                "question": f"Can you discuss a specific project where you used {skill.title()}? What challenges did you face and how did you overcome them?",
-                "category": "Technical",
-                "difficulty": "medium"
-            })
-            questions_bank["technical"].append({
-                "question": f"How would you explain {skill.title()} to someone who is just learning it?",
-                "category": "Technical",
-                "difficulty": "easy"
-            })
-    
-    # Import random for better question selection
-    import random
-    
-    # Select questions based on experience level and balance
-    selected_questions = []
-    
-    # Randomly select introduction question for variety
-    selected_questions.append(random.choice(questions_bank["introduction"][:3]))
-    
-    # Distribution based on num_questions with randomization
-    if num_questions >= 5:
-        # Balanced approach with random selection from each category
-        selected_questions.append(random.choice(questions_bank["technical"][:5]))
-        selected_questions.append(random.choice(questions_bank["behavioral"][:5]))
-        selected_questions.append(random.choice(questions_bank["situational"][:4]))
-        selected_questions.append(random.choice(questions_bank["motivation"][:4]))
-        
-        # Add more if needed with variety
-        if num_questions > 5:
-            remaining = num_questions - 5
-            extra_pool = (
-                random.sample(questions_bank["technical"][5:10], min(3, len(questions_bank["technical"][5:10]))) +
-                random.sample(questions_bank["behavioral"][5:10], min(2, len(questions_bank["behavioral"][5:10]))) +
-                random.sample(questions_bank["situational"][4:8], min(2, len(questions_bank["situational"][4:8])))
-            )
-            selected_questions.extend(random.sample(extra_pool, min(remaining, len(extra_pool))))
-    else:
-        # For fewer questions, prioritize based on job level with randomization
-        if experience_level == "senior":
-            pool = [
-                random.choice(questions_bank["technical"][:5]),
-                random.choice(questions_bank["behavioral"][2:5]),
-                random.choice(questions_bank["motivation"][:3])
-            ]
-            selected_questions.extend(pool[:num_questions - 1])
-        else:
-            pool = [
-                random.choice(questions_bank["technical"][:3]),
-                random.choice(questions_bank["motivation"][:3]),
-                random.choice(questions_bank["behavioral"][:3])
-            ]
-            selected_questions.extend(pool[:num_questions - 1])
-    
-    # Add IDs to questions
-    for idx, q in enumerate(selected_questions[:num_questions], 1):
-        q["id"] = idx
-    
-    return selected_questions[:num_questions]
+    return question_bank.generate_questions(job_description, job_role, num_questions, seed)
+
+
+def detect_sentiment(answer: str) -> str:
+    """Sentiment label of one answer ("neutral" if no backend is available or it fails)"""
+    return sentiment_backends.detect_sentiment(answer)
+
+
+def detect_sentiments(answers: List[str]) -> List[str]:
+    """
+    Sentiment label ("positive", "negative" or "neutral" if unavailable) of each
+    answer, from one batched call to the configured backend (see sentiment.py).
+    """
+    return sentiment_backends.detect_sentiments(answers, batch_size=SENTIMENT_BATCH_SIZE)
 
 
 def evaluate_answer(
     question: str,
     answer: str,
     category: str = "General",
-    difficulty: str = "medium"
+    difficulty: str = "medium",
+    sentiment: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Evaluate an interview answer and provide scoring and feedback.
@@ -440,13 +67,15 @@ def evaluate_answer(
         answer: User's answer to the question
         category: Question category (Technical, Behavioral, etc.)
         difficulty: Question difficulty level
+        sentiment: Sentiment label already detected for this answer (e.g. by
+            detect_sentiments); detected here when omitted
         
     Returns:
         Dictionary containing score, feedback, strengths, and improvements
     """
     
     # Input validation
-    if not answer or len(answer.strip()) < 10:
+    if not answer or len(answer.strip()) < MIN_ANSWER_LENGTH:
         return {
             "score": 2,
             "overall_feedback": "Answer is too short. Please provide a more detailed response.",
@@ -457,34 +86,25 @@ def evaluate_answer(
                 "Aim for at least 50-100 words"
             ],
             "sentiment": "neutral",
-            "word_count": len(answer.split())
+            "word_count": len(answer.split()),
+            "has_example": False,
+            "has_result": False
         }
     
     # Calculate basic metrics
     word_count = len(answer.split())
     sentence_count = len(re.split(r'[.!?]+', answer.strip()))
     
-    # Analyze answer structure
-    has_example = any(word in answer.lower() for word in [
-        'example', 'instance', 'time when', 'project', 'situation', 
-        'experience', 'worked on', 'developed', 'implemented'
-    ])
-    
-    has_result = any(word in answer.lower() for word in [
-        'result', 'outcome', 'achieved', 'improved', 'increased',
-        'reduced', 'successful', 'delivered', 'completed'
-    ])
+    # Analyze answer structure (one pass over the answer for every signal lexicon)
+    signals = answer_signals(answer)
+    has_example = bool(signals["example"])
+    has_result = bool(signals["result"])
     
     has_numbers = bool(re.search(r'\d+', answer))
     
     # Sentiment analysis
-    sentiment = "neutral"
-    if sentiment_analyzer:
-        try:
-            sentiment_result = sentiment_analyzer(answer[:512])[0]  # Limit to 512 tokens
-            sentiment = sentiment_result['label'].lower()
-        except:
-            pass
+    if sentiment is None:
+        sentiment = detect_sentiment(answer)
     
     # Scoring algorithm
     base_score = 5.0
@@ -509,17 +129,14 @@ def evaluate_answer(
     
     # Category-specific scoring
     if category.lower() == "technical":
-        technical_terms = ['algorithm', 'database', 'api', 'framework', 
-                          'architecture', 'design', 'code', 'testing',
-                          'deployment', 'optimization', 'performance']
-        tech_mentions = sum(1 for term in technical_terms if term in answer.lower())
+        tech_mentions = len(signals["technical"])
         base_score += min(tech_mentions * 0.3, 1.5)
     
     elif category.lower() == "behavioral":
         star_elements = {
-            'situation': any(w in answer.lower() for w in ['situation', 'time when', 'faced', 'encountered']),
-            'task': any(w in answer.lower() for w in ['task', 'goal', 'objective', 'needed to']),
-            'action': any(w in answer.lower() for w in ['action', 'did', 'approach', 'implemented', 'decided']),
+            'situation': bool(signals["situation"]),
+            'task': bool(signals["task"]),
+            'action': bool(signals["action"]),
             'result': has_result
         }
         star_score = sum(star_elements.values())
@@ -582,87 +199,138 @@ def evaluate_answer(
     }
 
 
-def calculate_interview_score(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+def evaluate_answers(answers: List[Dict[str, str]]) -> Dict[str, Any]:
     """
-    Calculate overall interview performance score from individual question evaluations.
+    Evaluate every answer of an interview and score the interview as a whole.
     
     Args:
-        evaluations: List of evaluation dictionaries from evaluate_answer
+        answers: Dictionaries with question, answer and optionally category and difficulty
         
     Returns:
-        Dictionary with overall score, grade, and summary
+        Dictionary with "evaluations" (evaluate_answer results, in input order)
+        and "interview_score" (calculate_interview_score over them)
     """
+    # One sentiment pass over all answers long enough to be analyzed
+    analyzed = [
+        idx for idx, item in enumerate(answers)
+        if item["answer"] and len(item["answer"].strip()) >= MIN_ANSWER_LENGTH
+    ]
+    sentiments = dict(zip(analyzed, detect_sentiments([answers[idx]["answer"] for idx in analyzed])))
+    
+    evaluations = [
+        evaluate_answer(
+            question=item["question"],
+            answer=item["answer"],
+            category=item.get("category", "General"),
+            difficulty=item.get("difficulty", "medium"),
+            sentiment=sentiments.get(idx, "neutral")
+        )
+        for idx, item in enumerate(answers)
+    ]
     
-    if not evaluations:
-        return {
-            "overall_score": 0,
-            "average_score": 0,
-            "grade": "F",
-            "total_questions": 0,
-            "summary": "No questions answered"
-        }
-    
-    scores = [eval_data["score"] for eval_data in evaluations]
-    average_score = sum(scores) / len(scores)
-    overall_score = round(average_score * 10, 1)  # Convert to 100-point scale
-    
-    # Determine grade
-    if overall_score >= 90:
-        grade = "A+"
-    elif overall_score >= 85:
-        grade = "A"
-    elif overall_score >= 80:
-        grade = "B+"
-    elif overall_score >= 75:
-        grade = "B"
-    elif overall_score >= 70:
-        grade = "C+"
-    elif overall_score >= 60:
-        grade = "C"
-    else:
-        grade = "D"
-    
-    # Generate summary
-    if overall_score >= 80:
-        summary = "Outstanding performance! You demonstrated strong communication skills and provided excellent, detailed responses."
-    elif overall_score >= 70:
-        summary = "Good performance overall. You showed solid understanding but could improve in providing more specific examples."
-    elif overall_score >= 60:
-        summary = "Decent performance with room for improvement. Focus on structuring answers better and adding more detail."
-    else:
-        summary = "Needs improvement. Practice providing more detailed, structured responses with concrete examples."
+    interview_score = calculate_interview_score([
+        {**evaluation, "category": item.get("category", "General")}
+        for item, evaluation in zip(answers, evaluations)
+    ])
     
-    return {
-        "overall_score": overall_score,
-        "average_score": round(average_score, 2),
-        "grade": grade,
-        "total_questions": len(evaluations),
-        "questions_answered": len([e for e in evaluations if e["score"] > 0]),
-        "summary": summary,
-        "category_breakdown": _calculate_category_breakdown(evaluations)
-    }
+    return {"evaluations": evaluations, "interview_score": interview_score}
 
 
-def _calculate_category_breakdown(evaluations: List[Dict[str, Any]]) -> Dict[str, float]:
-    """Helper function to calculate average scores by category"""
-    category_scores = {}
-    category_counts = {}
+class InterviewScoreAggregate:
+    """
+    Running totals behind calculate_interview_score. Adding an evaluation is
+    constant time, and the score is built from the totals (one entry per
+    category), so an interview session never re-scans its evaluations.
+    """
     
-    for eval_data in evaluations:
-        category = eval_data.get("category", "General")
-        score = eval_data["score"]
+    def __init__(self):
+        self.total_score = 0
+        self.total_questions = 0
+        self.questions_answered = 0
+        # category -> [score sum, answer count], in first-seen order
+        self.categories: Dict[str, List[float]] = {}
+    
+    def add(self, score: float, category: str = "General") -> None:
+        """Count one evaluated answer"""
+        self.total_score += score
+        self.total_questions += 1
+        if score > 0:
+            self.questions_answered += 1
         
-        if category not in category_scores:
-            category_scores[category] = 0
-            category_counts[category] = 0
+        totals = self.categories.setdefault(category, [0, 0])
+        totals[0] += score
+        totals[1] += 1
+    
+    def result(self) -> Dict[str, Any]:
+        """Overall score, grade, summary and category breakdown so far"""
+        if not self.total_questions:
+            return {
+                "overall_score": 0,
+                "average_score": 0,
+                "grade": "F",
+                "total_questions": 0,
+                "questions_answered": 0,
+                "summary": "No questions answered",
+                "category_breakdown": {}
+            }
+        
+        average_score = self.total_score / self.total_questions
+        overall_score = round(average_score * 10, 1)  # Convert to 100-point scale
+        
+        # Determine grade
+        if overall_score >= 90:
+            grade = "A+"
+        elif overall_score >= 85:
+            grade = "A"
+        elif overall_score >= 80:
+            grade = "B+"
+        elif overall_score >= 75:
+            grade = "B"
+        elif overall_score >= 70:
+            grade = "C+"
+        elif overall_score >= 60:
+            grade = "C"
+        else:
+            grade = "D"
         
-        category_scores[category] += score
-        category_counts[category] += 1
+        # Generate summary
+        if overall_score >= 80:
+            summary = "Outstanding performance! You demonstrated strong communication skills and provided excellent, detailed responses."
+        elif overall_score >= 70:
+            summary = "Good performance overall. You showed solid understanding but could improve in providing more specific examples."
+        elif overall_score >= 60:
+            summary = "Decent performance with room for improvement. Focus on structuring answers better and adding more detail."
+        else:
+            summary = "Needs improvement. Practice providing more detailed, structured responses with concrete examples."
+        
+        return {
+            "overall_score": overall_score,
+            "average_score": round(average_score, 2),
+            "grade": grade,
+            "total_questions": self.total_questions,
+            "questions_answered": self.questions_answered,
+            "summary": summary,
+            "category_breakdown": {
+                category: round(score_sum / count, 2)
+                for category, (score_sum, count) in self.categories.items()
+            }
+        }
+
+
+def calculate_interview_score(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calculate overall interview performance score from individual question evaluations.
     
-    return {
-        category: round(category_scores[category] / category_counts[category], 2)
-        for category in category_scores
-    }
+    Args:
+        evaluations: List of evaluation dictionaries from evaluate_answer
+        
+    Returns:
+        Dictionary with overall score, grade, and summary
+    """
+    aggregate = InterviewScoreAggregate()
+    for eval_data in evaluations:
+        aggregate.add(eval_data["score"], eval_data.get("category", "General"))
+    return aggregate.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+"""
+Interview Session Module
+Server-side mock interviews: answers are evaluated and appended one at a time,
+and the overall score is kept as running totals (InterviewScoreAggregate), so
+the client never re-sends the evaluations and nothing is re-scored.
+
+Sessions live in a bounded in-memory store with an idle TTL. Subscribers
+(score_events, served as server-sent events) are woken whenever a session's
+score changes.
+When INTERVIEW_SESSION_SNAPSHOT_PATH is set, the store is written there as
+JSON on shutdown and reloaded on startup, so sessions survive a restart.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from interview_evaluator import InterviewScoreAggregate
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle for INTERVIEW_SESSION_TTL_S are dropped; beyond INTERVIEW_SESSION_MAX
+# the least recently used session is evicted
+INTERVIEW_SESSION_TTL_S = float(os.getenv("INTERVIEW_SESSION_TTL_S", "3600"))
+INTERVIEW_SESSION_MAX = int(os.getenv("INTERVIEW_SESSION_MAX", "1000"))
+
+# Answers kept per session (bounds the memory of one session)
+INTERVIEW_SESSION_MAX_ANSWERS = int(os.getenv("INTERVIEW_SESSION_MAX_ANSWERS", "100"))
+
+# JSON file sessions are saved to on shutdown and restored from on startup ("" disables)
+INTERVIEW_SESSION_SNAPSHOT_PATH = os.getenv("INTERVIEW_SESSION_SNAPSHOT_PATH", "")
+
+SNAPSHOT_VERSION = 1
+
+
+class InterviewSessionNotFoundError(KeyError):
+    """Raised for interview session ids that are unknown or have expired"""
+
+
+class InterviewSessionFullError(ValueError):
+    """Raised when a session already holds INTERVIEW_SESSION_MAX_ANSWERS answers"""
+
+
+class InterviewSession:
+    """Evaluated answers of one interview and the running score over them"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.evaluations: List[Dict[str, Any]] = []
+        self.aggregate = InterviewScoreAggregate()
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def add(self, evaluation: Dict[str, Any], category: str) -> Dict[str, Any]:
+        """Append an evaluate_answer result; returns the updated interview score"""
+        self.evaluations.append({**evaluation, "category": category})
+        self.aggregate.add(evaluation["score"], category)
+        self._notify()
+        return self.aggregate.result()
+
+    def score(self) -> Dict[str, Any]:
+        return self.aggregate.result()
+
+    def close(self) -> None:
+        self.closed = True
+        self._notify()
+
+    @property
+    def changed(self) -> asyncio.Event:
+        """Event set on the next score change or close (take it before reading the score)"""
+        return self._changed
+
+    def _notify(self) -> None:
+        # Wake everyone waiting on the current event; later waiters get a fresh one
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class InterviewSessionStore:
+    """
+    Session map with LRU eviction and an idle TTL, plus JSON snapshots.
+    Call it from the event loop: adding an answer and closing a session wake
+    asyncio waiters, which is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = INTERVIEW_SESSION_MAX,
+        ttl_s: float = INTERVIEW_SESSION_TTL_S,
+        max_answers: int = INTERVIEW_SESSION_MAX_ANSWERS
+    ):
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_s = ttl_s
+        self.max_answers = max_answers
+        # session id -> [session, last used]
+        self._sessions: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            session_id, (session, used) = next(iter(self._sessions.items()))
+            if self.ttl_s <= 0 or now - used < self.ttl_s:
+                break
+            del self._sessions[session_id]
+            session.close()
+
+    def _insert(self, session: InterviewSession, used: float) -> None:
+        self._sessions[session.session_id] = [session, used]
+        self._sessions.move_to_end(session.session_id)
+        while len(self._sessions) > self.max_sessions:
+            _, (evicted, _) = self._sessions.popitem(last=False)
+            evicted.close()
+
+    def create(self) -> InterviewSession:
+        """Start an empty session"""
+        session = InterviewSession(uuid.uuid4().hex)
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._insert(session, now)
+        return session
+
+    def get(self, session_id: str, touch: bool = True) -> InterviewSession:
+        """Look up a live session (touch=False reads it without extending its TTL)"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                raise InterviewSessionNotFoundError(session_id)
+            if touch:
+                entry[1] = now
+                self._sessions.move_to_end(session_id)
+            return entry[0]
+
+    def add(self, session_id: str, evaluation: Dict[str, Any], category: str = "General") -> Dict[str, Any]:
+        """Append an evaluated answer to a session; returns the updated interview score"""
+        session = self.get(session_id)
+        with self._lock:
+            if len(session.evaluations) >= self.max_answers:
+                raise InterviewSessionFullError(
+                    f"Interview session '{session_id}' already has {self.max_answers} answers"
+                )
+            return session.add(evaluation, category)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        entry[0].close()
+        return True
+
+    def save(self, path: str) -> int:
+        """Write every live session to path as JSON (atomically); returns the number saved"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            sessions = [
+                {
+                    "session_id": session.session_id,
+                    "idle_s": round(now - used, 3),
+                    "evaluations": session.evaluations,
+                }
+                for session, used in self._sessions.values()
+            ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sessions": sessions}, f)
+        os.replace(tmp_path, path)
+        return len(sessions)
+
+    def load(self, path: str) -> int:
+        """
+        Restore sessions saved by save(). Running totals are rebuilt from the saved
+        evaluations; sessions that were already past the TTL are skipped.
+        Returns the number restored.
+        """
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported interview session snapshot version: {snapshot.get('version')}")
+
+        restored = 0
+        with self._lock:
+            now = time.monotonic()
+            # Oldest first, so LRU order survives the round trip
+            for saved in sorted(snapshot["sessions"], key=lambda s: -s["idle_s"]):
+                if self.ttl_s > 0 and saved["idle_s"] >= self.ttl_s:
+                    continue
+                session = InterviewSession(saved["session_id"])
+                for evaluation in saved["evaluations"][:self.max_answers]:
+                    session.evaluations.append(evaluation)
+                    session.aggregate.add(evaluation["score"], evaluation.get("category", "General"))
+                self._insert(session, now - saved["idle_s"])
+                restored += 1
+        return restored
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def score_events(
+    store: InterviewSessionStore,
+    session: InterviewSession,
+    keepalive_s: float = 15.0
+) -> AsyncIterator[str]:
+    """
+    Server-sent events for one session: a "score" event with the current
+    interview score, another after every appended answer, and a final "end"
+    event once the session is deleted or expires. Comment lines are sent every
+    keepalive_s seconds of silence so proxies keep the connection open.
+    Watching a session does not extend its TTL.
+    """
+    while True:
+        changed = session.changed
+        yield _sse("score", {"session_id": session.session_id, "interview_score": session.score()})
+
+        while not session.closed:
+            try:
+                await asyncio.wait_for(changed.wait(), keepalive_s)
+                break
+            except asyncio.TimeoutError:
+                try:
+                    # Expires the session (and closes it) if it has been idle too long
+                    store.get(session.session_id, touch=False)
+                except InterviewSessionNotFoundError:
+                    break
+                yield ": keepalive\n\n"
+
+        if session.closed:
+            yield _sse("end", {"session_id": session.session_id})
+            return
+
+
+def restore_snapshot(store: InterviewSessionStore, path: Optional[str] = INTERVIEW_SESSION_SNAPSHOT_PATH) -> None:
+    """Load a snapshot at startup if one is configured and present"""
+    if not path or not os.path.exists(path):
+        return
+    try:
+        restored = store.load(path)
+        logger.info(f"Restored {restored} interview sessions from {path}")
+    except Exception as e:
+        logger.warning(f"Could not restore interview sessions from {path}: {str(e)}")
+
+
+def save_snapshot(store: InterviewSessionStore, path: Optional[str] = INTERVIEW_SESSION_SNAPSHOT_PATH) -> None:
+    """Write a snapshot at shutdown if one is configured"""
+    if not path:
+        return
+    try:
+        saved = store.save(path)
+        logger.info(f"Saved {saved} interview sessions to {path}")
+    except Exception as e:
+        logger.warning(f"Could not save interview sessions to {path}: {str(e)}")
@@ -0,0 +1,156 @@
+"""
+Job Index Module
+In-memory range index over parsed jobs. Each numeric field (salary_min,
+salary_max, experience_min, experience_max) is kept as a sorted column, so a
+range condition is located with two binary searches and a query such as
+"salary >= 120000 and experience <= 5" only touches jobs inside the narrowest
+range before any scoring runs.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Numeric fields emitted by job_parser (see job_parser.extract_numeric_fields)
+NUMERIC_FIELDS = ("salary_min", "salary_max", "experience_min", "experience_max")
+
+# (low, high), both inclusive; None leaves that side open
+Bounds = Tuple[Optional[float], Optional[float]]
+
+
+class JobIndex:
+    """
+    Sorted per-field columns over job records (parse_job_description results or
+    any mapping with the indexed fields). Jobs that do not state a field are
+    kept aside and only returned by queries with include_missing=True.
+    """
+
+    def __init__(self, fields: Iterable[str] = NUMERIC_FIELDS):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._values: Dict[str, List[float]] = {field: [] for field in self.fields}
+        self._ids: Dict[str, List[Hashable]] = {field: [] for field in self.fields}
+        self._missing: Dict[str, Set[Hashable]] = {field: set() for field in self.fields}
+        # job id -> indexed values, in insertion order
+        self._jobs: Dict[Hashable, Dict[str, Optional[float]]] = {}
+        self._position: Dict[Hashable, int] = {}
+        self._next_position = 0
+
+    @classmethod
+    def build(
+        cls,
+        records: Iterable[Tuple[Hashable, Mapping[str, Any]]],
+        fields: Iterable[str] = NUMERIC_FIELDS
+    ) -> "JobIndex":
+        """Index many (job_id, record) pairs at once, sorting each column a single time"""
+        index = cls(fields)
+        for job_id, record in records:
+            index._store(job_id, record)
+        jobs_by_position = {position: job_id for job_id, position in index._position.items()}
+        for field in index.fields:
+            column = sorted(
+                (values[field], index._position[job_id])
+                for job_id, values in index._jobs.items()
+                if values[field] is not None
+            )
+            index._values[field] = [value for value, _ in column]
+            index._ids[field] = [jobs_by_position[position] for _, position in column]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: Hashable) -> bool:
+        return job_id in self._jobs
+
+    def _store(self, job_id: Hashable, record: Mapping[str, Any]) -> Dict[str, Optional[float]]:
+        if job_id in self._jobs:
+            self.remove(job_id)
+        values = {field: record.get(field) for field in self.fields}
+        self._jobs[job_id] = values
+        self._position[job_id] = self._next_position
+        self._next_position += 1
+        for field, value in values.items():
+            if value is None:
+                self._missing[field].add(job_id)
+        return values
+
+    def add(self, job_id: Hashable, record: Mapping[str, Any]) -> None:
+        """Index one job (replacing any job with the same id)"""
+        values = self._store(job_id, record)
+        for field, value in values.items():
+            if value is not None:
+                pos = bisect_right(self._values[field], value)
+                self._values[field].insert(pos, value)
+                self._ids[field].insert(pos, job_id)
+
+    def remove(self, job_id: Hashable) -> None:
+        """Drop a job from the index (no-op if it is not indexed)"""
+        values = self._jobs.pop(job_id, None)
+        if values is None:
+            return
+        del self._position[job_id]
+        for field, value in values.items():
+            if value is None:
+                self._missing[field].discard(job_id)
+                continue
+            column, ids = self._values[field], self._ids[field]
+            for pos in range(bisect_left(column, value), bisect_right(column, value)):
+                if ids[pos] == job_id:
+                    del column[pos]
+                    del ids[pos]
+                    break
+
+    def _span(self, field: str, bounds: Bounds) -> Tuple[int, int]:
+        """Positions [start, end) of the sorted column inside bounds"""
+        if field not in self._values:
+            raise ValueError(f"Field '{field}' is not indexed, expected one of {self.fields}")
+        low, high = bounds
+        column = self._values[field]
+        start = 0 if low is None else bisect_left(column, low)
+        end = len(column) if high is None else bisect_right(column, high)
+        return start, max(start, end)
+
+    def count(self, field: str, low: Optional[float] = None, high: Optional[float] = None) -> int:
+        """Number of jobs whose field lies in [low, high], in O(log n)"""
+        start, end = self._span(field, (low, high))
+        return end - start
+
+    def query(self, include_missing: bool = False, **bounds: Bounds) -> List[Hashable]:
+        """
+        Ids of jobs matching every condition, in insertion order.
+
+        Args:
+            include_missing: Also match jobs that do not state a queried field
+            **bounds: field=(low, high), inclusive, None for an open side,
+                e.g. query(salary_max=(120000, None), experience_min=(None, 5))
+        """
+        if not bounds:
+            return list(self._jobs)
+
+        spans = {field: self._span(field, field_bounds) for field, field_bounds in bounds.items()}
+        # Walk only the narrowest range; the other conditions are checked per job
+        narrowest = min(
+            spans,
+            key=lambda field: spans[field][1] - spans[field][0]
+            + (len(self._missing[field]) if include_missing else 0)
+        )
+        start, end = spans[narrowest]
+        candidates = self._ids[narrowest][start:end]
+        if include_missing:
+            candidates = candidates + list(self._missing[narrowest])
+
+        matches = []
+        for job_id in candidates:
+            values = self._jobs[job_id]
+            for field, (low, high) in bounds.items():
+                if field == narrowest:
+                    continue
+                value = values[field]
+                if value is None:
+                    if not include_missing:
+                        break
+                elif (low is not None and value < low) or (high is not None and value > high):
+                    break
+            else:
+                matches.append(job_id)
+
+        return sorted(matches, key=self._position.__getitem__)
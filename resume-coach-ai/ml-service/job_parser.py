@@ -4,51 +4,110 @@ Uses spaCy NLP and regex to extract structured information from job descriptions
 Extracts: skills, experience requirements, qualifications, salary, location, entities.
 """
 
+import json
+import os
 import spacy
 import re
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
+
+from field_scanner import (
+    FieldSpan, scan_fields, experience_from_spans, salary_from_spans, qualifications_from_spans,
+    experience_bounds_from_spans, salary_bounds_from_spans
+)
+from gazetteer import find_location, find_company
+from skill_matcher import SkillMatch
+from skills import skill_index, scan_skills
 
-# Load spaCy English language model
-nlp = spacy.load("en_core_web_sm")
+# Load spaCy English language model. Only doc.ents is read, so every component
+# except NER is disabled (en_core_web_sm's NER has its own embedding layer and
+# does not need the shared tok2vec). Override with SPACY_DISABLE="" for the full pipeline.
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+SPACY_DISABLE = [
+    name.strip()
+    for name in os.getenv("SPACY_DISABLE", "tok2vec,tagger,parser,attribute_ruler,lemmatizer").split(",")
+    if name.strip()
+]
+nlp = spacy.load(SPACY_MODEL, disable=SPACY_DISABLE)
 
-# Load skills database
-SKILLS_DB_PATH = Path(__file__).parent / "skills_database.json"
-with open(SKILLS_DB_PATH, "r") as f:
-    skills_data = json.load(f)
+# All skills from skills_database.json, longest first (see skills.py)
+SKILLS_DB = skill_index.skills
 
-# Flatten all skills into a single list for matching
-SKILLS_DB = []
-for category, skills_list in skills_data.items():
-    SKILLS_DB.extend(skills_list)
+# Bump when a change to the parsing rules here, in field_scanner, gazetteer or skills
+# changes parse results, so ingest_jobs.py re-parses stores written by the old rules
+PARSER_VERSION = 1
 
-# Remove duplicates and sort for efficient matching
-SKILLS_DB = sorted(set(SKILLS_DB), key=lambda x: len(x), reverse=True)
+# "fast": header/gazetteer rules only, spaCy is never run (entities stay empty)
+# "full": rules first, spaCy NER as fallback for location/company, plus entities
+PARSE_MODES = ("fast", "full")
 
 
-def parse_job_description(text: str) -> Dict[str, Any]:
+def parse_job_description(text: str, mode: str = "full") -> Dict[str, Any]:
     """
     Parse a job description and extract structured information.
     
     Args:
         text: Raw job description text
+        mode: "full" (rules + spaCy NER) or "fast" (rules only, no spaCy)
         
     Returns:
         Dictionary containing:
         - skills: List of technical skills found
         - experience_years: Years of experience required (if found)
+        - experience_min / experience_max: Same requirement in years (max None if open-ended)
         - qualifications: Education/certification requirements
         - salary: Salary range (if mentioned)
+        - salary_min / salary_max: Same range as whole numbers (e.g. 120000, 150000)
         - location: Job location (if mentioned)
         - entities: Named entities extracted by spaCy
         - job_title: Detected job title (if found)
         - company: Company name (if found)
+        - field_sources: Which path produced location/company/entities
+          ("header", "rule", "gazetteer", "ner", "none" or "skipped")
+    """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode '{mode}', expected one of {PARSE_MODES}")
+    
+    # Process text with spaCy (full mode only)
+    doc = nlp(text) if mode == "full" else None
+    
+    return build_parse_result(doc, text)
+
+
+def parse_job_descriptions(
+    texts: Iterable[str],
+    batch_size: int = 32,
+    n_process: int = 1,
+    mode: str = "full"
+) -> List[Dict[str, Any]]:
+    """
+    Parse many job descriptions, streaming them through nlp.pipe.
+    
+    Args:
+        texts: Raw job description texts
+        batch_size: Number of texts spaCy buffers per batch
+        n_process: Worker processes for spaCy (1 = in-process)
+        mode: "full" or "fast" (see parse_job_description)
+        
+    Returns:
+        One parse_job_description result per text, in input order
     """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode '{mode}', expected one of {PARSE_MODES}")
     
-    # Process text with spaCy
-    doc = nlp(text)
+    texts = list(texts)
+    if mode == "fast":
+        return [build_parse_result(None, text) for text in texts]
     
+    docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    return [build_parse_result(doc, text) for doc, text in zip(docs, texts)]
+
+
+def build_parse_result(doc, text: str) -> Dict[str, Any]:
+    """
+    Assemble the parse result from a processed spaCy doc (None in fast mode) and its raw text.
+    Location and company come from the rule/gazetteer fast path; NER is only
+    consulted when the fast path finds nothing.
+    """
     # Extract skills by matching against database
     skills = extract_skills(text)
     
@@ -61,74 +120,75 @@ def parse_job_description(text: str) -> Dict[str, Any]:
     # Extract salary information
     salary = extract_salary(text)
     
-    # Extract location
-    location = extract_location(doc)
+    # Numeric bounds for filtering/indexing (see job_index.py)
+    numeric = extract_numeric_fields(text)
+    
+    # Extract location (headers/gazetteer first, NER fallback)
+    location, location_source = find_location(text)
+    if location is None and doc is not None:
+        location = extract_location(doc)
+        location_source = "ner" if location else "none"
     
     # Extract entities using spaCy NER
-    entities = extract_entities(doc)
+    entities = extract_entities(doc) if doc is not None else []
     
     # Try to detect job title
     job_title = extract_job_title(doc, text)
     
-    # Try to detect company name
-    company = extract_company(doc)
+    # Try to detect company name (headers/opening line first, NER fallback)
+    company, company_source = find_company(text)
+    if company is None and doc is not None:
+        company = extract_company(doc)
+        company_source = "ner" if company else "none"
     
     return {
         "skills": skills,
         "experience_years": experience,
         "qualifications": qualifications,
         "salary": salary,
+        **numeric,
         "location": location,
         "entities": entities,
         "job_title": job_title,
-        "company": company
+        "company": company,
+        "field_sources": {
+            "location": location_source,
+            "company": company_source,
+            "entities": "ner" if doc is not None else "skipped"
+        }
     }
 
 
 def extract_skills(text: str) -> List[str]:
     """
     Extract technical skills from text by matching against skills database.
-    Uses case-insensitive matching and handles word boundaries.
+    Uses case-insensitive matching and handles word boundaries; aliases that are
+    not database entries (e.g. "Postgres") are reported under their canonical name.
     """
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill in SKILLS_DB:
-        skill_lower = skill.lower()
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(skill_lower) + r'\b'
-        if re.search(pattern, text_lower):
-            # Add original casing from database
-            if skill not in found_skills:
-                found_skills.append(skill)
-    
-    return found_skills
+    # Original casing from database, in SKILLS_DB order
+    return list(scan_skills(text).skills)
+
+
+def extract_skill_mentions(text: str) -> List[SkillMatch]:
+    """Every skill occurrence in text with its character offsets"""
+    return list(scan_skills(text).mentions)
+
+
+def extract_field_spans(text: str) -> List[FieldSpan]:
+    """
+    Every structured span (experience, salary, degree, certification) with its
+    character offsets, from a single pass of the field scanner.
+    """
+    return list(scan_fields(text))
 
 
 def extract_experience(text: str) -> Optional[str]:
     """
-    Extract years of experience required using regex patterns.
+    Extract years of experience required.
     Matches patterns like: "3+ years", "5-7 years", "minimum 2 years", etc.
+    Ranges win over "N+", "minimum", "at least" and plain "N years ... experience".
     """
-    patterns = [
-        r'(\d+)\+?\s*(?:to|\-)\s*(\d+)\s*years?',  # 3-5 years, 3 to 5 years
-        r'(\d+)\+\s*years?',  # 3+ years
-        r'minimum\s+(\d+)\s*years?',  # minimum 3 years
-        r'at least\s+(\d+)\s*years?',  # at least 3 years
-        r'(\d+)\s*years?.*experience',  # 3 years of experience
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            if len(match.groups()) == 2:
-                # Range found (e.g., 3-5 years)
-                return f"{match.group(1)}-{match.group(2)} years"
-            else:
-                # Single value found
-                return f"{match.group(1)}+ years"
-    
-    return None
+    return experience_from_spans(scan_fields(text))
 
 
 def extract_qualifications(text: str) -> List[str]:
@@ -136,34 +196,7 @@ def extract_qualifications(text: str) -> List[str]:
     Extract education and qualification requirements.
     Looks for degree levels, certifications, and specific qualifications.
     """
-    qualifications = []
-    
-    # Common degree patterns
-    degree_patterns = [
-        r"bachelor'?s?\s+(?:degree)?(?:\s+in\s+[\w\s]+)?",
-        r"master'?s?\s+(?:degree)?(?:\s+in\s+[\w\s]+)?",
-        r"phd|doctorate|doctoral\s+(?:degree)?",
-        r"associate'?s?\s+(?:degree)?",
-        r"b\.?s\.?|m\.?s\.?|m\.?b\.?a\.?|ph\.?d\.?",
-        r"(?:bachelor|master|doctoral)\s+(?:of\s+)?(?:science|arts|engineering|business)",
-    ]
-    
-    text_lower = text.lower()
-    for pattern in degree_patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            qual = match.group(0).strip()
-            if qual and qual not in [q.lower() for q in qualifications]:
-                # Capitalize properly
-                qualifications.append(qual.title())
-    
-    # Look for certification mentions
-    if re.search(r'certification|certified', text_lower):
-        cert_match = re.search(r'([A-Z]{2,}(?:\s+[A-Z]{2,})*)\s+certified', text, re.IGNORECASE)
-        if cert_match:
-            qualifications.append(f"{cert_match.group(1)} Certified")
-    
-    return qualifications
+    return qualifications_from_spans(scan_fields(text))
 
 
 def extract_salary(text: str) -> Optional[str]:
@@ -171,24 +204,24 @@ def extract_salary(text: str) -> Optional[str]:
     Extract salary information from text.
     Matches patterns like: $80,000 - $100,000, $80k-$100k, etc.
     """
-    # Salary range patterns
-    patterns = [
-        r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|\-)\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+year|annually|/year)?',
-        r'\$\s*(\d+)k?\s*(?:to|\-)\s*\$?\s*(\d+)k?\s*(?:per\s+year|annually|/year)?',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(0).strip()
-    
-    # Single salary value
-    single_pattern = r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s+year|annually|/year)'
-    match = re.search(single_pattern, text, re.IGNORECASE)
-    if match:
-        return match.group(0).strip()
-    
-    return None
+    return salary_from_spans(scan_fields(text))
+
+
+def extract_numeric_fields(text: str) -> Dict[str, Optional[int]]:
+    """
+    Normalized salary and experience bounds, from the same spans as
+    extract_salary / extract_experience:
+    salary_min, salary_max, experience_min, experience_max (None when not stated).
+    """
+    spans = scan_fields(text)
+    salary_min, salary_max = salary_bounds_from_spans(spans)
+    experience_min, experience_max = experience_bounds_from_spans(spans)
+    return {
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "experience_min": experience_min,
+        "experience_max": experience_max
+    }
 
 
 def extract_location(doc) -> Optional[str]:
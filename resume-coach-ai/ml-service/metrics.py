@@ -0,0 +1,99 @@
+"""
+In-process Metrics Module
+Lightweight counters and histograms for tuning the ML service.
+Exposed as JSON through the /metrics endpoint.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, Sequence
+
+
+class Counter:
+    """Monotonic counter, safe to update from worker threads"""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"description": self.description, "value": self._value}
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+    Each observation is counted in the first bucket whose upper bound is >= value;
+    values above the last bound land in the "+Inf" bucket.
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float], description: str = ""):
+        self.name = name
+        self.description = description
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+
+        buckets = {f"le_{bound:g}": n for bound, n in zip(self.buckets, counts)}
+        buckets["+Inf"] = counts[-1]
+
+        return {
+            "description": self.description,
+            "count": count,
+            "sum": round(total, 4),
+            "mean": round(total / count, 4) if count else 0.0,
+            "buckets": buckets
+        }
+
+
+class MetricsRegistry:
+    """Holds every metric of the process; get-or-create by name"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, description)
+            return self._metrics[name]
+
+    def histogram(self, name: str, buckets: Sequence[float], description: str = "") -> Histogram:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, buckets, description)
+            return self._metrics[name]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: metric.snapshot() for name, metric in sorted(metrics.items())}
+
+
+# Process-wide registry
+registry = MetricsRegistry()
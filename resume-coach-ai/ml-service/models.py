@@ -2,7 +2,7 @@
 Pydantic models for API request/response validation
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 
 
 class PredictRequest(BaseModel):
@@ -37,11 +37,67 @@ class PredictResponse(BaseModel):
         }
 
 
+class BatchPredictRequest(BaseModel):
+    """Request model for scoring one resume against many job descriptions"""
+    resume_text: str = Field(..., min_length=10, description="Resume text content")
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=1000, description="Job description texts to score against")
+    top_k: Optional[int] = Field(None, ge=1, description="Return only the K best matches")
+    min_salary: Optional[int] = Field(None, ge=0, description="Only score jobs whose salary range reaches this amount")
+    max_experience_years: Optional[int] = Field(None, ge=0, description="Only score jobs requiring at most this many years of experience")
+    include_unspecified: bool = Field(False, description="Also score jobs that do not state a salary/experience requirement")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "resume_text": "Senior Python Developer with 5 years of experience in Django, FastAPI, and machine learning. Built scalable APIs and ML models.",
+                "job_descriptions": [
+                    "Looking for Python Developer with experience in FastAPI and ML. 3+ years required. Django is a plus.",
+                    "Frontend Engineer with React and TypeScript. 2+ years of experience building web applications."
+                ],
+                "top_k": 10,
+                "min_salary": 120000,
+                "max_experience_years": 5
+            }
+        }
+
+
+class RankedPredictResponse(PredictResponse):
+    """Match prediction for one job of a batch request"""
+    job_index: int = Field(..., ge=0, description="Position of the job in the request's job_descriptions")
+    rank: int = Field(..., ge=1, description="Rank by match score (1 = best match)")
+
+
+class BatchPredictResponse(BaseModel):
+    """Response model for batch match prediction"""
+    results: List[RankedPredictResponse] = Field(default_factory=list, description="Predictions sorted by match score, best first")
+    total_jobs: int = Field(..., description="Number of job descriptions scored")
+    jobs_filtered: int = Field(0, description="Jobs skipped by the salary/experience filters before scoring")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "results": [
+                    {
+                        "match_score": 78.45,
+                        "confidence": 0.92,
+                        "keywords_matched": ["python", "django", "fastapi"],
+                        "recommendation": "Strong Match",
+                        "job_index": 0,
+                        "rank": 1
+                    }
+                ],
+                "total_jobs": 2,
+                "jobs_filtered": 0
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     model_loaded: bool
     version: str
+    backend: Optional[str] = None
     
     class Config:
         protected_namespaces = ()  # Allow model_* field names
@@ -50,11 +106,33 @@ class HealthResponse(BaseModel):
 class JobParseRequest(BaseModel):
     """Request model for job description parsing"""
     job_description: str = Field(..., min_length=10, description="Job description text to parse")
+    mode: Literal["fast", "full"] = Field("full", description="'fast' uses header/gazetteer rules only; 'full' also runs spaCy NER")
     
     class Config:
         json_schema_extra = {
             "example": {
-                "job_description": "Senior Software Engineer with 5+ years in Python and React. Bachelor's degree required. Salary: $120k-$150k. Location: San Francisco."
+                "job_description": "Senior Software Engineer with 5+ years in Python and React. Bachelor's degree required. Salary: $120k-$150k. Location: San Francisco.",
+                "mode": "full"
+            }
+        }
+
+
+class BatchJobParseRequest(BaseModel):
+    """Request model for parsing many job descriptions at once"""
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=5000, description="Job description texts to parse")
+    batch_size: int = Field(32, ge=1, le=1000, description="Texts per spaCy nlp.pipe batch")
+    n_process: int = Field(1, ge=1, le=32, description="spaCy worker processes (capped by the server)")
+    mode: Literal["fast", "full"] = Field("full", description="'fast' uses header/gazetteer rules only; 'full' also runs spaCy NER")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_descriptions": [
+                    "Senior Software Engineer with 5+ years in Python and React. Salary: $120k-$150k. Location: San Francisco.",
+                    "Data Scientist, 3+ years with PyTorch and SQL. Master's degree preferred. Location: New York."
+                ],
+                "batch_size": 64,
+                "n_process": 1
             }
         }
 
@@ -63,28 +141,81 @@ class JobParseResponse(BaseModel):
     """Response model for parsed job description"""
     skills: List[str] = Field(default_factory=list, description="Extracted technical skills")
     experience_years: Optional[str] = Field(None, description="Required years of experience")
+    experience_min: Optional[int] = Field(None, description="Minimum years of experience")
+    experience_max: Optional[int] = Field(None, description="Maximum years of experience (None if open-ended)")
     qualifications: List[str] = Field(default_factory=list, description="Education/certification requirements")
     salary: Optional[str] = Field(None, description="Salary information if found")
+    salary_min: Optional[int] = Field(None, description="Lower end of the salary range")
+    salary_max: Optional[int] = Field(None, description="Upper end of the salary range")
     location: Optional[str] = Field(None, description="Job location if found")
     entities: List[Dict[str, str]] = Field(default_factory=list, description="Named entities extracted")
     job_title: Optional[str] = Field(None, description="Detected job title")
     company: Optional[str] = Field(None, description="Company name if found")
+    field_sources: Dict[str, str] = Field(default_factory=dict, description="Path that produced location/company/entities (header, rule, gazetteer, ner, none, skipped)")
     
     class Config:
         json_schema_extra = {
             "example": {
                 "skills": ["Python", "React", "AWS", "Docker"],
                 "experience_years": "5+ years",
+                "experience_min": 5,
+                "experience_max": None,
                 "qualifications": ["Bachelor'S Degree In Computer Science"],
                 "salary": "$120,000 - $150,000 per year",
+                "salary_min": 120000,
+                "salary_max": 150000,
                 "location": "San Francisco, CA",
                 "entities": [{"text": "ABC Tech Company", "label": "ORG"}],
                 "job_title": "Senior Software Engineer",
-                "company": "ABC Tech Company"
+                "company": "ABC Tech Company",
+                "field_sources": {"location": "header", "company": "rule", "entities": "ner"}
+            }
+        }
+
+
+class BatchJobParseResponse(BaseModel):
+    """Response model for batch job parsing"""
+    results: List[JobParseResponse] = Field(default_factory=list, description="Parsed jobs, in request order")
+    total_jobs: int = Field(..., description="Number of job descriptions parsed")
+
+
+class JobSearchRequest(BaseModel):
+    """Request model for filtering the jobs stored by ingest_jobs.py"""
+    min_salary: Optional[int] = Field(None, ge=0, description="Only jobs whose salary range reaches this amount")
+    max_experience_years: Optional[int] = Field(None, ge=0, description="Only jobs requiring at most this many years of experience")
+    include_unspecified: bool = Field(False, description="Also return jobs that do not state a salary/experience requirement")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of jobs returned")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "min_salary": 120000,
+                "max_experience_years": 5,
+                "limit": 50
             }
         }
 
 
+class StoredJobResponse(BaseModel):
+    """One parsed job of the ingested store"""
+    job_id: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    experience_min: Optional[int] = None
+    experience_max: Optional[int] = None
+    skills: List[str] = Field(default_factory=list)
+
+
+class JobSearchResponse(BaseModel):
+    """Response model for stored job filtering"""
+    jobs: List[StoredJobResponse] = Field(default_factory=list, description="Matching jobs, in store order (at most limit)")
+    total_matches: int = Field(..., description="Number of stored jobs matching the filters")
+    stored_jobs: int = Field(..., description="Number of jobs in the store")
+
+
 class ATSOptimizeRequest(BaseModel):
     """Request model for ATS optimization"""
     resume_text: str = Field(..., min_length=10, description="Resume text content")
@@ -129,6 +260,54 @@ class ATSOptimizeResponse(BaseModel):
         }
 
 
+class BatchATSOptimizeRequest(BaseModel):
+    """Request model for ATS analysis of one resume against many jobs"""
+    resume_text: str = Field(..., min_length=10, description="Resume text content")
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=1000, description="Job description texts to analyze against")
+    top_k: Optional[int] = Field(None, ge=1, description="Return only the K best-scoring jobs")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "resume_text": "Senior Software Engineer with 5 years in Python development. Built scalable web applications using Django and Flask.",
+                "job_descriptions": [
+                    "Seeking Senior Software Engineer with 5+ years experience in Python, JavaScript, React, and AWS cloud technologies.",
+                    "Backend developer with Django, PostgreSQL and Docker experience."
+                ],
+                "top_k": 10
+            }
+        }
+
+
+class RankedATSOptimizeResponse(ATSOptimizeResponse):
+    """ATS analysis for one job of a batch request"""
+    job_index: int = Field(..., ge=0, description="Position of the job in the request's job_descriptions")
+    rank: int = Field(..., ge=1, description="Rank by ATS score (1 = best)")
+
+
+class BatchATSOptimizeResponse(BaseModel):
+    """Response model for batch ATS analysis"""
+    results: List[RankedATSOptimizeResponse] = Field(default_factory=list, description="Analyses sorted by ATS score, best first")
+    total_jobs: int = Field(..., description="Number of job descriptions analyzed")
+
+
+class ATSSessionResponse(ATSOptimizeResponse):
+    """ATS analysis of an incremental session's current resume"""
+    session_id: str = Field(..., description="Session to send later resume edits to")
+
+
+class ATSSessionUpdateRequest(BaseModel):
+    """Request model for re-scoring an ATS session after a resume edit"""
+    resume_text: str = Field(..., min_length=10, description="Full text of the edited resume")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "resume_text": "Senior Software Engineer with 5 years in Python development. Built scalable web applications using Django, Flask and AWS."
+            }
+        }
+
+
 class InterviewQuestion(BaseModel):
     """Model for an interview question"""
     id: int = Field(..., description="Question ID")
@@ -142,13 +321,15 @@ class GenerateQuestionsRequest(BaseModel):
     job_description: str = Field(..., min_length=20, description="Job description text")
     job_role: Optional[str] = Field("", description="Job title/role")
     num_questions: int = Field(5, ge=3, le=10, description="Number of questions to generate")
+    seed: Optional[int] = Field(None, description="Seed for a reproducible (and cached) question set")
     
     class Config:
         json_schema_extra = {
             "example": {
                 "job_description": "Senior Software Engineer with 5+ years experience in Python and React. Strong problem-solving skills required.",
                 "job_role": "Senior Software Engineer",
-                "num_questions": 5
+                "num_questions": 5,
+                "seed": 42
             }
         }
 
@@ -231,6 +412,31 @@ class EvaluateAnswerResponse(BaseModel):
         }
 
 
+class BatchEvaluateAnswersRequest(BaseModel):
+    """Request model for evaluating every answer of an interview at once"""
+    answers: List[EvaluateAnswerRequest] = Field(..., min_length=1, max_length=50, description="Question/answer pairs of the interview, in order")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "answers": [
+                    {
+                        "question": "Tell me about yourself and your background.",
+                        "answer": "I am a backend engineer with 5 years of experience building Python APIs and data pipelines.",
+                        "category": "Introduction",
+                        "difficulty": "easy"
+                    },
+                    {
+                        "question": "Tell me about a challenging project you worked on.",
+                        "answer": "I led the migration of our monolith to microservices and reduced deployment time by 60%.",
+                        "category": "Behavioral",
+                        "difficulty": "medium"
+                    }
+                ]
+            }
+        }
+
+
 class InterviewScoreRequest(BaseModel):
     """Request model for calculating overall interview score"""
     evaluations: List[Dict[str, Any]] = Field(..., description="List of evaluation results")
@@ -274,3 +480,23 @@ class InterviewScoreResponse(BaseModel):
                 }
             }
         }
+
+
+class BatchEvaluateAnswersResponse(BaseModel):
+    """Response model for batch answer evaluation"""
+    evaluations: List[EvaluateAnswerResponse] = Field(..., description="Evaluation of each answer, in request order")
+    interview_score: InterviewScoreResponse = Field(..., description="Overall interview score over all evaluations")
+
+
+class InterviewSessionResponse(BaseModel):
+    """Response model for an interview session"""
+    session_id: str = Field(..., description="Session to append answers to")
+    evaluations: List[Dict[str, Any]] = Field(default_factory=list, description="Evaluated answers so far (with their category), in order")
+    interview_score: InterviewScoreResponse = Field(..., description="Running interview score over the session's answers")
+
+
+class InterviewSessionAnswerResponse(BaseModel):
+    """Response model for an answer appended to an interview session"""
+    session_id: str = Field(..., description="Interview session id")
+    evaluation: EvaluateAnswerResponse = Field(..., description="Evaluation of the appended answer")
+    interview_score: InterviewScoreResponse = Field(..., description="Running interview score including this answer")
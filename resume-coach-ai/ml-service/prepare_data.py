@@ -11,6 +11,9 @@ from sklearn.metrics.pairwise import cosine_similarity
 import json
 import re
 
+from skills import scan_skills
+from skill_bitsets import encode_texts, skill_bitsets, skill_overlap
+
 def setup_kaggle():
     """Instructions for Kaggle API setup"""
     print("="*70)
@@ -79,22 +82,8 @@ def clean_text(text):
     return text.strip()
 
 def extract_skills(text):
-    """Extract common tech skills from text"""
-    skills_list = [
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust', 'php', 'swift', 'kotlin',
-        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'laravel',
-        'sql', 'postgresql', 'mongodb', 'redis', 'mysql', 'oracle', 'cassandra', 'elasticsearch',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible',
-        'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'nlp', 'computer vision',
-        'git', 'agile', 'scrum', 'rest api', 'graphql', 'microservices', 'ci/cd', 'devops',
-        'html', 'css', 'tailwind', 'bootstrap', 'sass', 'webpack', 'vite',
-        'testing', 'junit', 'pytest', 'jest', 'cypress', 'selenium',
-        'linux', 'unix', 'bash', 'powershell', 'networking', 'security'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = [skill for skill in skills_list if skill in text_lower]
-    return found_skills
+    """Extract tech skills from text (canonical names, lowercased) using the shared skills index"""
+    return [skill.lower() for skill in scan_skills(text).canonical]
 
 def extract_experience_years(text):
     """Extract years of experience from text"""
@@ -111,8 +100,12 @@ def extract_experience_years(text):
             return max([int(m) for m in matches])
     return 0
 
-def calculate_match_score(resume_text, job_text):
-    """Enhanced match score calculation with multiple factors"""
+def calculate_match_score(resume_text, job_text, skill_overlap_ratio=None):
+    """
+    Enhanced match score calculation with multiple factors.
+    Pass skill_overlap_ratio when the pair's skills are already encoded, so the
+    texts are not scanned for skills again.
+    """
     
     # 1. TF-IDF similarity (30% weight) - boosted from raw score
     vectorizer = TfidfVectorizer(max_features=1000, stop_words='english', ngram_range=(1, 2))
@@ -124,14 +117,10 @@ def calculate_match_score(resume_text, job_text):
     except:
         tfidf_score = 0.0
     
-    # 2. Skill overlap (35% weight)
-    resume_skills = set(extract_skills(resume_text))
-    job_skills = set(extract_skills(job_text))
-    
-    if len(job_skills) > 0:
-        skill_overlap = len(resume_skills.intersection(job_skills)) / len(job_skills)
-    else:
-        skill_overlap = 0.0
+    # 2. Skill overlap (35% weight): shared skills / job skills, 0 if the job lists none
+    if skill_overlap_ratio is None:
+        _, overlap_ratios = skill_overlap(resume_text, [job_text])
+        skill_overlap_ratio = float(overlap_ratios[0])
     
     # 3. Keyword matching (25% weight)
     resume_words = set(resume_text.lower().split())
@@ -165,7 +154,7 @@ def calculate_match_score(resume_text, job_text):
     # Combined weighted score
     match_score = (
         tfidf_score * 30 + 
-        skill_overlap * 35 + 
+        skill_overlap_ratio * 35 + 
         keyword_match * 25 + 
         experience_score * 10
     )
@@ -249,8 +238,25 @@ def prepare_training_data():
     
     # First, categorize resumes and jobs by extracting their skills
     print("\n📊 Analyzing skills in resumes and jobs...")
-    resumes_df['skills'] = resumes_df['resume_clean'].apply(lambda x: set(extract_skills(x)))
-    jobs_df['skills'] = jobs_df['job_clean'].apply(lambda x: set(extract_skills(x)))
+    resume_bits = encode_texts(resumes_df['resume_clean'])
+    job_bits = encode_texts(jobs_df['job_clean'])
+    
+    # Shared-skill counts and ratios of one resume against every job, computed once per resume
+    overlap_rows = {}
+    def resume_overlap(resume_idx):
+        if resume_idx not in overlap_rows:
+            overlap_rows[resume_idx] = skill_bitsets.overlap(resume_bits[resume_idx], job_bits)
+        return overlap_rows[resume_idx]
+    
+    def shared_skills(resume_idx, job_idx):
+        return resume_overlap(resume_idx)[0][job_idx]
+    
+    def pair_score(resume_idx, job_idx):
+        return calculate_match_score(
+            resumes_df.iloc[resume_idx]['resume_clean'],
+            jobs_df.iloc[job_idx]['job_clean'],
+            skill_overlap_ratio=float(resume_overlap(resume_idx)[1][job_idx])
+        )
     
     num_samples = min(2000, len(resumes_df) * 2)
     
@@ -276,10 +282,8 @@ def prepare_training_data():
         job = jobs_df.iloc[job_idx]
         
         # Check if there's skill overlap
-        skill_overlap = len(resume['skills'].intersection(job['skills']))
-        
-        if skill_overlap >= 2:  # At least 2 common skills
-            score = calculate_match_score(resume['resume_clean'], job['job_clean'])
+        if shared_skills(resume_idx, job_idx) >= 2:  # At least 2 common skills
+            score = pair_score(resume_idx, job_idx)
             
             training_data.append({
                 'resume_text': resume['resume_clean'][:2000],
@@ -303,7 +307,7 @@ def prepare_training_data():
         resume = resumes_df.iloc[resume_idx]
         job = jobs_df.iloc[job_idx]
         
-        score = calculate_match_score(resume['resume_clean'], job['job_clean'])
+        score = pair_score(resume_idx, job_idx)
         
         # Accept if in moderate range
         if 35 <= score <= 65:
@@ -328,7 +332,7 @@ def prepare_training_data():
         resume = resumes_df.iloc[resume_idx]
         job = jobs_df.iloc[job_idx]
         
-        score = calculate_match_score(resume['resume_clean'], job['job_clean'])
+        score = pair_score(resume_idx, job_idx)
         
         training_data.append({
             'resume_text': resume['resume_clean'][:2000],
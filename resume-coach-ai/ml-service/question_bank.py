@@ -0,0 +1,238 @@
+"""
+Interview Question Bank
+The interview question templates as static data, compiled once at import and
+indexed by category; each template carries its difficulty. Role and skill slots
+are only filled in for the questions a request actually selects.
+
+Selection draws indices from a random.Random, so a seed reproduces a question
+set; seeded sets are cached per (role, skills, experience level, count, seed)
+and repeat requests for the same job cost a dictionary lookup.
+"""
+
+import os
+import random
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from skills import skill_index, scan_skills
+
+# Cached job profiles and seeded question sets
+INTERVIEW_QUESTION_CACHE_SIZE = int(os.getenv("INTERVIEW_QUESTION_CACHE_SIZE", "1024"))
+
+# Questions per category, in bank order (pools below select by position).
+# {slots} are filled from the job role and detected skills, see SLOTS.
+QUESTION_TEMPLATES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "introduction": (
+        ("Tell me about yourself and your background in the context of this role.", "easy"),
+        ("Walk me through your resume and highlight your most relevant experience for this position.", "easy"),
+        ("What interests you about working in {role_or_field}?", "easy"),
+        ("How did you get started in your current career path?", "easy"),
+        ("What are your key strengths that make you suitable for this role?", "easy"),
+    ),
+    "technical": (
+        ("Describe your hands-on experience with {first_skill} mentioned in the job description.", "medium"),
+        ("Explain a challenging technical problem you solved recently and walk me through your approach.", "medium"),
+        ("How do you stay updated with the latest technologies and industry trends in your field?", "easy"),
+        ("Can you explain how you would architect a system using {first_two_skills}?", "hard"),
+        ("Describe a time when you had to debug a complex issue. What was your methodology?", "medium"),
+        ("How do you ensure code quality and maintainability in your projects?", "medium"),
+        ("Tell me about a technical decision you made that you later regretted. What did you learn?", "hard"),
+        ("How do you approach performance optimization in your applications?", "medium"),
+        ("Describe your experience with version control and collaborative development workflows.", "easy"),
+        ("How do you handle technical debt in a codebase?", "medium"),
+        ("What testing strategies do you implement to ensure software reliability?", "medium"),
+        ("Explain a recent technology you learned and how you applied it in a project.", "medium"),
+        ("How would you explain a complex technical concept to a non-technical stakeholder?", "medium"),
+        ("Describe your experience with database design and optimization.", "medium"),
+        ("How do you approach security considerations in your development work?", "medium"),
+    ),
+    "behavioral": (
+        ("Describe a time when you had to work under tight deadlines. How did you manage your time and priorities?", "medium"),
+        ("Tell me about a time when you disagreed with a team member or manager. How did you handle the situation?", "medium"),
+        ("Give an example of a project where you demonstrated leadership, even if you weren't the formal leader.", "hard"),
+        ("Describe a situation where you had to learn something completely new quickly. How did you approach it?", "medium"),
+        ("Tell me about a time when you made a mistake at work. How did you handle it?", "medium"),
+        ("Describe a situation where you had to give difficult feedback to a colleague. How did you approach it?", "hard"),
+        ("Give me an example of when you went above and beyond your job responsibilities.", "medium"),
+        ("Tell me about a time when you had to deal with a difficult client or stakeholder.", "medium"),
+        ("Describe a project that failed or didn't go as planned. What did you learn from it?", "hard"),
+        ("Tell me about a time when you had to persuade others to adopt your idea or approach.", "medium"),
+        ("Describe a situation where you had to balance multiple competing priorities.", "medium"),
+        ("Give an example of when you helped a team member who was struggling.", "medium"),
+        ("Tell me about a time when you received constructive criticism. How did you respond?", "medium"),
+        ("Describe a situation where you had to adapt to significant changes at work.", "medium"),
+        ("Give an example of when you took initiative without being asked.", "medium"),
+    ),
+    "situational": (
+        ("How would you prioritize multiple urgent tasks with conflicting deadlines from different stakeholders?", "medium"),
+        ("If you inherited a poorly documented and legacy codebase, what would be your step-by-step approach?", "medium"),
+        ("How would you handle a situation where you discovered a critical bug in production?", "medium"),
+        ("If a project deadline is at risk, what steps would you take to get back on track?", "medium"),
+        ("How would you approach a situation where a team member is consistently missing deadlines?", "hard"),
+        ("If you had to choose between delivering a feature quickly or ensuring perfect code quality, how would you decide?", "hard"),
+        ("How would you handle a disagreement about technical architecture with senior team members?", "hard"),
+        ("If you were asked to work on a project with unfamiliar technology, how would you approach it?", "medium"),
+        ("How would you respond if a stakeholder kept changing project requirements?", "medium"),
+        ("What would you do if you discovered that your team's approach was inefficient, but they were resistant to change?", "hard"),
+        ("How would you handle a situation where you need to say no to a manager's request?", "hard"),
+        ("If you noticed a team member struggling but not asking for help, what would you do?", "medium"),
+    ),
+    "motivation": (
+        ("Why are you interested in this {role_or_position}?", "easy"),
+        ("Where do you see yourself in 5 years, and how does this role fit into your career goals?", "easy"),
+        ("What motivates you in your work, and what are you most passionate about professionally?", "easy"),
+        ("What attracts you to our company specifically?", "easy"),
+        ("What kind of work environment do you thrive in?", "easy"),
+        ("What are your salary expectations and what factors are important to you beyond compensation?", "medium"),
+        ("Why are you looking to leave your current role?", "medium"),
+        ("What would make you choose our company over other opportunities?", "medium"),
+        ("What are your long-term career aspirations?", "easy"),
+        ("What type of projects or challenges are you most excited to work on?", "easy"),
+        ("How do you define success in your career?", "easy"),
+        ("What professional achievement are you most proud of and why?", "easy"),
+    )
+}
+
+# Template slot -> value from (job_role, technical skills in order of mention)
+SLOTS: Dict[str, Callable[[str, Sequence[str]], str]] = {
+    "role_or_field": lambda role, skills: role or "this field",
+    "role_or_position": lambda role, skills: role or "particular position",
+    "first_skill": lambda role, skills: skills[0] if skills else "the technologies",
+    "first_two_skills": lambda role, skills: ", ".join(skills[:2]) if len(skills) >= 2 else "modern technologies",
+}
+
+# Detected skills the slots use
+SLOT_SKILLS = 2
+
+
+class QuestionTemplate(NamedTuple):
+    """One bank question; slots lists the SLOTS its text refers to"""
+    text: str
+    category: str
+    difficulty: str
+    slots: Tuple[str, ...]
+
+    def render(self, role: str, skills: Sequence[str]) -> str:
+        if not self.slots:
+            return self.text
+        return self.text.format(**{slot: SLOTS[slot](role, skills) for slot in self.slots})
+
+
+def _compile(text: str, category: str, difficulty: str) -> QuestionTemplate:
+    slots = tuple(field for _, field, _, _ in Formatter().parse(text) if field)
+    unknown = set(slots) - SLOTS.keys()
+    if unknown:
+        raise ValueError(f"Unknown slots {sorted(unknown)} in question template: {text}")
+    return QuestionTemplate(text, category.capitalize(), difficulty, slots)
+
+
+# category -> compiled templates, in bank order
+QUESTIONS: Dict[str, Tuple[QuestionTemplate, ...]] = {
+    category: tuple(_compile(text, category, difficulty) for text, difficulty in entries)
+    for category, entries in QUESTION_TEMPLATES.items()
+}
+
+# Selection pools: (category, start, stop) position ranges of the bank
+INTRO_POOL = ("introduction", 0, 3)
+CORE_POOLS = (("technical", 0, 5), ("behavioral", 0, 5), ("situational", 0, 4), ("motivation", 0, 4))
+# Candidates for questions beyond five: (category, start, stop, how many to draw)
+EXTRA_POOLS = (("technical", 5, 10, 3), ("behavioral", 5, 10, 2), ("situational", 4, 8, 2))
+# Follow-ups to the introduction when fewer than five questions are asked
+SHORT_POOLS = {
+    "senior": (("technical", 0, 5), ("behavioral", 2, 5), ("motivation", 0, 3)),
+    "default": (("technical", 0, 3), ("motivation", 0, 3), ("behavioral", 0, 3)),
+}
+
+# Unseeded selections
+_rng = random.Random()
+
+
+@lru_cache(maxsize=INTERVIEW_QUESTION_CACHE_SIZE)
+def job_profile(job_description: str) -> Tuple[Tuple[str, ...], str]:
+    """(technical skills in order of first mention, experience level) of a job description"""
+    job_lower = job_description.lower()
+    
+    technical_skills = tuple(
+        skill for skill in scan_skills(job_description).canonical
+        if skill_index.is_technical(skill)
+    )
+    
+    experience_level = "entry"
+    if any(word in job_lower for word in ['senior', '5+ years', '7+ years', 'lead']):
+        experience_level = "senior"
+    elif any(word in job_lower for word in ['mid-level', '3+ years', '4+ years']):
+        experience_level = "mid"
+    
+    return technical_skills, experience_level
+
+
+def _pick(rng: random.Random, pool: Tuple[str, int, int]) -> QuestionTemplate:
+    category, start, stop = pool
+    return QUESTIONS[category][rng.randrange(start, stop)]
+
+
+def select_questions(experience_level: str, num_questions: int, rng: random.Random) -> List[QuestionTemplate]:
+    """
+    Templates for one interview: an introduction question, then one per core
+    category and extras for more than five questions, or level-dependent
+    follow-ups for fewer. Only indices are drawn; nothing is copied or rendered.
+    """
+    selected = [_pick(rng, INTRO_POOL)]
+    
+    if num_questions >= 5:
+        selected.extend(_pick(rng, pool) for pool in CORE_POOLS)
+        if num_questions > 5:
+            extra_pool = [
+                QUESTIONS[category][idx]
+                for category, start, stop, count in EXTRA_POOLS
+                for idx in rng.sample(range(start, stop), count)
+            ]
+            selected.extend(rng.sample(extra_pool, min(num_questions - 5, len(extra_pool))))
+    else:
+        pools = SHORT_POOLS["senior" if experience_level == "senior" else "default"]
+        follow_ups = [_pick(rng, pool) for pool in pools]
+        selected.extend(follow_ups[:num_questions - 1])
+    
+    return selected[:num_questions]
+
+
+def _render(templates: List[QuestionTemplate], job_role: str, skills: Tuple[str, ...]) -> Tuple[Tuple[str, str, str], ...]:
+    return tuple((template.render(job_role, skills), template.category, template.difficulty) for template in templates)
+
+
+@lru_cache(maxsize=INTERVIEW_QUESTION_CACHE_SIZE)
+def _seeded_questions(
+    job_role: str,
+    skills: Tuple[str, ...],
+    experience_level: str,
+    num_questions: int,
+    seed: int
+) -> Tuple[Tuple[str, str, str], ...]:
+    rng = random.Random(seed)
+    return _render(select_questions(experience_level, num_questions, rng), job_role, skills)
+
+
+def generate_questions(
+    job_description: str,
+    job_role: str = "",
+    num_questions: int = 5,
+    seed: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Interview questions for a job, as dictionaries with id, question, category
+    and difficulty. With a seed the set is reproducible and cached.
+    """
+    technical_skills, experience_level = job_profile(job_description)
+    skills = technical_skills[:SLOT_SKILLS]
+    job_role = job_role or ""
+    
+    if seed is None:
+        questions_set = _render(select_questions(experience_level, num_questions, _rng), job_role, skills)
+    else:
+        questions_set = _seeded_questions(job_role, skills, experience_level, num_questions, seed)
+    
+    return [
+        {"id": idx, "question": question, "category": category, "difficulty": difficulty}
+        for idx, (question, category, difficulty) in enumerate(questions_set, 1)
+    ]
@@ -0,0 +1,346 @@
+"""
+Resume-Job Match Scorer Backends
+Loads the fine-tuned DistilBERT scorer and runs batched inference.
+
+Backends (selected with SCORER_BACKEND):
+- "torch":      fp32 PyTorch model (default)
+- "torch-int8": PyTorch model with Linear layers dynamically quantized to INT8 (CPU only)
+- "onnx":       ONNX Runtime session over the graph written by export_onnx.py
+
+torch is only imported by the torch backends, so an ONNX serving image
+does not need it installed.
+"""
+
+import copy
+import logging
+import os
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from transformers import DistilBertTokenizer
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+MODEL_PATH = os.getenv("MODEL_PATH", "./models/resume_scorer")
+SCORER_BACKEND = os.getenv("SCORER_BACKEND", "torch")
+ONNX_MODEL_PATH = os.getenv("ONNX_MODEL_PATH", os.path.join(MODEL_PATH, "model.onnx"))
+
+# ONNX Runtime session tuning: disable | basic | extended | all
+ONNX_GRAPH_OPTIMIZATION = os.getenv("ONNX_GRAPH_OPTIMIZATION", "all")
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))  # 0 = runtime default
+
+# Held-out rows of the training data used to report INT8 latency/drift at startup (0 disables)
+QUANT_REPORT_SAMPLES = int(os.getenv("QUANT_REPORT_SAMPLES", "64"))
+QUANT_REPORT_DATASET = os.getenv("QUANT_REPORT_DATASET", "./data/training_dataset.csv")
+
+MAX_SEQ_LENGTH = 512
+
+# Sequences are grouped by length and padded only up to their bucket, so short
+# resume/job pairs don't pay for 512-token attention
+SEQ_LENGTH_BUCKETS = sorted({
+    min(int(b), MAX_SEQ_LENGTH)
+    for b in os.getenv("SEQ_LENGTH_BUCKETS", "64,128,256,512").split(",") if b.strip()
+} | {MAX_SEQ_LENGTH})
+
+FORWARD_MS_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 2500)
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+
+def combine_texts(resume_text: str, job_description: str) -> str:
+    """Model input format used in training (see train_model.load_and_prepare_data)"""
+    return f"Resume: {resume_text} [SEP] Job: {job_description}"
+
+
+class BaseScorer:
+    """
+    Tokenization and batching shared by every backend.
+    Subclasses implement `score_encoded` for a batch of token id lists.
+    """
+
+    backend = "base"
+
+    def __init__(self, tokenizer: DistilBertTokenizer):
+        self.tokenizer = tokenizer
+
+    def score_encoded(self, input_ids: List[List[int]], pad_to: Optional[int] = None) -> List[float]:
+        """Score one padded batch; pad_to fixes the padded length (default: longest sequence)"""
+        raise NotImplementedError
+
+    def _pad(self, input_ids: List[List[int]], pad_to: Optional[int], return_tensors: str):
+        if pad_to is None:
+            return self.tokenizer.pad({"input_ids": input_ids}, return_tensors=return_tensors)
+        return self.tokenizer.pad(
+            {"input_ids": input_ids},
+            padding='max_length',
+            max_length=pad_to,
+            return_tensors=return_tensors
+        )
+
+    @staticmethod
+    def bucket_for(length: int) -> int:
+        """Smallest configured bucket that fits a sequence of this length"""
+        idx = bisect_left(SEQ_LENGTH_BUCKETS, length)
+        return SEQ_LENGTH_BUCKETS[idx] if idx < len(SEQ_LENGTH_BUCKETS) else length
+
+    def score_bucketed(self, input_ids: List[List[int]], chunk_size: Optional[int] = None) -> List[float]:
+        """
+        Score sequences grouped by length bucket, one forward pass per bucket
+        (or per chunk_size sequences within a bucket). Results keep the input order.
+        """
+        groups = defaultdict(list)
+        for idx, ids in enumerate(input_ids):
+            groups[self.bucket_for(len(ids))].append(idx)
+
+        scores = [0.0] * len(input_ids)
+        for bucket, indices in sorted(groups.items()):
+            step = chunk_size or len(indices)
+            for start in range(0, len(indices), step):
+                chunk = indices[start:start + step]
+
+                started = time.perf_counter()
+                chunk_scores = self.score_encoded([input_ids[i] for i in chunk], pad_to=bucket)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                registry.counter(
+                    f"seq_bucket_{bucket}_sequences", f"Sequences scored in the {bucket}-token bucket"
+                ).inc(len(chunk))
+                registry.histogram(
+                    f"seq_bucket_{bucket}_forward_ms", FORWARD_MS_BUCKETS,
+                    f"Forward pass time for {bucket}-token batches (ms)"
+                ).observe(elapsed_ms)
+
+                for i, score in zip(chunk, chunk_scores):
+                    scores[i] = score
+
+        return scores
+
+    def score_texts(self, texts: List[str]) -> List[float]:
+        """Tokenize and score a batch of combined resume/job texts, bucketed by length"""
+        encoded = self.tokenizer(texts, truncation=True, max_length=MAX_SEQ_LENGTH)
+        return self.score_bucketed(encoded["input_ids"])
+
+    def encode_resume_job_pairs(self, resume_text: str, job_descriptions: List[str]) -> List[List[int]]:
+        """
+        Build model inputs for one resume against many jobs, tokenizing the resume only once.
+
+        Produces the same ids as tokenizing "Resume: ... [SEP] Job: ..." per pair:
+        the tokenizer splits on the [SEP] special token before word-piecing, so the
+        resume and job halves can be tokenized separately and concatenated.
+        """
+        resume_ids = self.tokenizer(f"Resume: {resume_text}", add_special_tokens=False)["input_ids"]
+        job_ids = self.tokenizer(
+            [f"Job: {job}" for job in job_descriptions],
+            add_special_tokens=False
+        )["input_ids"]
+
+        cls_id, sep_id = self.tokenizer.cls_token_id, self.tokenizer.sep_token_id
+        prefix = resume_ids + [sep_id]
+
+        # Leave room for [CLS] ... [SEP]; truncation keeps the head of the sequence like the tokenizer does
+        budget = MAX_SEQ_LENGTH - 2
+
+        return [[cls_id] + (prefix + ids)[:budget] + [sep_id] for ids in job_ids]
+
+    def score_resume_against_jobs(
+        self,
+        resume_text: str,
+        job_descriptions: List[str],
+        chunk_size: int = 32
+    ) -> List[float]:
+        """Score one resume against every job, at most chunk_size pairs per forward pass"""
+        encoded = self.encode_resume_job_pairs(resume_text, job_descriptions)
+        return self.score_bucketed(encoded, chunk_size=chunk_size)
+
+
+class TorchScorer(BaseScorer):
+    """PyTorch backend, fp32 or dynamically quantized INT8"""
+
+    def __init__(self, model, tokenizer: DistilBertTokenizer, device, backend: str = "torch"):
+        super().__init__(tokenizer)
+        self.model = model
+        self.device = device
+        self.backend = backend
+
+    @classmethod
+    def load(cls, model_path: str = MODEL_PATH) -> "TorchScorer":
+        import torch
+        from transformers import DistilBertForSequenceClassification
+
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        logger.info(f"Using device: {device}")
+
+        model = DistilBertForSequenceClassification.from_pretrained(model_path)
+        tokenizer = DistilBertTokenizer.from_pretrained(model_path)
+
+        model.to(device)
+        model.eval()
+
+        return cls(model, tokenizer, device)
+
+    def quantized(self) -> "TorchScorer":
+        """Copy of this scorer with every nn.Linear dynamically quantized to INT8 (runs on CPU)"""
+        import torch
+
+        cpu_model = copy.deepcopy(self.model).cpu() if self.device.type != "cpu" else self.model
+        int8_model = torch.ao.quantization.quantize_dynamic(
+            cpu_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        int8_model.eval()
+        return TorchScorer(int8_model, self.tokenizer, torch.device("cpu"), backend="torch-int8")
+
+    def score_encoded(self, input_ids: List[List[int]], pad_to: Optional[int] = None) -> List[float]:
+        """
+        Score a batch of already tokenized inputs in one forward pass.
+        Returns scores on a 0-100 scale.
+        """
+        import torch
+
+        inputs = self._pad(input_ids, pad_to, return_tensors='pt')
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            # Model outputs logits in range 0-1, scale to 0-100
+            logits = outputs.logits.view(-1).tolist()
+
+        return [max(0, min(100, logit * 100)) for logit in logits]  # Clamp to 0-100
+
+
+class OnnxScorer(BaseScorer):
+    """ONNX Runtime backend; produces the same scores as the fp32 torch model"""
+
+    backend = "onnx"
+
+    GRAPH_OPTIMIZATION_LEVELS = {
+        "disable": "ORT_DISABLE_ALL",
+        "basic": "ORT_ENABLE_BASIC",
+        "extended": "ORT_ENABLE_EXTENDED",
+        "all": "ORT_ENABLE_ALL",
+    }
+
+    def __init__(self, session, tokenizer: DistilBertTokenizer):
+        super().__init__(tokenizer)
+        self.session = session
+        self.input_names = {i.name for i in session.get_inputs()}
+
+    @classmethod
+    def load(cls, model_path: str = MODEL_PATH, onnx_path: Optional[str] = None) -> "OnnxScorer":
+        """
+        Session over onnx_path; by default ONNX_MODEL_PATH for the configured
+        MODEL_PATH, or model.onnx inside any other model_path
+        """
+        import onnxruntime as ort
+
+        if onnx_path is None:
+            onnx_path = ONNX_MODEL_PATH if model_path == MODEL_PATH else os.path.join(model_path, "model.onnx")
+
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"ONNX model not found at {onnx_path}. Run 'python export_onnx.py' first."
+            )
+
+        if ONNX_GRAPH_OPTIMIZATION not in cls.GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown ONNX_GRAPH_OPTIMIZATION '{ONNX_GRAPH_OPTIMIZATION}', "
+                f"expected one of {tuple(cls.GRAPH_OPTIMIZATION_LEVELS)}"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, cls.GRAPH_OPTIMIZATION_LEVELS[ONNX_GRAPH_OPTIMIZATION]
+        )
+        if ONNX_INTRA_OP_THREADS > 0:
+            options.intra_op_num_threads = ONNX_INTRA_OP_THREADS
+
+        session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        tokenizer = DistilBertTokenizer.from_pretrained(model_path)
+        logger.info(f"ONNX Runtime session loaded from {onnx_path}")
+
+        return cls(session, tokenizer)
+
+    def score_encoded(self, input_ids: List[List[int]], pad_to: Optional[int] = None) -> List[float]:
+        """Score a padded batch of token ids; returns scores on a 0-100 scale"""
+        inputs = self._pad(input_ids, pad_to, return_tensors='np')
+        feed = {k: v.astype("int64") for k, v in inputs.items() if k in self.input_names}
+
+        logits = self.session.run(["logits"], feed)[0].reshape(-1).tolist()
+
+        return [max(0, min(100, logit * 100)) for logit in logits]  # Clamp to 0-100
+
+
+def load_holdout_texts(csv_path: str = QUANT_REPORT_DATASET, num_samples: int = QUANT_REPORT_SAMPLES):
+    """
+    Validation rows of the training data, split exactly like train_model.py
+    (test_size=0.2, random_state=42) so they were never trained on.
+    """
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    df = pd.read_csv(csv_path)
+    texts = [combine_texts(r, j) for r, j in zip(df['resume_text'], df['job_description'])]
+    labels = df['match_score'].values
+
+    _, val_texts, _, val_labels = train_test_split(texts, labels, test_size=0.2, random_state=42)
+    return val_texts[:num_samples], [float(label) for label in val_labels[:num_samples]]
+
+
+def _timed_scores(scorer: BaseScorer, texts: List[str], batch_size: int = 8):
+    started = time.perf_counter()
+    scores = []
+    for start in range(0, len(texts), batch_size):
+        scores.extend(scorer.score_texts(texts[start:start + batch_size]))
+    return scores, (time.perf_counter() - started) * 1000 / max(1, len(texts))
+
+
+def compare_backends(reference: BaseScorer, candidate: BaseScorer,
+                     texts: List[str], labels: Optional[List[float]] = None) -> Dict[str, Any]:
+    """Per-sample latency and score drift (0-100 points) of candidate vs reference"""
+    ref_scores, ref_ms = _timed_scores(reference, texts)
+    cand_scores, cand_ms = _timed_scores(candidate, texts)
+
+    drift = [abs(a - b) for a, b in zip(ref_scores, cand_scores)]
+    report = {
+        "samples": len(texts),
+        f"{reference.backend}_ms_per_sample": round(ref_ms, 2),
+        f"{candidate.backend}_ms_per_sample": round(cand_ms, 2),
+        "speedup": round(ref_ms / cand_ms, 2) if cand_ms else None,
+        "mean_abs_drift": round(sum(drift) / len(drift), 3) if drift else 0.0,
+        "max_abs_drift": round(max(drift), 3) if drift else 0.0,
+    }
+    if labels:
+        report[f"{reference.backend}_mae"] = round(sum(abs(s - l) for s, l in zip(ref_scores, labels)) / len(labels), 3)
+        report[f"{candidate.backend}_mae"] = round(sum(abs(s - l) for s, l in zip(cand_scores, labels)) / len(labels), 3)
+
+    return report
+
+
+def load_scorer(backend: str = SCORER_BACKEND, model_path: str = MODEL_PATH) -> BaseScorer:
+    """Load the configured backend; INT8 also logs a latency/drift report against fp32"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown SCORER_BACKEND '{backend}', expected one of {BACKENDS}")
+
+    if backend == "onnx":
+        return OnnxScorer.load(model_path)
+
+    scorer = TorchScorer.load(model_path)
+    if backend == "torch":
+        return scorer
+
+    int8_scorer = scorer.quantized()
+
+    if QUANT_REPORT_SAMPLES > 0:
+        try:
+            texts, labels = load_holdout_texts()
+            report = compare_backends(scorer, int8_scorer, texts, labels)
+            logger.info(f"INT8 quantization report: {report}")
+        except Exception as e:
+            logger.warning(f"Could not build INT8 quantization report: {str(e)}")
+
+    # Release the fp32 weights
+    del scorer
+    return int8_scorer
@@ -0,0 +1,226 @@
+"""
+Answer Sentiment Backends
+Labels interview answers "positive", "negative" or "neutral" for tone feedback.
+
+Backends (selected with SENTIMENT_BACKEND):
+- "transformer":      Hugging Face sentiment pipeline over SENTIMENT_MODEL (default)
+- "transformer-int8": same model with Linear layers dynamically quantized to INT8 (CPU only)
+- "lexicon":          word-list scorer with negation handling; no model, microseconds per answer
+- "none":             no sentiment analysis, every answer is "neutral"
+
+Nothing is loaded at import time: the backend is built on the first call to
+get_analyzer() (or detect_sentiment/detect_sentiments), so processes that import
+interview_evaluator without evaluating answers never load a second transformer.
+If the backend fails to load, every answer is "neutral" and the load is not retried.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "transformer")
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+
+BACKENDS = ("transformer", "transformer-int8", "lexicon", "none")
+
+# Answers are cut to this many characters before the transformer sees them
+MAX_ANSWER_CHARS = 512
+
+NEUTRAL = "neutral"
+
+
+class TransformerSentiment:
+    """Hugging Face text-classification pipeline, fp32 or dynamically quantized INT8"""
+
+    def __init__(self, pipe, backend: str = "transformer"):
+        self.pipe = pipe
+        self.backend = backend
+
+    @classmethod
+    def load(cls, model_name: str = SENTIMENT_MODEL, quantize: bool = False) -> "TransformerSentiment":
+        from transformers import pipeline
+
+        try:
+            import torch
+        except ImportError:  # torch-free serving image (SCORER_BACKEND=onnx)
+            torch = None
+
+        if quantize:
+            if torch is None:
+                raise RuntimeError("SENTIMENT_BACKEND=transformer-int8 requires torch")
+            pipe = pipeline("sentiment-analysis", model=model_name, device=-1)
+            pipe.model = torch.ao.quantization.quantize_dynamic(
+                pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            pipe.model.eval()
+            return cls(pipe, backend="transformer-int8")
+
+        pipe = pipeline(
+            "sentiment-analysis",
+            model=model_name,
+            device=0 if torch is not None and torch.cuda.is_available() else -1
+        )
+        return cls(pipe)
+
+    def label(self, text: str) -> str:
+        return self.pipe(text[:MAX_ANSWER_CHARS])[0]['label'].lower()
+
+    def labels(self, texts: List[str], batch_size: int = 16) -> List[str]:
+        results = self.pipe([text[:MAX_ANSWER_CHARS] for text in texts], batch_size=batch_size)
+        return [result['label'].lower() for result in results]
+
+
+# Tone words for interview answers: confident/outcome language vs hedging/failure language
+POSITIVE_WORDS = frozenset("""
+    accomplished achieve achieved achievement achievements advanced appreciated awarded
+    benefit benefited best better boost boosted brilliant capable clear collaborative
+    confident creative delighted delivered dependable eager effective efficient
+    enjoy enjoyed enjoying enthusiastic excel excellent excelled excited exciting exceeded
+    fantastic faster gained glad good great grew growth happy helpful ideal impressive
+    improve improved improvement improvements increased innovative inspired interesting
+    launched led love loved mentored motivated passion passionate pleased positive proud
+    praised productive proficient progress promoted recognized reliable resolved robust
+    saved simplified skilled smooth solved stable strong succeed succeeded success
+    successful successfully thrive thrived valuable well win won wonderful
+""".split())
+
+NEGATIVE_WORDS = frozenset("""
+    angry annoyed annoying anxious awful bad blame blamed boring broke broken bug buggy
+    chaotic complain complained confused confusing conflict crash crashed delay delayed
+    difficult disappointed disappointing dislike failed failing fails failure fault
+    frustrated frustrating hard hate hated horrible issue lack lacked late lost mess
+    messy mistake mistakes negative nervous outage poor poorly problem problems quit
+    regret rejected slow struggle struggled struggling stuck stress stressed stressful
+    terrible toxic trouble unclear unfortunately unhappy unreliable unstable upset
+    weak worried worse worst wrong
+""".split())
+
+NEGATIONS = frozenset("""
+    not no never none nothing neither nor without hardly barely cannot cant dont
+    doesnt didnt isnt wasnt werent wont wouldnt couldnt shouldnt havent hasnt hadnt
+""".split())
+
+# A negation flips the polarity of the next few words ("not very successful")
+NEGATION_WINDOW = 3
+
+_CLAUSE_BREAKS = frozenset(".,;:!?")
+
+
+class LexiconSentiment:
+    """
+    Word-list scorer: +1 per positive word, -1 per negative word, flipped within
+    NEGATION_WINDOW words after a negation. Ties (including no tone words) are "neutral".
+    """
+
+    backend = "lexicon"
+
+    _token_re = re.compile(r"[a-z]+(?:'[a-z]+)?|[.,;:!?]")
+
+    def score(self, text: str) -> int:
+        total = 0
+        negated = 0
+        for token in self._token_re.findall(text.lower()):
+            if token in _CLAUSE_BREAKS:
+                negated = 0
+                continue
+
+            word = token.replace("'", "")
+            if word in NEGATIONS or token.endswith("n't"):
+                negated = NEGATION_WINDOW
+                continue
+
+            polarity = (word in POSITIVE_WORDS) - (word in NEGATIVE_WORDS)
+            total += -polarity if negated else polarity
+            if negated:
+                negated -= 1
+        return total
+
+    def label(self, text: str) -> str:
+        score = self.score(text)
+        if score > 0:
+            return "positive"
+        if score < 0:
+            return "negative"
+        return NEUTRAL
+
+    def labels(self, texts: List[str], batch_size: int = 16) -> List[str]:
+        return [self.label(text) for text in texts]
+
+
+_analyzer = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def load_analyzer(backend: str = SENTIMENT_BACKEND, model_name: str = SENTIMENT_MODEL):
+    """Build a backend now; None for "none" """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown SENTIMENT_BACKEND '{backend}', expected one of {BACKENDS}")
+
+    if backend == "none":
+        return None
+    if backend == "lexicon":
+        return LexiconSentiment()
+    return TransformerSentiment.load(model_name, quantize=backend == "transformer-int8")
+
+
+def get_analyzer():
+    """The configured backend, loaded on first use (None if disabled or it failed to load)"""
+    global _analyzer, _loaded
+
+    if _loaded:
+        return _analyzer
+
+    with _lock:
+        if not _loaded:
+            try:
+                _analyzer = load_analyzer()
+                if _analyzer is not None:
+                    logger.info(f"Sentiment backend loaded: {_analyzer.backend}")
+            except Exception as e:
+                logger.warning(f"Could not load sentiment analyzer ({SENTIMENT_BACKEND}): {str(e)}")
+                _analyzer = None
+            _loaded = True
+
+    return _analyzer
+
+
+def set_analyzer(analyzer) -> None:
+    """Swap the active backend (or None to disable sentiment analysis)"""
+    global _analyzer, _loaded
+
+    with _lock:
+        _analyzer = analyzer
+        _loaded = True
+
+
+def detect_sentiment(text: str, analyzer=None) -> str:
+    """Sentiment label of one text ("neutral" if no backend is available or it fails)"""
+    analyzer = analyzer or get_analyzer()
+    if analyzer is None:
+        return NEUTRAL
+
+    try:
+        return analyzer.label(text)
+    except Exception:
+        return NEUTRAL
+
+
+def detect_sentiments(texts: List[str], batch_size: int = 16, analyzer=None) -> List[str]:
+    """
+    Sentiment label of each text from one batched backend call, falling back
+    to one call per text so one bad input only affects itself.
+    """
+    analyzer = analyzer or (get_analyzer() if texts else None)
+    if analyzer is None:
+        return [NEUTRAL] * len(texts)
+
+    try:
+        return analyzer.labels(texts, batch_size=batch_size)
+    except Exception:
+        return [detect_sentiment(text, analyzer) for text in texts]
+
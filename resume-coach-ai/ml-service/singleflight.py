@@ -0,0 +1,58 @@
+"""
+Request Coalescing Module
+Concurrent identical requests share one in-flight computation ("single-flight").
+The first caller for a key starts the work; callers arriving while it runs await
+the same result (or exception) instead of repeating it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from metrics import registry
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of in-flight coroutines on one event loop.
+
+    The work runs in its own task, so a caller that is cancelled does not cancel
+    the computation the other callers are waiting on. The key is released as soon
+    as the work finishes; later calls start a fresh computation.
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.leaders = registry.counter(f"{name}_leaders", "Computations started")
+        self.duplicates = registry.counter(
+            f"{name}_duplicates", "Requests that joined an identical in-flight computation"
+        )
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], label: Optional[str] = None) -> Any:
+        """Run fn() for key, or join the run already in progress"""
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._release(key, task))
+            self.leaders.inc()
+        else:
+            self.duplicates.inc()
+            if label:
+                registry.counter(
+                    f"{self.name}_{label}_duplicates", f"Coalesced duplicate {label} requests"
+                ).inc()
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
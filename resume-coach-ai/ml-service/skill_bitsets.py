@@ -0,0 +1,152 @@
+"""
+Skill Bitsets Module
+Skills as integer IDs and documents as packed bitsets (one bit per skill, 64
+skills per uint64 word). Skill overlap between one resume and N jobs is a single
+vectorized AND + popcount over the N-row job matrix instead of N Python set
+intersections. IDs are positions in skill_index.skills, the same IDs that
+ingest_jobs.py stores.
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from skills import skill_index, scan_skills
+
+WORD_BITS = 64
+
+# Set bits per byte, for NumPy versions without np.bitwise_count (< 2.0)
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def popcount(bitsets: np.ndarray) -> np.ndarray:
+    """Number of set bits in each bitset (reduces the last axis)"""
+    bitsets = np.ascontiguousarray(bitsets, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bitsets).sum(axis=-1, dtype=np.int64)
+    return _BYTE_POPCOUNT[bitsets.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+class SkillBitsets:
+    """Encoder between skill names/IDs and packed bitsets over a fixed vocabulary"""
+
+    def __init__(self, vocabulary: Sequence[str]):
+        self.vocabulary: List[str] = list(vocabulary)
+        self.ids = {name: idx for idx, name in enumerate(self.vocabulary)}
+        self.words = max(1, -(-len(self.vocabulary) // WORD_BITS))
+
+    def encode_ids(self, ids: Iterable[int]) -> np.ndarray:
+        """One bitset (shape [words]) with the given skill IDs set"""
+        return self.encode_many([ids])[0]
+
+    def encode_names(self, names: Iterable[str]) -> np.ndarray:
+        """One bitset from skill names; names outside the vocabulary are ignored"""
+        return self.encode_ids(self.ids[name] for name in names if name in self.ids)
+
+    def encode_many(self, rows: Iterable[Iterable[int]]) -> np.ndarray:
+        """Bitset matrix (shape [n, words]), one row per iterable of skill IDs"""
+        rows = [np.fromiter(ids, dtype=np.int64) for ids in rows]
+        matrix = np.zeros((len(rows), self.words), dtype=np.uint64)
+        if rows:
+            lengths = np.array([len(ids) for ids in rows])
+            if lengths.sum():
+                flat = np.concatenate(rows)
+                self._set_bits(matrix, np.repeat(np.arange(len(rows)), lengths), flat)
+        return matrix
+
+    def encode_csr(self, offsets: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Bitset matrix from CSR skill lists (e.g. skill_offsets/skill_ids of an ingest_jobs store)"""
+        offsets = np.asarray(offsets, dtype=np.int64)
+        matrix = np.zeros((len(offsets) - 1, self.words), dtype=np.uint64)
+        if len(ids):
+            self._set_bits(matrix, np.repeat(np.arange(len(offsets) - 1), np.diff(offsets)), ids)
+        return matrix
+
+    @staticmethod
+    def _set_bits(matrix: np.ndarray, rows: np.ndarray, ids: np.ndarray) -> None:
+        ids = np.asarray(ids, dtype=np.uint64)
+        np.bitwise_or.at(
+            matrix,
+            (rows, (ids // WORD_BITS).astype(np.int64)),
+            np.left_shift(np.uint64(1), ids % np.uint64(WORD_BITS))
+        )
+
+    def to_mask(self, bitsets: np.ndarray) -> np.ndarray:
+        """Boolean membership (shape [..., len(vocabulary)]) of packed bitsets"""
+        bitsets = np.ascontiguousarray(bitsets, dtype=np.uint64)
+        # Little-endian bytes, least significant bit first: bit i of the row is skill ID i
+        as_bytes = bitsets.astype("<u8").view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=-1, bitorder="little")
+        return bits[..., :len(self.vocabulary)].astype(bool)
+
+    def decode(self, bitset: np.ndarray) -> List[str]:
+        """Skill names set in one bitset, in ID order"""
+        return [self.vocabulary[idx] for idx in np.flatnonzero(self.to_mask(bitset))]
+
+    def overlap(self, query: np.ndarray, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shared skills of one bitset against every row of a matrix, in one call.
+
+        Returns:
+            (counts, ratios): skills in common per row, and that count divided by
+            the row's own skill count (0 for rows without skills)
+        """
+        matrix = np.atleast_2d(matrix)
+        counts = popcount(matrix & query)
+        totals = popcount(matrix)
+        ratios = np.divide(counts, totals, out=np.zeros(len(counts)), where=totals > 0)
+        return counts, ratios
+
+    def overlap_pairs(self, queries: np.ndarray, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shared skills of each row of queries with the same row of matrix (row i
+        against row i only), in one call. Returns (counts, ratios) as overlap() does.
+        """
+        matrix = np.atleast_2d(matrix)
+        counts = popcount(matrix & np.atleast_2d(queries))
+        totals = popcount(matrix)
+        ratios = np.divide(counts, totals, out=np.zeros(len(counts)), where=totals > 0)
+        return counts, ratios
+
+
+# Bitsets over every skill in skills_database.json (IDs = skill_index.skill_id)
+skill_bitsets = SkillBitsets(skill_index.skills)
+
+
+def _skill_ids(text: str) -> List[int]:
+    """IDs of the canonical skills mentioned in text (aliases resolved)"""
+    return [skill_bitsets.ids[skill] for skill in scan_skills(text).canonical]
+
+
+def encode_text(text: str) -> np.ndarray:
+    """Bitset of the canonical skills mentioned in text"""
+    return skill_bitsets.encode_ids(_skill_ids(text))
+
+
+def encode_texts(texts: Iterable[str]) -> np.ndarray:
+    """Bitset matrix, one row per text"""
+    return skill_bitsets.encode_many(_skill_ids(text) for text in texts)
+
+
+def skill_overlap(resume_text: str, job_texts: Sequence[str], job_matrix: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Skill overlap counts and ratios (shared / job skills) of one resume against
+    many jobs. Pass job_matrix to reuse already encoded jobs.
+    """
+    if job_matrix is None:
+        job_matrix = encode_texts(job_texts)
+    return skill_bitsets.overlap(encode_text(resume_text), job_matrix)
+
+
+def common_skills_many(first: str, others: Sequence[str]) -> List[List[str]]:
+    """
+    Canonical skills of `first` also mentioned in each of `others`, in order of
+    first mention in that text (the batch form of skills.common_skills)
+    """
+    scans = [scan_skills(text).canonical for text in others]
+    matrix = skill_bitsets.encode_many([skill_bitsets.ids[skill] for skill in canonical] for canonical in scans)
+    shared = skill_bitsets.to_mask(matrix & encode_text(first))
+    return [
+        [skill for skill in canonical if shared[row, skill_bitsets.ids[skill]]]
+        for row, canonical in enumerate(scans)
+    ]
@@ -0,0 +1,126 @@
+"""
+Skill Matcher Module
+Precompiled multi-pattern matcher (Aho-Corasick automaton) for skill names.
+Built once from a list of skills, it finds every skill in a text in a single
+pass, with the same case-insensitive, word-boundary semantics as
+re.search(r'\b' + re.escape(skill) + r'\b', text.lower()).
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+class SkillMatch(NamedTuple):
+    """One occurrence of a skill; start/end are character offsets into the original text"""
+    skill: str
+    start: int
+    end: int
+
+
+def _is_word(ch: str) -> bool:
+    """Same definition of a word character as the re module's \\w for str patterns"""
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over lowercased skill names.
+
+    `skills` keeps its order: find_skills() returns unique skills in that order,
+    so callers that relied on iterating a list of skills get the same results.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: List[str] = list(dict.fromkeys(skills))
+        self._index: Dict[str, int] = {skill: idx for idx, skill in enumerate(self.skills)}
+
+        # State 0 is the root; goto[state] maps a character to the next state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Outputs per state: (skill index, pattern length, starts with word char, ends with word char)
+        self._out: List[List[Tuple[int, int, bool, bool]]] = [[]]
+
+        for idx, skill in enumerate(self.skills):
+            pattern = skill.lower()
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((idx, len(pattern), _is_word(pattern[0]), _is_word(pattern[-1])))
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first: each state falls back to the longest proper suffix that is also a prefix"""
+        queue = deque(self._goto[0].values())  # depth-1 states fail to the root
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                # Inherit the outputs of the suffix state so every match is reported
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _lower(self, text: str) -> Tuple[str, List[int]]:
+        """
+        Lowercase text for matching. When lowercasing changes the length (a few
+        Unicode characters expand), also return a map from lowered to original offsets.
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered, []
+
+        pieces, offsets = [], []
+        for pos, ch in enumerate(text):
+            low = ch.lower()
+            pieces.append(low)
+            offsets.extend([pos] * len(low))
+        offsets.append(len(text))
+        return "".join(pieces), offsets
+
+    def iter_matches(self, text: str):
+        """Yield SkillMatch for every word-bounded occurrence, in order of end offset"""
+        lowered, offsets = self._lower(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        length = len(lowered)
+        state = 0
+
+        for pos, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+
+            end = pos + 1
+            after_is_word = end < length and _is_word(lowered[end])
+            for idx, size, first_word, last_word in out[state]:
+                start = end - size
+                before_is_word = start > 0 and _is_word(lowered[start - 1])
+                # \b on both sides: word-ness must change across each edge
+                if before_is_word == first_word or after_is_word == last_word:
+                    continue
+                if offsets:
+                    yield SkillMatch(self.skills[idx], offsets[start], offsets[end])
+                else:
+                    yield SkillMatch(self.skills[idx], start, end)
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """Every occurrence of every skill, with offsets"""
+        return list(self.iter_matches(text))
+
+    def find_skills(self, text: str) -> List[str]:
+        """Unique skills present in text, in the order they were given to the matcher"""
+        found = {self._index[match.skill] for match in self.iter_matches(text)}
+        return [self.skills[idx] for idx in sorted(found)]
@@ -0,0 +1,161 @@
+"""
+Skills Engine Module
+Single source of truth for skill detection across the service.
+Loads skills_database.json once into a compiled index (SkillMatcher) with
+aliases and categories; job parsing, keyword matching, interview question
+generation and training-data preparation all scan text through it.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from skill_matcher import SkillMatcher, SkillMatch
+
+SKILLS_DB_PATH = Path(__file__).parent / "skills_database.json"
+
+# Scans are memoized per text so every consumer of the same request text shares one pass
+SKILL_SCAN_CACHE_SIZE = int(os.getenv("SKILL_SCAN_CACHE_SIZE", "2048"))
+
+# Alternative spellings -> canonical skill. Keys that are also database entries
+# stay detectable under their own name but compare equal to the canonical one.
+SKILL_ALIASES: Dict[str, str] = {
+    "Golang": "Go",
+    "K8s": "Kubernetes",
+    "Vue.js": "Vue",
+    "Express.js": "Express",
+    "Node": "Node.js",
+    "NodeJS": "Node.js",
+    "ReactJS": "React",
+    "React.js": "React",
+    "AngularJS": "Angular",
+    "Postgres": "PostgreSQL",
+    "Mongo": "MongoDB",
+    "sklearn": "Scikit-learn",
+    "Amazon Web Services": "AWS",
+    "Microsoft Azure": "Azure",
+    "Google Cloud Platform": "GCP",
+    "Google Cloud": "GCP",
+    "Microsoft SQL Server": "SQL Server",
+    "MSSQL": "SQL Server",
+    "Subversion": "SVN",
+    "HTML5": "HTML",
+    "CSS3": "CSS",
+    "Tailwind": "Tailwind CSS",
+    "RESTful Services": "REST API",
+    "REST APIs": "REST API",
+    "RESTful API": "REST API",
+    "Artificial Intelligence": "AI",
+    "Natural Language Processing": "NLP",
+    "ML": "Machine Learning",
+    "Augmented Reality": "AR",
+    "Virtual Reality": "VR",
+    "Test-Driven Development": "TDD",
+    "Behavior-Driven Development": "BDD",
+    "Object-Oriented Programming": "OOP",
+    "Domain-Driven Design": "DDD",
+    "Site Reliability Engineering": "SRE",
+    "Extreme Programming": "XP",
+}
+
+# Categories that are not technologies (used to pick topics for technical questions)
+NON_TECHNICAL_CATEGORIES = {"soft_skills", "methodologies", "project_management", "certifications"}
+
+
+class SkillScan(NamedTuple):
+    """Result of scanning one text; immutable so cached scans can be shared"""
+    skills: Tuple[str, ...]       # database entries found, in index order
+    canonical: Tuple[str, ...]    # canonical skills, in order of first mention
+    mentions: Tuple[SkillMatch, ...]  # every occurrence by start offset (surface form as skill)
+
+
+class SkillIndex:
+    """Compiled skill index: matcher, alias resolution and categories"""
+
+    def __init__(self, skills_data: Dict[str, List[str]], aliases: Optional[Dict[str, str]] = None):
+        aliases = aliases or {}
+
+        self.categories: Dict[str, Tuple[str, ...]] = {}
+        for category, skills_list in skills_data.items():
+            for skill in skills_list:
+                self.categories[skill] = self.categories.get(skill, ()) + (category,)
+
+        # Longest first, matching the original job_parser.SKILLS_DB ordering
+        self.skills: List[str] = sorted(self.categories, key=lambda x: len(x), reverse=True)
+
+        known = {skill.lower(): skill for skill in self.skills}
+        self._canonical: Dict[str, str] = {skill: skill for skill in self.skills}
+        # Surface form -> database entry reported by scan().skills
+        self._entry: Dict[str, str] = {skill: skill for skill in self.skills}
+
+        extra = []
+        for alias, target in aliases.items():
+            target = known.get(target.lower())
+            if target is None:
+                continue
+            entry = known.get(alias.lower())
+            if entry is not None:
+                self._canonical[entry] = target
+            else:
+                extra.append(alias)
+                self._canonical[alias] = target
+                self._entry[alias] = target
+
+        self.matcher = SkillMatcher(self.skills + extra)
+        self._order = {skill: idx for idx, skill in enumerate(self.skills)}
+        self.scan = lru_cache(maxsize=SKILL_SCAN_CACHE_SIZE)(self._scan)
+
+    @classmethod
+    def load(cls, path: Path = SKILLS_DB_PATH) -> "SkillIndex":
+        with open(path, "r") as f:
+            skills_data = json.load(f)
+        return cls(skills_data, SKILL_ALIASES)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical name of a database entry or alias (unknown names are returned as-is)"""
+        return self._canonical.get(skill, skill)
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """Integer ID of a database entry or alias (its position in .skills), or None if not indexed"""
+        return self._order.get(self._entry.get(skill, skill))
+
+    def category(self, skill: str) -> Optional[str]:
+        """First category of a skill or alias, or None if it is not indexed"""
+        categories = self.categories.get(self.canonical(skill)) or self.categories.get(skill)
+        return categories[0] if categories else None
+
+    def is_technical(self, skill: str) -> bool:
+        categories = self.categories.get(self.canonical(skill)) or self.categories.get(skill) or ()
+        return any(category not in NON_TECHNICAL_CATEGORIES for category in categories)
+
+    def _scan(self, text: str) -> SkillScan:
+        mentions = tuple(sorted(self.matcher.iter_matches(text), key=lambda m: m.start))
+
+        entries: Set[str] = set()
+        canonical: Dict[str, None] = {}
+        for mention in mentions:
+            entries.add(self._entry[mention.skill])
+            canonical.setdefault(self._canonical[mention.skill], None)
+
+        return SkillScan(
+            skills=tuple(sorted(entries, key=self._order.__getitem__)),
+            canonical=tuple(canonical),
+            mentions=mentions
+        )
+
+
+# Process-wide index, built on import
+skill_index = SkillIndex.load()
+
+
+def scan_skills(text: str) -> SkillScan:
+    """Scan text once (memoized) for every indexed skill"""
+    return skill_index.scan(text)
+
+
+def common_skills(first: str, second: str) -> List[str]:
+    """Canonical skills mentioned in both texts, in order of first mention in `second`"""
+    mine = set(scan_skills(first).canonical)
+    return [skill for skill in scan_skills(second).canonical if skill in mine]
@@ -9,6 +9,7 @@ import numpy as np
 from transformers import (
     DistilBertTokenizer,
     DistilBertForSequenceClassification,
+    DataCollatorWithPadding,
     Trainer,
     TrainingArguments
 )
@@ -80,13 +81,15 @@ def load_and_prepare_data(csv_path='data/training_dataset.csv'):
     return train_texts, val_texts, train_labels, val_labels
 
 def tokenize_data(tokenizer, texts):
-    """Tokenize text data"""
+    """
+    Tokenize text data without padding.
+    Batches are padded at collation time to their own longest example
+    (see DataCollatorWithPadding below) instead of the longest in the dataset.
+    """
     return tokenizer(
         texts,
-        padding=True,
         truncation=True,
-        max_length=512,
-        return_tensors='pt'
+        max_length=512
     )
 
 def compute_metrics(pred):
@@ -161,6 +164,7 @@ def main():
         fp16=torch.cuda.is_available(),  # Use mixed precision if GPU available
         learning_rate=1e-5,
         save_total_limit=3,
+        group_by_length=True,  # Batch similar lengths together to minimise padding
     )
     
     # Initialize Trainer
@@ -171,6 +175,7 @@ def main():
         train_dataset=train_dataset,
         eval_dataset=val_dataset,
         compute_metrics=compute_metrics,
+        data_collator=DataCollatorWithPadding(tokenizer),
     )
     
     # Train